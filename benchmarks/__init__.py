@@ -0,0 +1,8 @@
+"""
+Benchmarks of RDFLib, which record the throughput and peak memory of parsing,
+serializing, storing, querying and comparing generated data, and compare them
+with the results of an earlier run.
+
+Run them from the root of the repository with `python -m benchmarks`, see
+`benchmarks/README.md`.
+"""
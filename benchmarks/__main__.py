@@ -0,0 +1,200 @@
+"""
+Run the benchmarks, record their throughput and peak memory as JSON and
+compare them with the results of an earlier run.
+
+```bash
+python -m benchmarks --output benchmarks/baseline.json
+# ... change RDFLib ...
+python -m benchmarks --baseline benchmarks/baseline.json
+```
+
+The exit status is 1 when a benchmark is slower, or uses more memory, than
+in the baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any
+
+import rdflib
+
+from .cases import Benchmark, benchmarks
+
+logger = logging.getLogger(__name__)
+
+
+# times shorter than this are mostly noise, and are not compared
+_MIN_SECONDS = 0.001
+
+
+def measure(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """The best and median time of some runs of the benchmark, and the peak
+    memory allocated by another run"""
+    times = []
+    for _ in range(repeat):
+        value = benchmark.setup()
+        gc.collect()
+        start = time.perf_counter()
+        benchmark.run(value)
+        times.append(time.perf_counter() - start)
+        del value
+
+    value = benchmark.setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        benchmark.run(value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+
+    seconds = min(times)
+    return {
+        "items": benchmark.items,
+        "seconds": seconds,
+        "median_seconds": statistics.median(times),
+        "items_per_second": benchmark.items / seconds if seconds else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run(products: int, repeat: int, select: list[str]) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for benchmark in benchmarks(products):
+        if benchmark.explicit:
+            if benchmark.name not in select:
+                continue
+        elif select and not any(s in benchmark.name for s in select):
+            continue
+        try:
+            result = measure(benchmark, repeat)
+        except Exception as e:
+            logger.warning("%s failed: %r", benchmark.name, e)
+            results[benchmark.name] = {"error": repr(e)}
+            continue
+        results[benchmark.name] = result
+        print(
+            "%-24s %12.1f items/s %10.4f s %10.1f MiB"
+            % (
+                benchmark.name,
+                result["items_per_second"] or 0,
+                result["seconds"],
+                result["peak_memory_bytes"] / 2**20,
+            ),
+            file=sys.stderr,
+        )
+    return {
+        "metadata": {
+            "rdflib": rdflib.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "products": products,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """The regressions of the current results from the baseline, as
+    messages"""
+    regressions = []
+    if current["metadata"]["products"] != baseline["metadata"]["products"]:
+        logger.warning(
+            "The baseline is of %s products, the results of %s",
+            baseline["metadata"]["products"],
+            current["metadata"]["products"],
+        )
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or "error" in base:
+            continue
+        if "error" in result:
+            regressions.append("%s: failed, %s" % (name, result["error"]))
+            continue
+        speed = None
+        if min(result["seconds"], base["seconds"]) >= _MIN_SECONDS:
+            speed = result["seconds"] / base["seconds"]
+        memory = result["peak_memory_bytes"] / max(base["peak_memory_bytes"], 1)
+        print(
+            "%-24s %8s time %7.2fx memory"
+            % (name, "-" if speed is None else "%.2fx" % speed, memory),
+            file=sys.stderr,
+        )
+        if speed is not None and speed > 1 + tolerance:
+            regressions.append("%s: %.2f times as slow" % (name, speed))
+        if memory > 1 + tolerance:
+            regressions.append("%s: %.2f times as much memory" % (name, memory))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument(
+        "--products",
+        type=int,
+        default=200,
+        help="The number of products of the generated data, each of about 50 statements (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of timed runs of each benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        dest="select",
+        action="append",
+        default=[],
+        help="Only run the benchmarks with a name containing this, can be repeated",
+    )
+    parser.add_argument("--output", help="The file to write the results to")
+    parser.add_argument("--baseline", help="The results to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The fraction by which a benchmark may be slower or use more memory than in the baseline (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    results = run(args.products, args.repeat, args.select)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            logger.error("%s", regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+"""
+The benchmarks: parsing and serializing each format of the parser and
+serializer plugins, adding to and looking up in the `Memory` store, SPARQL
+queries in the style of the BSBM explore and business intelligence use cases,
+comparing graphs with `compare.isomorphic`, and canonicalizing graphs of
+blank nodes.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from rdflib import BNode, Dataset, Graph, Literal, URIRef, plugin
+from rdflib.compare import canonical_nquads, isomorphic, to_canonical_graph
+from rdflib.parser import Parser
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.stores.memory import Memory
+from rdflib.serializer import Serializer
+
+from .data import BSBM, PRODUCTS, REV, Data, generate
+
+# the formats that keep the graphs of a dataset
+QUAD_FORMATS = {"nquads", "trig", "trix", "json-ld", "hext", "patch"}
+
+# the arguments that serializers need
+SERIALIZE_ARGS: dict[str, dict[str, Any]] = {"patch": {"operation": "add"}}
+
+
+@dataclass
+class Benchmark:
+    """A workload, `run` is timed with the value of `setup`, which is not.
+    An `explicit` one is too slow to run by default, and only runs when
+    its whole name is selected."""
+
+    name: str
+    items: int
+    run: Callable[[Any], object]
+    setup: Callable[[], Any] = lambda: None
+    explicit: bool = False
+
+
+def formats(kind: type[Parser] | type[Serializer]) -> list[str]:
+    """The name of each parser or serializer of RDFLib, without the media
+    type names"""
+    names: dict[tuple[str, str], str] = {}
+    for p in plugin.plugins(kind=kind):
+        if not p.module_path.startswith("rdflib.plugins.") or "/" in p.name:
+            continue
+        names.setdefault((p.module_path, p.class_name), p.name)
+    return sorted(names.values())
+
+
+def benchmarks(products: int) -> Iterator[Benchmark]:
+    data = generate(products)
+    yield from _parse(data)
+    yield from _serialize(data)
+    yield from _memory(data)
+    yield from _sparql(data)
+    yield from _isomorphic(data)
+    yield from _canonicalize(data)
+
+
+def _graph(data: Data, format: str) -> Graph:
+    if format in QUAD_FORMATS:
+        return data.dataset
+    # the statements of all the graphs
+    graph = Graph()
+    for prefix, namespace in data.dataset.namespaces():
+        graph.bind(prefix, namespace)
+    graph.addN((s, p, o, graph) for s, p, o, _ in data.dataset.quads())
+    return graph
+
+
+def _parse(data: Data) -> Iterator[Benchmark]:
+    sources: dict[str, str] = {}
+
+    def source(graph: Graph, format: str) -> str:
+        # serialized by the first setup, so a serializer that fails only
+        # fails its benchmark
+        if format not in sources:
+            sources[format] = graph.serialize(
+                format=format, **SERIALIZE_ARGS.get(format, {})
+            )
+        return sources[format]
+
+    for format in formats(Parser):
+        graph = _graph(data, format)
+        target = Dataset if format in QUAD_FORMATS else Graph
+        yield Benchmark(
+            "parse/%s" % format,
+            len(graph),
+            lambda source, format=format, target=target: target().parse(
+                data=source, format=format
+            ),
+            functools.partial(source, graph, format),
+        )
+
+
+def _serialize(data: Data) -> Iterator[Benchmark]:
+    for format in formats(Serializer):
+        graph = _graph(data, format)
+        yield Benchmark(
+            "serialize/%s" % format,
+            len(graph),
+            lambda _, graph=graph, format=format: graph.serialize(
+                format=format, **SERIALIZE_ARGS.get(format, {})
+            ),
+        )
+
+
+def _memory(data: Data) -> Iterator[Benchmark]:
+    quads = list(data.dataset.quads())
+    triples = [(s, p, o) for s, p, o, _ in quads]
+
+    def add(store: Memory) -> None:
+        for s, p, o, c in quads:
+            store.add((s, p, o), c)
+
+    yield Benchmark("memory/add", len(quads), add, Memory)
+    yield Benchmark("memory/addN", len(quads), lambda store: store.addN(quads), Memory)
+
+    store = Memory()
+    store.addN(quads)
+    subjects = list({s for s, _, _ in triples})
+    predicate_objects = list({(p, o) for _, p, o in triples})
+    objects = list({o for _, _, o in triples})
+
+    def lookup(patterns: list[tuple[Any, Any, Any]]) -> Callable[[Any], object]:
+        def run(_: Any) -> None:
+            for pattern in patterns:
+                for _ in store.triples(pattern, None):
+                    pass
+
+        return run
+
+    yield Benchmark("memory/lookup-spo", len(triples), lookup(triples))
+    yield Benchmark(
+        "memory/lookup-s",
+        len(subjects),
+        lookup([(s, None, None) for s in subjects]),
+    )
+    yield Benchmark(
+        "memory/lookup-po",
+        len(predicate_objects),
+        lookup([(None, p, o) for p, o in predicate_objects]),
+    )
+    yield Benchmark(
+        "memory/lookup-o",
+        len(objects),
+        lookup([(None, None, o) for o in objects]),
+    )
+
+
+_PREFIXES = """
+PREFIX bsbm: <%s>
+PREFIX rev: <%s>
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+PREFIX dc: <http://purl.org/dc/elements/1.1/>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+""" % (
+    BSBM,
+    REV,
+)
+
+QUERIES = {
+    # products of a type and its subtypes with a feature
+    "explore-1": """
+SELECT DISTINCT ?product ?label WHERE {
+    ?product rdfs:label ?label ;
+        rdf:type/rdfs:subClassOf* ?type ;
+        bsbm:productFeature ?feature ;
+        bsbm:productPropertyNumeric1 ?value1 .
+    FILTER (?value1 > 500)
+}
+ORDER BY ?label
+LIMIT 10
+""",
+    # the details of a product
+    "explore-2": """
+SELECT ?label ?comment ?producer ?feature ?text1 ?text3 ?number1 WHERE {
+    ?product rdfs:label ?label ;
+        rdfs:comment ?comment ;
+        bsbm:producer ?producer ;
+        bsbm:productFeature ?feature ;
+        bsbm:productPropertyTextual1 ?text1 ;
+        bsbm:productPropertyNumeric1 ?number1 .
+    OPTIONAL { ?product bsbm:productPropertyTextual3 ?text3 }
+}
+""",
+    # products with a feature and without another
+    "explore-3": """
+SELECT ?product ?label WHERE {
+    ?product rdfs:label ?label ;
+        bsbm:productFeature ?feature ;
+        bsbm:productPropertyNumeric1 ?p1 ;
+        bsbm:productPropertyNumeric3 ?p3 .
+    FILTER (?p1 > 100 && ?p3 < 1500)
+    FILTER NOT EXISTS { ?product bsbm:productFeature ?other }
+}
+ORDER BY ?label
+LIMIT 10
+""",
+    # products with either of two features
+    "explore-4": """
+SELECT DISTINCT ?product ?label ?propertyTextual WHERE {
+    {
+        ?product rdfs:label ?label ;
+            bsbm:productFeature ?feature ;
+            bsbm:productPropertyTextual1 ?propertyTextual ;
+            bsbm:productPropertyNumeric1 ?p1 .
+        FILTER (?p1 > 300)
+    } UNION {
+        ?product rdfs:label ?label ;
+            bsbm:productFeature ?other ;
+            bsbm:productPropertyTextual1 ?propertyTextual ;
+            bsbm:productPropertyNumeric2 ?p2 .
+        FILTER (?p2 > 300)
+    }
+}
+ORDER BY ?label
+OFFSET 5
+LIMIT 10
+""",
+    # products similar to a product
+    "explore-5": """
+SELECT DISTINCT ?similar ?label WHERE {
+    ?similar rdfs:label ?label .
+    FILTER (?product != ?similar)
+    ?product bsbm:productFeature ?feature .
+    ?similar bsbm:productFeature ?feature .
+    ?product bsbm:productPropertyNumeric1 ?o1 .
+    ?similar bsbm:productPropertyNumeric1 ?s1 .
+    FILTER (?s1 < (?o1 + 120) && ?s1 > (?o1 - 120))
+    ?product bsbm:productPropertyNumeric2 ?o2 .
+    ?similar bsbm:productPropertyNumeric2 ?s2 .
+    FILTER (?s2 < (?o2 + 170) && ?s2 > (?o2 - 170))
+}
+ORDER BY ?label
+LIMIT 5
+""",
+    # the offers and reviews of a product
+    "explore-7": """
+SELECT ?label ?offer ?price ?vendor ?vendorTitle ?review ?reviewer ?title
+    ?rating1 ?rating2 WHERE {
+    ?product rdfs:label ?label .
+    OPTIONAL {
+        ?offer bsbm:product ?product ;
+            bsbm:price ?price ;
+            bsbm:vendor ?vendor ;
+            bsbm:validTo ?date .
+        ?vendor rdfs:label ?vendorTitle ;
+            bsbm:country ?country .
+        FILTER (?date > "2008-06-20T00:00:00"^^xsd:dateTime)
+    }
+    OPTIONAL {
+        ?review bsbm:reviewFor ?product ;
+            rev:reviewer ?reviewer ;
+            dc:title ?title .
+        ?reviewer foaf:name ?name .
+        OPTIONAL { ?review bsbm:rating1 ?rating1 . }
+        OPTIONAL { ?review bsbm:rating2 ?rating2 . }
+    }
+}
+""",
+    # the recent english reviews of a product
+    "explore-8": """
+SELECT ?title ?text ?date ?reviewer ?name ?rating1 ?rating2 WHERE {
+    ?review bsbm:reviewFor ?product ;
+        dc:title ?title ;
+        rev:text ?text ;
+        bsbm:reviewDate ?date ;
+        rev:reviewer ?reviewer .
+    FILTER langMatches(lang(?text), "EN")
+    ?reviewer foaf:name ?name .
+    OPTIONAL { ?review bsbm:rating1 ?rating1 . }
+    OPTIONAL { ?review bsbm:rating2 ?rating2 . }
+}
+ORDER BY DESC(?date)
+LIMIT 20
+""",
+    # the cheap offers of a product with quick delivery from a country
+    "explore-10": """
+SELECT DISTINCT ?offer ?price WHERE {
+    ?offer bsbm:product ?product ;
+        bsbm:vendor ?vendor ;
+        bsbm:deliveryDays ?deliveryDays ;
+        bsbm:price ?price ;
+        bsbm:validTo ?date .
+    ?vendor bsbm:country ?country .
+    FILTER (?deliveryDays <= 10)
+    FILTER (?date > "2008-06-20T00:00:00"^^xsd:dateTime)
+}
+ORDER BY xsd:double(str(?price))
+LIMIT 10
+""",
+    # everything about an offer
+    "explore-11": """
+SELECT ?property ?hasValue ?isValueOf WHERE {
+    { ?offer ?property ?hasValue }
+    UNION
+    { ?isValueOf ?property ?offer }
+}
+""",
+    # the number of reviews of the products of the producers of each country
+    "bi-1": """
+SELECT ?country (COUNT(?review) AS ?reviews) WHERE {
+    ?review bsbm:reviewFor ?product .
+    ?product bsbm:producer ?producer .
+    ?producer bsbm:country ?country .
+}
+GROUP BY ?country
+ORDER BY DESC(?reviews)
+""",
+    # the average price and number of offers of each vendor
+    "bi-2": """
+SELECT ?vendor (AVG(?price) AS ?average) (COUNT(?offer) AS ?offers) WHERE {
+    ?offer bsbm:vendor ?vendor ;
+        bsbm:price ?price .
+}
+GROUP BY ?vendor
+HAVING (COUNT(?offer) > 1)
+ORDER BY DESC(?average)
+""",
+}
+
+
+def _sparql(data: Data) -> Iterator[Benchmark]:
+    rnd = random.Random(0)
+    dataset = Dataset(store=data.dataset.store, default_union=True)
+    product = rnd.choice(data.products)
+    feature, other = rnd.sample(data.features, 2)
+    bindings: dict[str, dict[str, Any]] = {
+        "explore-1": {
+            "type": rnd.choice(data.product_types[: len(data.product_types) // 4]),
+            "feature": feature,
+        },
+        "explore-2": {"product": product},
+        "explore-3": {"feature": feature, "other": other},
+        "explore-4": {"feature": feature, "other": other},
+        "explore-5": {"product": product},
+        "explore-7": {"product": product},
+        "explore-8": {"product": product},
+        "explore-10": {"product": product},
+        "explore-11": {"offer": rnd.choice(data.offers)},
+    }
+
+    queries = {name: _PREFIXES + query for name, query in QUERIES.items()}
+    yield Benchmark(
+        "sparql/parse",
+        len(queries),
+        lambda _: [prepareQuery(query) for query in queries.values()],
+    )
+    for name, query in queries.items():
+        prepared = prepareQuery(query)
+        yield Benchmark(
+            "sparql/%s" % name,
+            1,
+            lambda _, prepared=prepared, name=name: list(
+                dataset.query(prepared, initBindings=bindings.get(name, {}))
+            ),
+        )
+
+
+def _isomorphic(data: Data) -> Iterator[Benchmark]:
+    graph = data.dataset.graph(PRODUCTS)
+    # the same statements with other blank nodes, in another order
+    bnodes: dict[BNode, BNode] = {}
+    statements = [
+        tuple(
+            bnodes.setdefault(t, BNode()) if isinstance(t, BNode) else t for t in triple
+        )
+        for triple in graph
+    ]
+    random.Random(0).shuffle(statements)
+    same = Graph()
+    for triple in statements:
+        same.add(triple)  # type: ignore[arg-type]
+    different = Graph()
+    for triple in statements[1:]:
+        different.add(triple)  # type: ignore[arg-type]
+    s, p, _ = statements[0]
+    different.add((s, p, Literal("different")))
+
+    yield Benchmark("isomorphic/same", len(graph), lambda _: isomorphic(graph, same))
+    yield Benchmark(
+        "isomorphic/different", len(graph), lambda _: isomorphic(graph, different)
+    )
+
+
+def _canonicalize(data: Data) -> Iterator[Benchmark]:
+    graph = data.dataset.graph(PRODUCTS)
+    # the same statements with blank nodes for the products, producers and
+    # types, so most statements have one or two blank nodes
+    bnodes = {s: BNode() for s in graph.subjects() if isinstance(s, URIRef)}
+    blank = Graph()
+    blank += (tuple(bnodes.get(t, t) for t in triple) for triple in graph)  # type: ignore[misc]
+
+    yield Benchmark(
+        "canonicalize/rdfc10", len(blank), lambda _: canonical_nquads(blank)
+    )
+    # the earlier canonicalization, for comparison, takes many times as long
+    yield Benchmark(
+        "canonicalize/rgda1",
+        len(blank),
+        lambda _: to_canonical_graph(blank),
+        explicit=True,
+    )
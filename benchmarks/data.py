@@ -0,0 +1,202 @@
+"""
+Generated data in the style of the Berlin SPARQL Benchmark (BSBM): products
+of a hierarchy of product types, with features, producers, offers of vendors
+and reviews of reviewers.
+
+The data is made with a random generator of a fixed seed, so the same scale
+always gives the same data. The products are in one graph, and the offers and
+reviews are in a graph of each vendor and rating site.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from rdflib import RDF, RDFS, XSD, BNode, Dataset, Literal, Namespace, URIRef
+from rdflib.namespace import DC, FOAF
+
+BSBM = Namespace("http://www4.wiwiss.fu-berlin.de/bizer/bsbm/v01/vocabulary/")
+INST = Namespace("http://www4.wiwiss.fu-berlin.de/bizer/bsbm/v01/instances/")
+REV = Namespace("http://purl.org/stuff/rev#")
+COUNTRY = Namespace("http://downlode.org/rdf/iso-3166/countries#")
+
+PRODUCTS = URIRef(INST["Products"])
+
+_WORDS = (
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima"
+    " mike november oscar papa quebec romeo sierra tango uniform victor"
+    " whiskey xray yankee zulu"
+).split()
+
+_COUNTRIES = ("US", "GB", "DE", "FR", "JP", "CN", "RU", "ES", "AT", "KR")
+
+
+@dataclass
+class Data:
+    """The generated dataset, with the terms queries are made about"""
+
+    dataset: Dataset
+    product_types: list[URIRef] = field(default_factory=list)
+    features: list[URIRef] = field(default_factory=list)
+    products: list[URIRef] = field(default_factory=list)
+    offers: list[URIRef] = field(default_factory=list)
+    reviews: list[URIRef] = field(default_factory=list)
+
+
+def _text(rnd: random.Random, words: int) -> str:
+    return " ".join(rnd.choice(_WORDS) for _ in range(words))
+
+
+def generate(products: int, seed: int = 0) -> Data:
+    """The data of a number of products, about 50 statements each."""
+    rnd = random.Random(seed)
+    dataset = Dataset()
+    data = Data(dataset)
+    g = dataset.graph(PRODUCTS)
+
+    # a hierarchy of product types, three levels deep
+    root = INST["ProductType1"]
+    g.add((root, RDF.type, BSBM.ProductType))
+    g.add((root, RDFS.label, Literal("Thing")))
+    parents = [root]
+    for _ in range(3):
+        children = []
+        for parent in parents:
+            for _ in range(max(2, products // 200)):
+                child = INST["ProductType%d" % (len(data.product_types) + 2)]
+                data.product_types.append(child)
+                children.append(child)
+                g.add((child, RDF.type, BSBM.ProductType))
+                g.add((child, RDFS.label, Literal(_text(rnd, 2))))
+                g.add((child, RDFS.subClassOf, parent))
+        parents = children
+    leaves = parents
+
+    for i in range(max(10, products // 10)):
+        feature = INST["ProductFeature%d" % i]
+        data.features.append(feature)
+        g.add((feature, RDF.type, BSBM.ProductFeature))
+        g.add((feature, RDFS.label, Literal(_text(rnd, 2))))
+
+    producers = []
+    for i in range(max(2, products // 50)):
+        producer = INST["dataFromProducer%d/Producer%d" % (i, i)]
+        producers.append(producer)
+        g.add((producer, RDF.type, BSBM.Producer))
+        g.add((producer, RDFS.label, Literal(_text(rnd, 2))))
+        g.add((producer, BSBM.country, COUNTRY[rnd.choice(_COUNTRIES)]))
+
+    vendors = [
+        INST["dataFromVendor%d/Vendor%d" % (i, i)]
+        for i in range(max(2, products // 100))
+    ]
+    sites = [
+        INST["dataFromRatingSite%d/RatingSite%d" % (i, i)]
+        for i in range(max(2, products // 100))
+    ]
+    for vendor in vendors:
+        vg = dataset.graph(vendor)
+        vg.add((vendor, RDF.type, BSBM.Vendor))
+        vg.add((vendor, RDFS.label, Literal(_text(rnd, 2))))
+        vg.add((vendor, BSBM.country, COUNTRY[rnd.choice(_COUNTRIES)]))
+
+    reviewers = []
+    for i in range(max(5, products // 5)):
+        site = rnd.choice(sites)
+        reviewer = URIRef("%s/Reviewer%d" % (site.rsplit("/", 1)[0], i))
+        reviewers.append((reviewer, site))
+        rg = dataset.graph(site)
+        rg.add((reviewer, RDF.type, FOAF.Person))
+        rg.add((reviewer, FOAF.name, Literal(_text(rnd, 2).title())))
+        rg.add((reviewer, BSBM.country, COUNTRY[rnd.choice(_COUNTRIES)]))
+
+    start = date(2008, 1, 1)
+    for i in range(products):
+        producer = rnd.choice(producers)
+        product = URIRef("%s/Product%d" % (producer.rsplit("/", 1)[0], i))
+        data.products.append(product)
+        g.add((product, RDF.type, BSBM.Product))
+        g.add((product, RDF.type, rnd.choice(leaves)))
+        g.add((product, RDFS.label, Literal(_text(rnd, 3))))
+        g.add((product, RDFS.comment, Literal(_text(rnd, 30))))
+        g.add((product, BSBM.producer, producer))
+        for feature in rnd.sample(data.features, rnd.randint(2, 6)):
+            g.add((product, BSBM.productFeature, feature))
+        for n in range(1, 4):
+            g.add(
+                (
+                    product,
+                    BSBM["productPropertyNumeric%d" % n],
+                    Literal(rnd.randint(1, 2000)),
+                )
+            )
+        for n in range(1, 3):
+            g.add(
+                (product, BSBM["productPropertyTextual%d" % n], Literal(_text(rnd, 5)))
+            )
+        # a blank node for the dimensions of the product
+        dimensions = BNode()
+        g.add((product, BSBM.dimensions, dimensions))
+        g.add((dimensions, BSBM.width, Literal(Decimal(rnd.randint(1, 1000)) / 10)))
+        g.add((dimensions, BSBM.height, Literal(Decimal(rnd.randint(1, 1000)) / 10)))
+        g.add((product, DC.date, Literal(start + timedelta(days=rnd.randint(0, 700)))))
+
+        for _ in range(2):
+            vendor = rnd.choice(vendors)
+            offer = URIRef("%s/Offer%d" % (vendor.rsplit("/", 1)[0], len(data.offers)))
+            data.offers.append(offer)
+            vg = dataset.graph(vendor)
+            vg.add((offer, RDF.type, BSBM.Offer))
+            vg.add((offer, BSBM.product, product))
+            vg.add((offer, BSBM.vendor, vendor))
+            vg.add(
+                (
+                    offer,
+                    BSBM.price,
+                    Literal(
+                        Decimal(rnd.randint(100, 1000000)) / 100, datatype=XSD.decimal
+                    ),
+                )
+            )
+            valid = datetime(2008, 1, 1) + timedelta(days=rnd.randint(0, 700))
+            vg.add((offer, BSBM.validFrom, Literal(valid)))
+            vg.add(
+                (
+                    offer,
+                    BSBM.validTo,
+                    Literal(valid + timedelta(days=rnd.randint(10, 100))),
+                )
+            )
+            vg.add((offer, BSBM.deliveryDays, Literal(rnd.randint(1, 21))))
+
+        for _ in range(rnd.randint(1, 3)):
+            reviewer, site = rnd.choice(reviewers)
+            review = URIRef("%s/Review%d" % (site.rsplit("/", 1)[0], len(data.reviews)))
+            data.reviews.append(review)
+            rg = dataset.graph(site)
+            rg.add((review, RDF.type, REV.Review))
+            rg.add((review, BSBM.reviewFor, product))
+            rg.add((review, REV.reviewer, reviewer))
+            rg.add(
+                (
+                    review,
+                    DC.title,
+                    Literal(_text(rnd, 4), lang=rnd.choice(("en", "de", "fr"))),
+                )
+            )
+            rg.add((review, REV.text, Literal(_text(rnd, 40), lang="en")))
+            rg.add(
+                (
+                    review,
+                    BSBM.reviewDate,
+                    Literal(start + timedelta(days=rnd.randint(0, 700))),
+                )
+            )
+            for n in range(1, 3):
+                if rnd.random() < 0.8:
+                    rg.add((review, BSBM["rating%d" % n], Literal(rnd.randint(1, 10))))
+
+    return data
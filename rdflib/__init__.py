@@ -97,6 +97,7 @@ __all__ = [
     "plugin",
     "query",
     "NORMALIZE_LITERALS",
+    "INTERN_TERMS",
 ]
 
 logger = logging.getLogger(__name__)
@@ -149,6 +150,35 @@ created after that time, previously created literals will remain
 """
 
 
+INTERN_TERMS = False
+"""
+If True - URIRefs, and Literals with a datatype made from a lexical form,
+are interned when created. I.e. creating a term equal to one that is still
+in use gives that term, so the terms a parser makes for the same IRI or
+value share one object, which saves memory and makes looking them up in
+the indices of a store faster.
+
+The interned terms are held weakly, and are released when they are no
+longer used.
+
+For example:
+
+```python
+>>> import rdflib
+>>> from rdflib import URIRef
+>>> rdflib.INTERN_TERMS = True
+>>> URIRef("http://example.org/a") is URIRef("http://example.org/a")
+True
+>>> rdflib.INTERN_TERMS = False
+
+```
+
+This flag may be changed at any time, but will only affect terms created
+after that time.
+
+"""
+
+
 DAWG_LITERAL_COLLATION = False
 """DAWG_LITERAL_COLLATION determines how literals are ordered or compared
 to each other.
@@ -101,16 +101,25 @@ __all__ = [
     "to_canonical_graph",
     "graph_diff",
     "similar",
+    "canonical_nquads",
 ]
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Callable, Iterator
 from datetime import datetime
 from hashlib import sha256
+from itertools import permutations
 from typing import TYPE_CHECKING, Optional, Union
 
-from rdflib.graph import ConjunctiveGraph, Graph, ReadOnlyGraphAggregate, _TripleType
-from rdflib.term import BNode, IdentifiedNode, Node, URIRef
+from rdflib.graph import (
+    DATASET_DEFAULT_GRAPH_ID,
+    ConjunctiveGraph,
+    Graph,
+    ReadOnlyGraphAggregate,
+    _TripleType,
+)
+from rdflib.namespace import XSD
+from rdflib.term import BNode, IdentifiedNode, Literal, Node, URIRef
 
 if TYPE_CHECKING:
     from _hashlib import HASH
@@ -578,10 +587,29 @@ def isomorphic(graph1: Graph, graph2: Graph) -> bool:
         False
 
         ```
+
+    The graphs are compared in stages, each cheaper than the next: by their
+    size, by their triples without bnodes, by the sizes and bnode degrees
+    of the components of triples connected by bnodes, and last by the
+    hashes of the components that are not in both graphs as they are.
     """
-    gd1 = _TripleCanonicalizer(graph1).to_hash()
-    gd2 = _TripleCanonicalizer(graph2).to_hash()
-    return gd1 == gd2
+    if len(graph1) != len(graph2):
+        return False
+    ground1, components1 = _partition(graph1)
+    ground2, components2 = _partition(graph2)
+    if ground1 != ground2:
+        return False
+    # the components with the same bnodes in both graphs need no hashing
+    rest1 = Counter(components1)
+    rest2 = Counter(components2)
+    rest1, rest2 = rest1 - rest2, rest2 - rest1
+    if Counter(map(_signature, rest1.elements())) != Counter(
+        map(_signature, rest2.elements())
+    ):
+        return False
+    return Counter(
+        frozenset(_canonical_triples(c)) for c in rest1.elements()
+    ) == Counter(frozenset(_canonical_triples(c)) for c in rest2.elements())
 
 
 def to_canonical_graph(g1: Graph, stats: Stats | None = None) -> ReadOnlyGraphAggregate:
@@ -596,16 +624,349 @@ def to_canonical_graph(g1: Graph, stats: Stats | None = None) -> ReadOnlyGraphAg
 
 
 def graph_diff(g1: Graph, g2: Graph) -> tuple[Graph, Graph, Graph]:
-    """Returns three sets of triples: "in both", "in first" and "in second"."""
-    # bnodes have deterministic values in canonical graphs:
-    cg1 = to_canonical_graph(g1)
-    cg2 = to_canonical_graph(g2)
-    in_both = cg1 * cg2
-    in_first = cg1 - cg2
-    in_second = cg2 - cg1
+    """Returns three sets of triples: "in both", "in first" and "in second".
+
+    The bnodes of each component of triples connected by bnodes are given
+    deterministic values from the component, and the triples without bnodes
+    are compared as they are.
+    """
+    ground1, components1 = _partition(g1)
+    ground2, components2 = _partition(g2)
+    ground1 |= _canonical_components(components1)
+    ground2 |= _canonical_components(components2)
+    in_both = Graph()
+    in_both += ground1 & ground2
+    in_first = Graph()
+    in_first += ground1 - ground2
+    in_second = Graph()
+    in_second += ground2 - ground1
     return (in_both, in_first, in_second)
 
 
+def _partition(graph: Graph) -> tuple[set[_TripleType], list[frozenset[_TripleType]]]:
+    """Splits the triples of a graph into those without bnodes, and the
+    components of the others that are connected by their bnodes."""
+    ground: set[_TripleType] = set()
+    linked: list[tuple[_TripleType, Node]] = []
+    parents: dict[Node, Node] = {}
+
+    def find(node: Node) -> Node:
+        path = []
+        parent = parents.setdefault(node, node)
+        while parent != node:
+            path.append(node)
+            node = parent
+            parent = parents[node]
+        for n in path:
+            parents[n] = node
+        return node
+
+    for triple in graph:
+        bnodes = [x for x in triple if isinstance(x, BNode)]
+        if not bnodes:
+            ground.add(triple)
+            continue
+        first = find(bnodes[0])
+        for bnode in bnodes[1:]:
+            parents[find(bnode)] = first
+        linked.append((triple, bnodes[0]))
+    components: dict[Node, set[_TripleType]] = defaultdict(set)
+    for triple, bnode in linked:
+        components[find(bnode)].add(triple)
+    return ground, [frozenset(c) for c in components.values()]
+
+
+def _signature(component: frozenset[_TripleType]) -> tuple[int, tuple]:
+    """The number of triples of a component, and the number of times each
+    of its bnodes is its subject, predicate and object"""
+    degrees: dict[Node, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for triple in component:
+        for i, x in enumerate(triple):
+            if isinstance(x, BNode):
+                degrees[x][i] += 1
+    return len(component), tuple(sorted(map(tuple, degrees.values())))
+
+
+def _canonical_components(
+    components: list[frozenset[_TripleType]],
+) -> set[_TripleType]:
+    """The triples of the components, with bnodes that have deterministic
+    values, which differ between the copies of a component"""
+    triples: set[_TripleType] = set()
+    copies: Counter[frozenset[_TripleType]] = Counter()
+    for component in components:
+        canonical = frozenset(_canonical_triples(component))
+        copy = copies[canonical]
+        copies[canonical] += 1
+        if copy:
+            canonical = frozenset(
+                tuple(  # type: ignore[misc]
+                    BNode(value="%s_%d" % (x, copy)) if isinstance(x, BNode) else x
+                    for x in triple
+                )
+                for triple in canonical
+            )
+        triples |= canonical
+    return triples
+
+
+def _canonical_triples(component: frozenset[_TripleType]) -> Iterator[_TripleType]:
+    """The triples of a component, with bnodes that have deterministic
+    values"""
+    bnodes = {x for triple in component for x in triple if isinstance(x, BNode)}
+    if len(bnodes) > 1:
+        graph = Graph()
+        graph += component
+        return _TripleCanonicalizer(graph).canonical_triples()
+    # the triples of a single bnode tell it apart already
+    lines = sorted(
+        " ".join("_:" if isinstance(x, BNode) else x.n3() for x in triple)
+        for triple in component
+    )
+    label = BNode(value="cb%s" % sha256("\n".join(lines).encode("utf8")).hexdigest())
+    return (
+        (
+            label if isinstance(s, BNode) else s,
+            label if isinstance(p, BNode) else p,
+            label if isinstance(o, BNode) else o,
+        )
+        for s, p, o in component
+    )
+
+
+def canonical_nquads(
+    graph: Graph, hashfunc: _HashT = sha256, max_calls: int | None = None
+) -> str:
+    """Returns the canonical N-Quads of a graph or dataset.
+
+    The bnodes are labelled by the RDF Dataset Canonicalization algorithm
+    (RDFC-1.0, <https://www.w3.org/TR/rdf-canon/>), so isomorphic graphs
+    have the same canonical N-Quads, which can then be hashed or signed.
+
+    Graphs made to be hard to canonicalize need exponentially many calls
+    of the Hash N-Degree Quads algorithm, a RuntimeError is raised if
+    there would be more than `max_calls` of them.
+
+    Example:
+        ```python
+        >>> g = Graph().parse(format='turtle', data='''
+        ...     @prefix : <http://example.org/ns#> .
+        ...     <http://example.org> :rel [ :label "A" ], [ :label "B" ] .
+        ... ''')
+        >>> print(canonical_nquads(g), end="")
+        <http://example.org> <http://example.org/ns#rel> _:c14n0 .
+        <http://example.org> <http://example.org/ns#rel> _:c14n1 .
+        _:c14n0 <http://example.org/ns#label> "B" .
+        _:c14n1 <http://example.org/ns#label> "A" .
+
+        ```
+    """
+    return "".join(_RDFC10(graph, hashfunc, max_calls).canonical_lines())
+
+
+class _IdentifierIssuer:
+    """Issues identifiers to bnodes, and remembers the order it issued them
+    in"""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.issued: dict[int, str] = {}
+
+    def issue(self, bnode: int) -> str:
+        identifier = self.issued.get(bnode)
+        if identifier is None:
+            identifier = self.issued[bnode] = "%s%d" % (self.prefix, len(self.issued))
+        return identifier
+
+    def copy(self) -> _IdentifierIssuer:
+        issuer = _IdentifierIssuer(self.prefix)
+        issuer.issued = self.issued.copy()
+        return issuer
+
+
+# the escapes of the characters of a literal in canonical N-Quads
+_ESCAPES = {c: "\\u%04X" % c for c in (*range(0x20), 0x7F)}
+_ESCAPES.update({ord(c): "\\" + e for c, e in zip('\b\t\n\f\r"\\', 'btnfr"\\')})
+
+_QuadT = tuple[Union[str, int], ...]
+
+
+class _RDFC10:
+    """The RDFC-1.0 canonicalization of the quads of a graph.
+
+    The bnodes are numbered, and a quad holds them as their numbers and
+    its other terms as their N-Quads, so that each term is serialized
+    once however many quads and hashes it is in.
+    """
+
+    def __init__(self, graph: Graph, hashfunc: _HashT, max_calls: int | None):
+        self.hashfunc = hashfunc
+        self.calls_left = max_calls
+        self.quads: list[_QuadT] = []
+        # the quads that each bnode is in
+        self.bnode_quads: list[list[_QuadT]] = []
+        self.first_degree: dict[int, str] = {}
+        self.canonical = _IdentifierIssuer("c14n")
+
+        terms: dict[Node, str | int] = {}
+
+        def term(node: Node) -> str | int:
+            value = terms.get(node)
+            if value is None:
+                if isinstance(node, BNode):
+                    value = len(self.bnode_quads)
+                    self.bnode_quads.append([])
+                else:
+                    value = _nquads_term(node)
+                terms[node] = value
+            return value
+
+        default: set[Node | None] = {DATASET_DEFAULT_GRAPH_ID, None}
+        if isinstance(graph, ConjunctiveGraph):
+            default.add(graph.default_context.identifier)
+            quads = (
+                (s, p, o, c.identifier if isinstance(c, Graph) else c)
+                for s, p, o, c in graph.quads((None, None, None, None))
+            )
+        else:
+            quads = ((s, p, o, None) for s, p, o in graph)
+        for s, p, o, c in quads:
+            quad = (term(s), term(p), term(o), "" if c in default else term(c))
+            self.quads.append(quad)
+            for x in set(quad):
+                if type(x) is int:
+                    self.bnode_quads[x].append(quad)
+
+    def canonical_lines(self) -> list[str]:
+        """The sorted lines of the canonical N-Quads (4.4 Canonicalization
+        Algorithm)"""
+        hash_to_bnodes: dict[str, list[int]] = defaultdict(list)
+        for bnode in range(len(self.bnode_quads)):
+            hash_to_bnodes[self.hash_first_degree(bnode)].append(bnode)
+        shared = []
+        for _, bnodes in sorted(hash_to_bnodes.items()):
+            if len(bnodes) == 1:
+                self.canonical.issue(bnodes[0])
+            else:
+                shared.append(bnodes)
+        for bnodes in shared:
+            results = []
+            for bnode in bnodes:
+                if bnode in self.canonical.issued:
+                    continue
+                issuer = _IdentifierIssuer("b")
+                issuer.issue(bnode)
+                results.append(self.hash_n_degree(bnode, issuer))
+            for _, issuer in sorted(results, key=lambda result: result[0]):
+                for bnode in issuer.issued:
+                    self.canonical.issue(bnode)
+        canonical = self.canonical.issued
+        return sorted(
+            _nquads_line(quad, lambda x: "_:" + canonical[x]) for quad in self.quads
+        )
+
+    def hash_first_degree(self, bnode: int) -> str:
+        """4.6 Hash First Degree Quads"""
+        value = self.first_degree.get(bnode)
+        if value is None:
+            lines = sorted(
+                _nquads_line(quad, lambda x: "_:a" if x == bnode else "_:z")
+                for quad in self.bnode_quads[bnode]
+            )
+            h = self.hashfunc()
+            for line in lines:
+                h.update(line.encode("utf-8"))
+            value = self.first_degree[bnode] = h.hexdigest()
+        return value
+
+    def hash_related(
+        self, related: int, quad: _QuadT, issuer: _IdentifierIssuer, position: str
+    ) -> str:
+        """4.7 Hash Related Blank Node"""
+        identifier = self.canonical.issued.get(related) or issuer.issued.get(related)
+        h = self.hashfunc()
+        h.update(position.encode("utf-8"))
+        if position != "g":
+            predicate = quad[1]
+            h.update((predicate if type(predicate) is str else "_:z").encode("utf-8"))
+        if identifier is None:
+            h.update(self.hash_first_degree(related).encode("utf-8"))
+        else:
+            h.update(("_:" + identifier).encode("utf-8"))
+        return h.hexdigest()
+
+    def hash_n_degree(
+        self, bnode: int, issuer: _IdentifierIssuer
+    ) -> tuple[str, _IdentifierIssuer]:
+        """4.8 Hash N-Degree Quads"""
+        if self.calls_left is not None:
+            if self.calls_left <= 0:
+                raise RuntimeError("Too many calls to canonicalize the graph")
+            self.calls_left -= 1
+        hash_to_related: dict[str, list[int]] = defaultdict(list)
+        for quad in self.bnode_quads[bnode]:
+            for position, x in (("s", quad[0]), ("o", quad[2]), ("g", quad[3])):
+                if type(x) is int and x != bnode:
+                    hash_to_related[
+                        self.hash_related(x, quad, issuer, position)
+                    ].append(x)
+        canonical = self.canonical.issued
+        h = self.hashfunc()
+        for related_hash, related_bnodes in sorted(hash_to_related.items()):
+            h.update(related_hash.encode("utf-8"))
+            chosen_path = ""
+            chosen_issuer = issuer
+            for permutation in permutations(related_bnodes):
+                issuer_copy = issuer.copy()
+                path = ""
+                recursion = []
+                for related in permutation:
+                    if related in canonical:
+                        path += "_:" + canonical[related]
+                    else:
+                        if related not in issuer_copy.issued:
+                            recursion.append(related)
+                        path += "_:" + issuer_copy.issue(related)
+                    if chosen_path and len(path) >= len(chosen_path):
+                        if path > chosen_path:
+                            break
+                else:
+                    for related in recursion:
+                        result, issuer_copy = self.hash_n_degree(related, issuer_copy)
+                        path += "_:%s<%s>" % (issuer_copy.issue(related), result)
+                        if chosen_path and len(path) >= len(chosen_path):
+                            if path > chosen_path:
+                                break
+                    else:
+                        if not chosen_path or path < chosen_path:
+                            chosen_path = path
+                            chosen_issuer = issuer_copy
+            h.update(chosen_path.encode("utf-8"))
+            issuer = chosen_issuer
+        return h.hexdigest(), issuer
+
+
+def _nquads_term(node: Node) -> str:
+    """The canonical N-Quads of a term other than a bnode"""
+    if isinstance(node, Literal):
+        lexical = '"%s"' % str(node).translate(_ESCAPES)
+        if node.language:
+            # language tags are compared case-insensitively
+            return "%s@%s" % (lexical, node.language.lower())
+        if node.datatype is not None and node.datatype != XSD.string:
+            return "%s^^<%s>" % (lexical, node.datatype)
+        return lexical
+    return "<%s>" % node
+
+
+def _nquads_line(quad: _QuadT, label: Callable[[int], str]) -> str:
+    """The N-Quads line of a quad, with the bnodes labelled by `label`"""
+    s, p, o, g = (x if type(x) is str else label(x) for x in quad)  # type: ignore[arg-type]
+    if g:
+        return "%s %s %s %s .\n" % (s, p, o, g)
+    return "%s %s %s .\n" % (s, p, o)
+
+
 _MOCK_BNODE = BNode()
 
 
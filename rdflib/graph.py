@@ -272,6 +272,7 @@ import logging
 import pathlib
 import random
 import warnings
+from contextlib import contextmanager
 from io import BytesIO
 from typing import (
     IO,
@@ -651,6 +652,29 @@ class Graph(Node):
         )
         return self
 
+    @contextmanager
+    def bulk_load(self: _GraphT) -> Generator[_GraphT, None, None]:
+        """A context for adding many triples at once.
+
+        The store can defer work, like building secondary indexes, until the
+        context exits, see [`Store.bulk_load`][rdflib.store.Store.bulk_load].
+        [`parse`][rdflib.graph.Graph.parse] uses it.
+
+        Example:
+            ```python
+            >>> from rdflib import Graph, Literal, URIRef
+            >>> g = Graph()
+            >>> with g.bulk_load():
+            ...     for i in range(3):
+            ...         _ = g.add((URIRef("urn:example:s"), URIRef("urn:example:p"), Literal(i)))
+            >>> len(g)
+            3
+
+            ```
+        """
+        with self.__store.bulk_load():
+            yield self
+
     def remove(self: _GraphT, triple: _TriplePatternType) -> _GraphT:
         """Remove a triple from the graph
 
@@ -786,6 +810,35 @@ class Graph(Node):
         # type error: Unexpected keyword argument "context" for "__len__" of "Store"
         return self.__store.__len__(context=self)  # type: ignore[call-arg]
 
+    def count(self, triple: _TripleSelectorType = (None, None, None)) -> int:
+        """Returns the number of triples matching the given triple pattern.
+
+        This is the number of triples `triples` gives for the pattern, but
+        stores that can count them without enumerating them, like the
+        Memory store from its indices, are asked for the number instead.
+
+        ```python
+        >>> from rdflib import Graph, URIRef, RDF
+        >>> g = Graph()
+        >>> _ = g.add((URIRef("urn:bob"), RDF.type, URIRef("urn:Person")))
+        >>> _ = g.add((URIRef("urn:alice"), RDF.type, URIRef("urn:Person")))
+        >>> g.count((None, RDF.type, URIRef("urn:Person")))
+        2
+
+        ```
+
+        Args:
+            triple: A triple pattern where each component can be a specific value or None
+                as a wildcard. The predicate can also be a path expression.
+
+        Returns:
+            The number of triples matching the pattern.
+        """
+        s, p, o = triple
+        if isinstance(p, Path):
+            return sum(1 for _ in p.eval(self, s, o))
+        return self.__store.count((s, p, o), context=self)
+
     def __iter__(self) -> Generator[_TripleType, None, None]:
         """Iterates over all triples in the store.
 
@@ -1692,7 +1745,8 @@ class Graph(Node):
             parser = plugin.get(format, Parser)()
         try:
             # TODO FIXME: Parser.parse should have **kwargs argument.
-            parser.parse(source, self, **args)
+            with self.bulk_load():
+                parser.parse(source, self, **args)
         except SyntaxError as se:
             if could_not_guess_format:
                 raise ParserError(
@@ -2404,6 +2458,29 @@ class ConjunctiveGraph(Graph):
         """Number of triples in the entire conjunctive graph"""
         return self.store.__len__()
 
+    def count(
+        self,
+        triple_or_quad: _TripleOrQuadSelectorType = (None, None, None),
+        context: _ContextType | None = None,
+    ) -> int:
+        """Number of the triples `triples` gives for the triple or quad
+        pattern"""
+        s, p, o, c = self._spoc(triple_or_quad)
+        context = self._graph(context or c)
+
+        if self.default_union:
+            if context == self.default_context:
+                context = None
+        else:
+            if context is None:
+                context = self.default_context
+
+        if isinstance(p, Path):
+            if context is None:
+                context = self
+            return sum(1 for _ in p.eval(context, s, o))
+        return self.store.count((s, p, o), context=context)
+
     def contexts(
         self, triple: _TripleType | None = None
     ) -> Generator[_ContextType, None, None]:
@@ -3259,6 +3336,12 @@ class ReadOnlyGraphAggregate(ConjunctiveGraph):
     def __len__(self) -> int:
         return sum(len(g) for g in self.graphs)
 
+    # type error: Signature of "count" incompatible with supertype "ConjunctiveGraph"
+    def count(  # type: ignore[override]
+        self, triple: _TripleSelectorType = (None, None, None)
+    ) -> int:
+        return sum(1 for _ in self.triples(triple))
+
     def __hash__(self) -> NoReturn:
         raise UnSupportedAggregateOperation()
 
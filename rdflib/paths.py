@@ -179,7 +179,14 @@ import warnings
 from abc import ABC, abstractmethod
 from functools import total_ordering
 from typing import TYPE_CHECKING, Any
-
+from weakref import WeakKeyDictionary
+
+from rdflib.store import (
+    Store,
+    TransactionRolledBackEvent,
+    TripleAddedEvent,
+    TripleRemovedEvent,
+)
 from rdflib.term import Node, URIRef
 
 if TYPE_CHECKING:
@@ -371,92 +378,68 @@ class MulPath(Path):
         obj: ObjectType | None = None,
         first: bool = True,
     ) -> Generator[tuple[SubjectType, ObjectType], None, None]:
-        if self.zero and first:
-            if subj and obj:
+        # the spec does, by defn, not allow duplicates
+        zero = self.zero and first
+        if zero:
+            if subj is not None and obj is not None:
                 if subj == obj:
                     yield subj, obj
-            elif subj:
+            elif subj is not None:
                 yield subj, subj
-            elif obj:
+            elif obj is not None:
                 yield obj, obj
 
-        def _fwd(
-            subj: SubjectType,
-            obj: ObjectType | None,
-            seen: set[SubjectType],
-        ) -> Generator[tuple[SubjectType, ObjectType], None, None]:
-            seen.add(subj)
-
-            for s, o in eval_path(graph, (subj, self.path, None)):
-                if not obj or o == obj:
+        if not self.more:
+            done = set()
+            if subj is None and obj is None and zero:
+                for x in self._identities(graph):
+                    done.add(x)
+                    yield x
+            for s, o in eval_path(graph, (subj, self.path, obj)):
+                if (s, o) not in done and not (zero and s == o and s in (subj, obj)):
+                    done.add((s, o))
                     yield s, o
-                if self.more:
-                    if o in seen:
-                        continue
-                    for s2, o2 in _fwd(o, obj, seen):
-                        yield s, o2
+            return
 
-        def _bwd(
-            subj: SubjectType | None,
-            obj: ObjectType,
-            seen: set[ObjectType],
-        ) -> Generator[tuple[SubjectType, ObjectType], None, None]:
-            seen.add(obj)
-
-            for s, o in eval_path(graph, (None, self.path, obj)):
-                if not subj or subj == s:
-                    yield s, o
-                if self.more:
-                    if s in seen:
-                        continue
-
-                    for s2, o2 in _bwd(None, s, seen):
-                        yield s2, o
-
-        def _all_fwd_paths() -> Generator[tuple[SubjectType, ObjectType], None, None]:
-            if self.zero:
-                seen1 = set()
-                # According to the spec, ALL nodes are possible solutions
-                # (even literals)
-                # we cannot do this without going through ALL triples
-                # unless we keep an index of all terms somehow
-                # but let's just hope this query doesn't happen very often...
-                for s, o in graph.subject_objects(None):
-                    if s not in seen1:
-                        seen1.add(s)
-                        yield s, s
-                    if o not in seen1:
-                        seen1.add(o)
-                        yield o, o
-
-            seen = set()
-            for s, o in eval_path(graph, (None, self.path, None)):
-                if not self.more:
-                    yield s, o
-                else:
-                    if s not in seen:
-                        seen.add(s)
-                        f = list(_fwd(s, None, set()))
-                        for s1, o1 in f:
-                            assert s1 == s
-                            yield s1, o1
-
-        done = set()  # the spec does, by defn, not allow duplicates
         if subj is not None:
-            for x in _fwd(subj, obj, set()):
-                if x not in done:
-                    done.add(x)
-                    yield x
+            reached = _reachability(graph, self.path, True)(subj)
+            if obj is not None:
+                if obj in reached and not (zero and subj == obj):
+                    yield subj, obj
+                return
+            for o in reached:
+                if not (zero and o == subj):
+                    yield subj, o
         elif obj is not None:
-            for x in _bwd(subj, obj, set()):
-                if x not in done:
-                    done.add(x)
-                    yield x
+            for s in _reachability(graph, self.path, False)(obj):
+                if not (zero and s == obj):
+                    yield s, obj
         else:
-            for x in _all_fwd_paths():
-                if x not in done:
-                    done.add(x)
+            identities = set()
+            if zero:
+                for x in self._identities(graph):
+                    identities.add(x[0])
                     yield x
+            for s, reached in _reachability(graph, self.path, True).closure():
+                for o in reached:
+                    if not (s == o and s in identities):
+                        yield s, o
+
+    @staticmethod
+    def _identities(graph: Graph) -> Generator[tuple[Node, Node], None, None]:
+        # According to the spec, ALL nodes are possible solutions
+        # (even literals)
+        # we cannot do this without going through ALL triples
+        # unless we keep an index of all terms somehow
+        # but let's just hope this query doesn't happen very often...
+        seen = set()
+        for s, o in graph.subject_objects(None):
+            if s not in seen:
+                seen.add(s)
+                yield s, s
+            if o not in seen:
+                seen.add(o)
+                yield o, o
 
     def __repr__(self) -> str:
         return "Path(%s%s)" % (self.path, self.mod)
@@ -550,6 +533,203 @@ def eval_path(
     return ((s, o) for s, p, o in graph.triples(t))
 
 
+class _Reachability:
+    """The nodes reached from each node by one or more steps of a path in a
+    graph, following the path forward or backward.
+
+    The nodes are found depth first without recursion, and the nodes reached
+    from a node are kept to be reused when the node is reached from another.
+    """
+
+    def __init__(self, graph: Graph, path: Path | URIRef, forward: bool):
+        self.graph = graph
+        self.path = path
+        self.forward = forward
+        # the nodes reached from each node, in the order they were found
+        self.reached: dict[Node, dict[Node, None]] = {}
+        # whether reached has all the nodes with a step from them
+        self.complete = False
+
+    def steps(self, node: Node) -> Iterator[Node]:
+        if self.forward:
+            return (o for _, o in eval_path(self.graph, (node, self.path, None)))
+        return (s for s, _ in eval_path(self.graph, (None, self.path, node)))
+
+    def __call__(self, start: Node) -> dict[Node, None]:
+        reached = self.reached.get(start)
+        if reached is not None:
+            return reached
+        if self.complete:
+            return {}
+
+        known = self.reached
+        reached = {}
+        expanded = {start}
+        stack = [self.steps(start)]
+        while stack:
+            for node in stack[-1]:
+                if node in reached:
+                    continue
+                reached[node] = None
+                if node in known:
+                    reached.update(known[node])
+                elif node not in expanded:
+                    expanded.add(node)
+                    stack.append(self.steps(node))
+                    break
+            else:
+                stack.pop()
+        known[start] = reached
+        return reached
+
+    def closure(self) -> Iterator[tuple[Node, dict[Node, None]]]:
+        """The nodes reached from every node with a step from it.
+
+        All the steps are read at once, and the nodes reached from each
+        strongly connected component are found after those of the
+        components it has steps to, so each is found once.
+        """
+        steps: dict[Node, list[Node]] = {}
+        for s, o in eval_path(self.graph, (None, self.path, None)):
+            if not self.forward:
+                s, o = o, s
+            steps.setdefault(s, []).append(o)
+
+        known = self.reached
+        if not self.complete:
+            # Tarjan's algorithm, components are completed in reverse
+            # topological order
+            index: dict[Node, int] = {}
+            low: dict[Node, int] = {}
+            component: list[Node] = []
+            on_component: set[Node] = set()
+            for root in steps:
+                if root in index or root in known:
+                    continue
+                index[root] = low[root] = len(index)
+                component.append(root)
+                on_component.add(root)
+                stack = [(root, iter(steps[root]))]
+                while stack:
+                    node, successors = stack[-1]
+                    for n in successors:
+                        if n in known:
+                            continue
+                        if n not in index:
+                            index[n] = low[n] = len(index)
+                            component.append(n)
+                            on_component.add(n)
+                            stack.append((n, iter(steps.get(n, ()))))
+                            break
+                        if n in on_component:
+                            low[node] = min(low[node], index[n])
+                    else:
+                        stack.pop()
+                        if stack:
+                            parent = stack[-1][0]
+                            low[parent] = min(low[parent], low[node])
+                        if low[node] == index[node]:
+                            i = len(component) - 1
+                            while component[i] is not node:
+                                i -= 1
+                            members = component[i:]
+                            del component[i:]
+                            on_component.difference_update(members)
+                            self._complete(members, steps)
+            self.complete = True
+
+        for s in steps:
+            yield s, known[s]
+
+    def _complete(self, members: list[Node], steps: dict[Node, list[Node]]) -> None:
+        """keep the nodes reached from a strongly connected component"""
+        known = self.reached
+        reached: dict[Node, None] = {}
+        inside = set(members)
+        cyclic = len(members) > 1
+        for m in members:
+            for n in steps.get(m, ()):
+                if n in inside:
+                    cyclic = True
+                elif n not in reached:
+                    reached[n] = None
+                    reached.update(known[n])
+        if cyclic:
+            reached.update(dict.fromkeys(members))
+        for m in members:
+            known[m] = reached
+
+
+class _Closures:
+    """The reachabilities of the paths evaluated on the graphs of a store,
+    until the store announces a change"""
+
+    def __init__(self, store: Store):
+        self.enabled = True
+        self.reachabilities: dict[Any, _Reachability] = {}
+        store.dispatcher.subscribe(TripleAddedEvent, self.clear)
+        store.dispatcher.subscribe(TripleRemovedEvent, self.clear)
+        store.dispatcher.subscribe(TransactionRolledBackEvent, self.clear)
+
+    def clear(self, event: Any = None) -> None:
+        self.reachabilities.clear()
+
+
+_closures: WeakKeyDictionary[Store, _Closures] = WeakKeyDictionary()
+
+
+def cache_closures(graph: Graph, enabled: bool = True) -> None:
+    """
+    Keep the transitive closures of the `*` and `+` paths evaluated on the
+    graphs of the store of `graph`, for the later evaluations of the same
+    path on the same graph, until a triple is added to or removed from the
+    store, or a transaction is rolled back. Stores announce the changes
+    with events, so they are slower to change while the closures are kept.
+
+    ```python
+    >>> from rdflib import Graph, URIRef
+    >>> from rdflib.paths import cache_closures
+    >>> g = Graph()
+    >>> p = URIRef("urn:p")
+    >>> _ = g.add((URIRef("urn:a"), p, URIRef("urn:b")))
+    >>> cache_closures(g)
+    >>> list(g.objects(URIRef("urn:a"), p * OneOrMore))
+    [rdflib.term.URIRef('urn:b')]
+    >>> _ = g.add((URIRef("urn:b"), p, URIRef("urn:c")))
+    >>> list(g.objects(URIRef("urn:a"), p * OneOrMore))
+    [rdflib.term.URIRef('urn:b'), rdflib.term.URIRef('urn:c')]
+    >>> cache_closures(g, False)
+
+    ```
+    """
+    closures = _closures.get(graph.store)
+    if closures is None:
+        if enabled:
+            _closures[graph.store] = _Closures(graph.store)
+        return
+    closures.enabled = enabled
+    closures.clear()
+
+
+def _reachability(graph: Graph, path: Path | URIRef, forward: bool) -> _Reachability:
+    closures = _closures.get(graph.store)
+    if closures is None or not closures.enabled:
+        return _Reachability(graph, path, forward)
+    key = (
+        type(graph),
+        graph.identifier,
+        getattr(graph, "default_union", None),
+        path,
+        forward,
+    )
+    reachability = closures.reachabilities.get(key)
+    if reachability is None:
+        reachability = closures.reachabilities[key] = _Reachability(
+            graph, path, forward
+        )
+    return reachability
+
+
 def mul_path(p: URIRef | Path, mul: _MulPathMod) -> MulPath:
     """
     cardinality path
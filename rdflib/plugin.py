@@ -179,6 +179,18 @@ register(
     "rdflib.plugins.stores.memory",
     "SimpleMemory",
 )
+register(
+    "Compact",
+    Store,
+    "rdflib.plugins.stores.compact",
+    "CompactMemory",
+)
+register(
+    "SQLite",
+    Store,
+    "rdflib.plugins.stores.sqlite",
+    "SQLite",
+)
 register(
     "Auditable",
     Store,
@@ -310,6 +322,12 @@ register(
     "rdflib.plugins.serializers.nquads",
     "NQuadsSerializer",
 )
+register(
+    "canonical-nquads",
+    Serializer,
+    "rdflib.plugins.serializers.nquads",
+    "CanonicalNQuadsSerializer",
+)
 register(
     "application/trix",
     Serializer,
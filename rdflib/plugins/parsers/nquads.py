@@ -35,9 +35,16 @@ from typing import Any
 from rdflib.exceptions import ParserError as ParseError
 from rdflib.graph import ConjunctiveGraph, Dataset, Graph
 from rdflib.parser import InputSource
+from rdflib.plugins.parsers import ntriples
 
 # Build up from the NTriples parser:
-from rdflib.plugins.parsers.ntriples import W3CNTriplesParser, r_tail, r_wspace
+from rdflib.plugins.parsers.ntriples import (
+    W3CNTriplesParser,
+    _parse_parallel,
+    r_quad,
+    r_tail,
+    r_wspace,
+)
 from rdflib.term import BNode
 
 __all__ = ["NQuadsParser"]
@@ -54,6 +61,7 @@ class NQuadsParser(W3CNTriplesParser):
         sink: Graph,
         bnode_context: _BNodeContextType | None = None,
         skolemize: bool = False,
+        workers: int | None = None,
         **kwargs: Any,
     ):
         """Parse inputsource as an N-Quads file.
@@ -65,6 +73,9 @@ class NQuadsParser(W3CNTriplesParser):
                 [`BNode`][rdflib.term.BNode] instances.
                 See `.W3CNTriplesParser.parse` for more details.
             skolemize: Whether to skolemize blank nodes.
+            workers: If greater than 1 and the source is a file on disk, the
+                file is split on line boundaries and the chunks are parsed by
+                that many processes.
 
         Returns:
             The Dataset containing the parsed quads.
@@ -100,6 +111,24 @@ class NQuadsParser(W3CNTriplesParser):
             source = inputsource.getByteStream()  # type: ignore[assignment]
             source = getreader("utf-8")(source)  # type: ignore[arg-type]
 
+        if workers is not None and workers > 1:
+            if bnode_context is None:
+                bnode_context = self._bnode_ids
+            chunks = _parse_parallel(
+                NQuadsParser,
+                inputsource.getByteStream(),
+                workers,
+                bnode_context,
+                skolemize,
+            )
+            if chunks is not None:
+                graphs: dict[Any, Graph] = {None: ds.default_context}
+                for quads in chunks:
+                    for c in {c for _, _, _, c in quads}.difference(graphs):
+                        graphs[c] = ds.get_context(c)
+                    ds.store.addN((s, p, o, graphs[c]) for s, p, o, c in quads)
+                return self.sink
+
         if not hasattr(source, "read"):
             raise ParseError("Item to parse must be a file-like object.")
 
@@ -117,6 +146,24 @@ class NQuadsParser(W3CNTriplesParser):
         return self.sink
 
     def parseline(self, bnode_context: _BNodeContextType | None = None) -> None:
+        if self._whole and not ntriples.validate:
+            m = r_quad.fullmatch(self.line)  # type: ignore[arg-type]
+            if m is not None:
+                s_iri, s_nodeid, p_iri, *o, c_iri, c_nodeid = m.groups()
+                self.line = ""
+                triple = (
+                    self.term(s_iri, s_nodeid, bnode_context),
+                    self.term(p_iri, None),
+                    self.objectterm(*o, bnode_context=bnode_context),
+                )
+                if c_iri is not None or c_nodeid is not None:
+                    self.sink.get_context(
+                        self.term(c_iri, c_nodeid, bnode_context)
+                    ).add(triple)
+                else:
+                    self.sink.default_context.add(triple)
+                return
+
         self.eat(r_wspace)
         if (not self.line) or self.line.startswith("#"):
             return  # The line is empty or a comment
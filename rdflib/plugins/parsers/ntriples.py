@@ -7,9 +7,12 @@ Author: Sean B. Palmer, inamidst.com
 from __future__ import annotations
 
 import codecs
+import os
 import re
-from collections.abc import MutableMapping
-from io import BytesIO, StringIO, TextIOBase
+from collections import deque
+from collections.abc import Iterator, MutableMapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BufferedIOBase, BytesIO, RawIOBase, StringIO, TextIOBase
 from re import Match, Pattern
 from typing import (
     IO,
@@ -29,7 +32,13 @@ from rdflib.term import URIRef as URI  # noqa: N814
 if TYPE_CHECKING:
     import typing_extensions as te
 
-    from rdflib.graph import Graph, _ObjectType, _PredicateType, _SubjectType
+    from rdflib.graph import (
+        Graph,
+        _ContextIdentifierType,
+        _ObjectType,
+        _PredicateType,
+        _SubjectType,
+    )
 
 __all__ = [
     "unquote",
@@ -52,9 +61,29 @@ r_uriref = re.compile(uriref)
 r_nodeid = re.compile(r"_:([A-Za-z0-9_:]([-A-Za-z0-9_:\.]*[-A-Za-z0-9_:])?)")
 r_literal = re.compile(literal + litinfo)
 
+# The fast path of parseline matches a whole statement at once. Its IRIs
+# end at the first ">", so wherever it matches, the term by term parse
+# would read the same terms; lines it does not match take the term by
+# term parse, which reports the errors.
+_iri = r'<([^:<>"\s]+:[^\s"<>]*)>'
+_nodeid = r"_:([A-Za-z0-9_:](?:[-A-Za-z0-9_:\.]*[-A-Za-z0-9_:])?)"
+_object = (
+    f"(?:{_iri}|{_nodeid}|{literal}" rf"(?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*)|\^\^{_iri})?)"
+)
+r_triple = re.compile(
+    rf"[ \t]*(?:{_iri}|{_nodeid})[ \t]+{_iri}[ \t]+{_object}[ \t]*\.[ \t]*(?:#.*)?"
+)
+r_quad = re.compile(
+    rf"[ \t]*(?:{_iri}|{_nodeid})[ \t]*{_iri}[ \t]*{_object}"
+    rf"(?:[ \t]*(?:{_iri}|{_nodeid}))?[ \t]*\.[ \t]*(?:#.*)?"
+)
+
 bufsiz = 2048
 validate = False
 
+# the smallest chunk of a file that is parsed in its own process
+chunksiz = 1 << 20
+
 
 class DummySink:
     def __init__(self):
@@ -139,7 +168,16 @@ class W3CNTriplesParser:
     `W3CNTriplesParser`.
     """
 
-    __slots__ = ("_bnode_ids", "sink", "buffer", "file", "line", "skolemize")
+    __slots__ = (
+        "_bnode_ids",
+        "sink",
+        "buffer",
+        "_pos",
+        "file",
+        "line",
+        "skolemize",
+        "_whole",
+    )
 
     def __init__(
         self,
@@ -160,8 +198,15 @@ class W3CNTriplesParser:
             self.sink = DummySink()
 
         self.buffer: str | None = None
+        self._pos = 0
         self.file: TextIO | codecs.StreamReader | None = None
         self.line: str | None = ""
+        # statements are matched whole unless the methods reading a term
+        # are overridden, which the match would bypass
+        self._whole = all(
+            getattr(type(self), name) is method
+            for name, method in _TERM_READERS.items()
+        )
 
     def parse(
         self,
@@ -218,29 +263,47 @@ class W3CNTriplesParser:
         """Read an N-Triples line from buffered input."""
         # N-Triples lines end in either CRLF, CR, or LF
         # Therefore, we can't just use f.readline()
-        if not self.buffer:
-            # type error: Item "None" of "Union[TextIO, StreamReader, None]" has no attribute "read"
-            buffer = self.file.read(bufsiz)  # type: ignore[union-attr]
-            if not buffer:
-                return None
-            self.buffer = buffer
-
-        while True:
-            m = r_line.match(self.buffer)
+        # The lines are matched in place, the buffer is only copied when
+        # more input is read
+        buffer = self.buffer
+        if buffer:
+            m = r_line.match(buffer, self._pos)
             if m:  # the more likely prospect
-                self.buffer = self.buffer[m.end() :]
+                self._pos = m.end()
                 return m.group(1)
-            else:
-                # type error: Item "None" of "Union[TextIO, StreamReader, None]" has no attribute "read"
-                buffer = self.file.read(bufsiz)  # type: ignore[union-attr]
-                if not buffer and not self.buffer.isspace():
-                    # Last line does not need to be terminated with a newline
-                    buffer += "\n"
-                elif not buffer:
+            buffer = buffer[self._pos :]
+        else:
+            buffer = ""
+
+        while True:
+            # type error: Item "None" of "Union[TextIO, StreamReader, None]" has no attribute "read"
+            data = self.file.read(bufsiz)  # type: ignore[union-attr]
+            if not data:
+                if not buffer or buffer.isspace():
+                    self.buffer = ""
                     return None
-                self.buffer += buffer
+                # Last line does not need to be terminated with a newline
+                data = "\n"
+            buffer += data
+            m = r_line.match(buffer)
+            if m:
+                self.buffer = buffer
+                self._pos = m.end()
+                return m.group(1)
 
     def parseline(self, bnode_context: _BNodeContextType | None = None) -> None:
+        if self._whole and not validate:
+            m = r_triple.fullmatch(self.line)  # type: ignore[arg-type]
+            if m is not None:
+                s_iri, s_nodeid, p_iri, *o = m.groups()
+                self.line = ""
+                self.sink.triple(
+                    self.term(s_iri, s_nodeid, bnode_context),
+                    URI(unquote(p_iri) if "\\" in p_iri else p_iri),
+                    self.objectterm(*o, bnode_context=bnode_context),
+                )
+                return
+
         self.eat(r_wspace)
         if (not self.line) or self.line.startswith("#"):
             return  # The line is empty or a comment
@@ -258,6 +321,36 @@ class W3CNTriplesParser:
             raise ParseError("Trailing garbage: {}".format(self.line))
         self.sink.triple(subject, predicate, object_)
 
+    def term(
+        self,
+        iri: str | None,
+        nodeid: str | None,
+        bnode_context: _BNodeContextType | None = None,
+    ) -> Union[URI, bNode]:
+        """The IRI or blank node matched by the fast path of parseline"""
+        if iri is not None:
+            return URI(unquote(iri) if "\\" in iri else iri)
+        return self.bnode(nodeid, bnode_context)  # type: ignore[arg-type]
+
+    def objectterm(
+        self,
+        iri: str | None,
+        nodeid: str | None,
+        lit: str | None,
+        lang: str | None,
+        dtype: str | None,
+        bnode_context: _BNodeContextType | None = None,
+    ) -> Union[URI, bNode, Literal]:
+        """The object matched by the fast path of parseline"""
+        if lit is None:
+            return self.term(iri, nodeid, bnode_context)
+        if dtype is not None:
+            return Literal(
+                unquote(lit) if "\\" in lit else lit,
+                datatype=URI(unquote(dtype) if "\\" in dtype else dtype),
+            )
+        return Literal(unquote(lit) if "\\" in lit else lit, lang)
+
     def peek(self, token: str) -> bool:
         return self.line.startswith(token)  # type: ignore[union-attr]
 
@@ -303,27 +396,29 @@ class W3CNTriplesParser:
         self, bnode_context: _BNodeContextType | None = None
     ) -> Union[te.Literal[False], bNode, URI]:
         if self.peek("_"):
-            if self.skolemize:
-                bnode_id = self.eat(r_nodeid).group(1)
-                return bNode(bnode_id).skolemize()
-
-            else:
-                # Fix for https://github.com/RDFLib/rdflib/issues/204
-                if bnode_context is None:
-                    bnode_context = self._bnode_ids
-                bnode_id = self.eat(r_nodeid).group(1)
-                new_id = bnode_context.get(bnode_id, None)
-                if new_id is not None:
-                    # Re-map to id specific to this doc
-                    return bNode(new_id)
-                else:
-                    # Replace with freshly-generated document-specific BNode id
-                    bnode = bNode()
-                    # Store the mapping
-                    bnode_context[bnode_id] = bnode
-                    return bnode
+            return self.bnode(self.eat(r_nodeid).group(1), bnode_context)
         return False
 
+    def bnode(
+        self, bnode_id: str, bnode_context: _BNodeContextType | None = None
+    ) -> Union[bNode, URI]:
+        if self.skolemize:
+            return bNode(bnode_id).skolemize()
+
+        # Fix for https://github.com/RDFLib/rdflib/issues/204
+        if bnode_context is None:
+            bnode_context = self._bnode_ids
+        new_id = bnode_context.get(bnode_id, None)
+        if new_id is not None:
+            # Re-map to id specific to this doc
+            return bNode(new_id)
+        else:
+            # Replace with freshly-generated document-specific BNode id
+            bnode = bNode()
+            # Store the mapping
+            bnode_context[bnode_id] = bnode
+            return bnode
+
     def literal(self) -> Union[te.Literal[False], Literal]:
         if self.peek('"'):
             lit, lang, dtype = self.eat(r_literal).groups()
@@ -344,6 +439,12 @@ class W3CNTriplesParser:
         return False
 
 
+_TERM_READERS = {
+    name: getattr(W3CNTriplesParser, name)
+    for name in ("subject", "predicate", "object", "uriref", "nodeid", "literal")
+}
+
+
 class NTGraphSink:
     __slots__ = ("g",)
 
@@ -354,6 +455,172 @@ class NTGraphSink:
         self.g.add((s, p, o))
 
 
+_ChunkQuadType = tuple[
+    "_SubjectType", "_PredicateType", "_ObjectType", "_ContextIdentifierType | None"
+]
+
+
+class _ChunkGraph:
+    __slots__ = ("quads", "identifier")
+
+    def __init__(
+        self,
+        quads: list[_ChunkQuadType],
+        identifier: _ContextIdentifierType | None,
+    ):
+        self.quads = quads
+        self.identifier = identifier
+
+    def add(self, triple: tuple[_SubjectType, _PredicateType, _ObjectType]) -> None:
+        self.quads.append((*triple, self.identifier))
+
+
+class _ChunkSink:
+    """Collects the statements parsed from a chunk in a worker process, as
+    the sink of both the N-Triples and N-Quads parsers"""
+
+    def __init__(self):
+        self.quads: list[_ChunkQuadType] = []
+        self.default_context = _ChunkGraph(self.quads, None)
+        self.graphs: dict[_ContextIdentifierType, _ChunkGraph] = {}
+
+    def triple(self, s: _SubjectType, p: _PredicateType, o: _ObjectType) -> None:
+        self.quads.append((s, p, o, None))
+
+    def get_context(self, identifier: _ContextIdentifierType) -> _ChunkGraph:
+        try:
+            return self.graphs[identifier]
+        except KeyError:
+            graph = self.graphs[identifier] = _ChunkGraph(self.quads, identifier)
+            return graph
+
+
+class _ChunkBNodes(dict):
+    """A blank node context that names the blank node of a label after the
+    label and a prefix shared by all chunks, so that every process maps
+    the same label to the same blank node"""
+
+    def __init__(self, prefix: str, bnode_context: dict[str, bNode]):
+        super().__init__(bnode_context)
+        self.prefix = prefix
+        self.new: dict[str, bNode] = {}
+
+    def get(self, label: str, default: Any = None) -> bNode:  # type: ignore[override]
+        try:
+            return self[label]
+        except KeyError:
+            bnode = self[label] = self.new[label] = bNode(self.prefix + label)
+            return bnode
+
+
+def _parse_chunk(
+    parser_class: type[W3CNTriplesParser],
+    path: str,
+    start: int,
+    end: int,
+    prefix: str,
+    bnode_context: dict[str, bNode],
+    skolemize: bool,
+) -> tuple[list[_ChunkQuadType], dict[str, bNode]]:
+    """Parse the lines between the byte offsets start and end of the file,
+    returning the statements and the blank node labels first seen there"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    sink = _ChunkSink()
+    bnodes = _ChunkBNodes(prefix, bnode_context)
+    parser = parser_class(bnode_context=bnodes)
+    # type error: Incompatible types in assignment (expression has type "_ChunkSink", variable has type "Union[DummySink, NTGraphSink]")
+    parser.sink = sink  # type: ignore[assignment]
+    parser.skolemize = skolemize
+    parser.file = StringIO(data.decode("utf-8"))
+    parser.buffer = ""
+    while True:
+        parser.line = line = parser.readline()
+        if parser.line is None:
+            break
+        try:
+            parser.parseline(bnode_context=bnodes)
+        except ParseError as e:
+            raise ParseError("Invalid line ({}): {!r}".format(e, line))
+    return sink.quads, bnodes.new
+
+
+def _parse_parallel(
+    parser_class: type[W3CNTriplesParser],
+    f: Any,
+    workers: int,
+    bnode_context: _BNodeContextType,
+    skolemize: bool,
+) -> Iterator[list[_ChunkQuadType]] | None:
+    """Parse the rest of the file f in chunks split on line boundaries, by
+    a pool of workers processes.
+
+    Returns None if f is not a binary file on disk or too small to be
+    split, otherwise the statements of each chunk in the order of the
+    file. The blank node labels of each chunk are added to bnode_context
+    before its statements are returned.
+    """
+    path = getattr(f, "name", None)
+    if (
+        not isinstance(f, (BufferedIOBase, RawIOBase))
+        or not isinstance(path, str)
+        or not os.path.isfile(path)
+    ):
+        return None
+    start = f.tell()
+    size = os.path.getsize(path)
+    if size - start < 2 * chunksiz:
+        return None
+    f.seek(size)
+
+    prefix = bNode() + "_"
+    snapshot = dict(bnode_context)
+
+    def ranges() -> Iterator[tuple[int, int]]:
+        """the offsets of chunks of about chunksiz bytes, each ending at
+        the end of a line"""
+        chunk_start = start
+        with open(path, "rb") as g:
+            while chunk_start < size:
+                g.seek(chunk_start + chunksiz)
+                g.readline()
+                chunk_end = min(g.tell(), size)
+                yield chunk_start, chunk_end
+                chunk_start = chunk_end
+
+    def result(future: Future) -> list[_ChunkQuadType]:
+        quads, labels = future.result()
+        bnode_context.update(labels)
+        return quads
+
+    def results() -> Iterator[list[_ChunkQuadType]]:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # at most two chunks per worker are in flight, so that parsed
+            # chunks do not pile up while they are added one by one
+            futures: deque[Future] = deque()
+            for chunk_start, chunk_end in ranges():
+                futures.append(
+                    executor.submit(
+                        _parse_chunk,
+                        parser_class,
+                        path,
+                        chunk_start,
+                        chunk_end,
+                        prefix,
+                        snapshot,
+                        skolemize,
+                    )
+                )
+                if len(futures) >= 2 * workers:
+                    yield result(futures.popleft())
+            while futures:
+                yield result(futures.popleft())
+
+    return results()
+
+
 class NTParser(Parser):
     """Parser for the N-Triples format, often stored with the .nt extension.
 
@@ -369,8 +636,28 @@ class NTParser(Parser):
         Args:
             source: The source of NT-formatted data
             sink: Where to send parsed triples
-            **kwargs: Additional arguments to pass to `W3CNTriplesParser.parse`
+            **kwargs: Additional arguments to pass to `W3CNTriplesParser.parse`.
+                If `workers` is greater than 1 and the source is a file on
+                disk, the file is split on line boundaries and the chunks
+                are parsed by that many processes.
         """
+        workers = kwargs.pop("workers", None)
+        if workers is not None and workers > 1:
+            bnode_context = kwargs.get("bnode_context")
+            if bnode_context is None:
+                bnode_context = {}
+            chunks = _parse_parallel(
+                W3CNTriplesParser,
+                source.getByteStream(),
+                workers,
+                bnode_context,
+                kwargs.get("skolemize", False),
+            )
+            if chunks is not None:
+                for quads in chunks:
+                    sink.addN((s, p, o, sink) for s, p, o, _ in quads)
+                return
+
         f: Union[TextIO, IO[bytes], codecs.StreamReader]
         f = source.getCharacterStream()  # type: ignore[assignment]
         if not f:
@@ -3,12 +3,13 @@ from __future__ import annotations
 import warnings
 from typing import IO, Any
 
+from rdflib.compare import canonical_nquads
 from rdflib.graph import DATASET_DEFAULT_GRAPH_ID, ConjunctiveGraph, Graph
 from rdflib.plugins.serializers.nt import _quoteLiteral
 from rdflib.serializer import Serializer
 from rdflib.term import Literal
 
-__all__ = ["NQuadsSerializer"]
+__all__ = ["NQuadsSerializer", "CanonicalNQuadsSerializer"]
 
 
 class NQuadsSerializer(Serializer):
@@ -46,6 +47,27 @@ class NQuadsSerializer(Serializer):
         stream.write("\n".encode("latin-1"))
 
 
+class CanonicalNQuadsSerializer(Serializer):
+    """Canonical N-Quads serializer, with the blank nodes labelled by
+    RDFC-1.0 so that isomorphic graphs are serialized the same."""
+
+    def serialize(
+        self,
+        stream: IO[bytes],
+        base: str | None = None,
+        encoding: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if base is not None:
+            warnings.warn("CanonicalNQuadsSerializer does not support base.")
+        if encoding is not None and encoding.lower() != self.encoding.lower():
+            warnings.warn(
+                "CanonicalNQuadsSerializer does not use custom encoding. "
+                f"Given encoding was: {encoding}"
+            )
+        stream.write(canonical_nquads(self.store).encode(self.encoding))
+
+
 def _nq_row(triple, context):
     graph_name = context.n3() if context and context != DATASET_DEFAULT_GRAPH_ID else ""
     if isinstance(triple[2], Literal):
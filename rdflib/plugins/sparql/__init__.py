@@ -18,6 +18,43 @@ named graphs (like RDFLib's ConjunctiveGraph)
 """
 
 
+SPARQL_ITERATIVE_BGP = False
+"""
+If True, basic graph patterns are evaluated by an iterative engine that
+keeps intermediate bindings in flat lists, rather than recursively with a
+new QueryContext per matching triple. This is faster for BGPs with many
+triple patterns.
+
+This can also be set per query, with the `iterativeBGP` keyword argument
+of [`Graph.query`][rdflib.graph.Graph.query].
+"""
+
+
+SPARQL_MAX_ROWS_IN_MEMORY = None
+"""
+If set to a number of solutions, ORDER BY and DISTINCT hold at most that
+many solutions in memory. Above it, ORDER BY writes sorted runs of
+solutions to temporary files and merges them, and DISTINCT keeps the
+solutions it has seen in a temporary database on disk. GROUP BY with only COUNT, SUM, AVG,
+MIN, MAX and SAMPLE aggregates keeps at most that many groups in memory,
+and writes the solutions of further groups to temporary files. If None,
+everything is kept in memory. It must be at least 1.
+"""
+
+
+SPARQL_QUERY_CACHE_SIZE = 128
+"""
+The number of translated queries kept by
+[`SPARQLProcessor.query`][rdflib.plugins.sparql.processor.SPARQLProcessor.query],
+keyed by the query string, initNs and base, so that a query string that
+is evaluated again is not parsed and translated again. The least recently
+used queries are dropped first. Set to 0 to disable the cache.
+
+See [`queryCacheInfo`][rdflib.plugins.sparql.processor.queryCacheInfo] and
+[`clearQueryCache`][rdflib.plugins.sparql.processor.clearQueryCache].
+"""
+
+
 CUSTOM_EVALS = {}
 """
 Custom evaluation functions
@@ -31,7 +68,13 @@ PLUGIN_ENTRY_POINT = "rdf.plugins.sparqleval"
 
 
 from . import operators, parser, parserutils
-from .processor import prepareQuery, prepareUpdate, processUpdate
+from .processor import (
+    clearQueryCache,
+    prepareQuery,
+    prepareUpdate,
+    processUpdate,
+    queryCacheInfo,
+)
 
 assert parser
 assert operators
@@ -50,6 +93,8 @@ else:
         CUSTOM_EVALS[ep.name] = ep.load()
 
 __all__ = [
+    "clearQueryCache",
+    "queryCacheInfo",
     "prepareQuery",
     "prepareUpdate",
     "processUpdate",
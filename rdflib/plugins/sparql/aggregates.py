@@ -14,7 +14,7 @@ from typing import (
 
 from rdflib.namespace import XSD
 from rdflib.plugins.sparql.datatypes import type_promotion
-from rdflib.plugins.sparql.evalutils import _eval, _val
+from rdflib.plugins.sparql.evalutils import _compileEval, _eval, _val
 from rdflib.plugins.sparql.operators import numeric
 from rdflib.plugins.sparql.parserutils import CompValue
 from rdflib.plugins.sparql.sparql import FrozenBindings, NotBoundError, SPARQLTypeError
@@ -303,3 +303,184 @@ class Aggregator:
         for acc in self.accumulators.values():
             acc.set_value(self.bindings)
         return self.bindings
+
+
+class CompactAggregator:
+    """
+    Aggregates COUNT, SUM, AVG, MIN, MAX and SAMPLE for many groups
+
+    The state of a group is a flat list of slots, created by `new`, instead
+    of an Aggregator holding an Accumulator per aggregate. The values are
+    the same as those of Aggregator.
+    """
+
+    # the aggregates that do not need a set of seen values for DISTINCT
+    _any = ("Aggregate_Sample", "Aggregate_Min", "Aggregate_Max")
+    _plain = ("Aggregate_Count", "Aggregate_Sum", "Aggregate_Avg")
+
+    @classmethod
+    def supports(cls, aggregations: list[CompValue]) -> bool:
+        return all(
+            a.name in cls._any or (a.name in cls._plain and not a.distinct)
+            for a in aggregations
+        )
+
+    def __init__(self, aggregations: list[CompValue]):
+        self.initial: list[Any] = []
+        self.updates: list[Callable[[list[Any], FrozenBindings], None]] = []
+        self.results: list[Callable[[list[Any], dict[Variable, Any]], None]] = []
+        for a in aggregations:
+            i = len(self.initial)
+            self.slot_builders[a.name](self, i, a.res, a.vars)
+
+    def new(self) -> list[Any]:
+        """the state of a group without rows"""
+        return self.initial[:]
+
+    def update(self, state: list[Any], row: FrozenBindings) -> None:
+        for update in self.updates:
+            update(state, row)
+
+    def get_bindings(self, state: list[Any]) -> Mapping[Variable, Identifier]:
+        bindings: dict[Variable, Any] = {}
+        for result in self.results:
+            result(state, bindings)
+        return bindings
+
+    def _count(self, i: int, var: Variable, expr: Any) -> None:
+        self.initial.append(0)
+
+        if expr == "*":
+
+            def update(state: list[Any], row: FrozenBindings) -> None:
+                state[i] += 1
+
+        else:
+            ev = _compileEval(expr)
+
+            def update(state: list[Any], row: FrozenBindings) -> None:
+                try:
+                    ev(row)
+                except NotBoundError:
+                    return
+                state[i] += 1
+
+        def result(state: list[Any], bindings: dict[Variable, Any]) -> None:
+            bindings[var] = Literal(state[i])
+
+        self.updates.append(update)
+        self.results.append(result)
+
+    def _sum(self, i: int, var: Variable, expr: Any) -> None:
+        # value, datatype
+        self.initial.extend((0, None))
+        ev = _compileEval(expr)
+
+        def update(state: list[Any], row: FrozenBindings) -> None:
+            try:
+                value = ev(row)
+                dt = state[i + 1]
+                if dt is None:
+                    dt = value.datatype
+                else:
+                    dt = type_promotion(dt, value.datatype)
+                state[i + 1] = dt
+                state[i] = sum(type_safe_numbers(state[i], numeric(value)))
+            except NotBoundError:
+                pass
+
+        def result(state: list[Any], bindings: dict[Variable, Any]) -> None:
+            bindings[var] = Literal(state[i], datatype=state[i + 1])
+
+        self.updates.append(update)
+        self.results.append(result)
+
+    def _avg(self, i: int, var: Variable, expr: Any) -> None:
+        # sum, count, datatype
+        self.initial.extend((0, 0, None))
+        ev = _compileEval(expr)
+
+        def update(state: list[Any], row: FrozenBindings) -> None:
+            try:
+                value = ev(row)
+                dt = state[i + 2]
+                state[i] = sum(type_safe_numbers(state[i], numeric(value)))
+                if dt is None:
+                    dt = value.datatype
+                else:
+                    dt = type_promotion(dt, value.datatype)
+                state[i + 2] = dt
+                state[i + 1] += 1
+            except NotBoundError:
+                pass
+            except SPARQLTypeError:
+                pass
+
+        def result(state: list[Any], bindings: dict[Variable, Any]) -> None:
+            total, count, dt = state[i : i + 3]
+            if count == 0:
+                bindings[var] = Literal(0)
+            elif dt in (XSD.float, XSD.double):
+                bindings[var] = Literal(total / count)
+            else:
+                bindings[var] = Literal(Decimal(total) / Decimal(count))
+
+        self.updates.append(update)
+        self.results.append(result)
+
+    def _extremum(self, i: int, var: Variable, expr: Any, compare: Callable) -> None:
+        self.initial.append(None)
+        ev = _compileEval(expr)
+
+        def update(state: list[Any], row: FrozenBindings) -> None:
+            try:
+                if state[i] is None:
+                    state[i] = ev(row)
+                else:
+                    state[i] = compare(state[i], ev(row), key=_val)
+            except NotBoundError:
+                pass
+            except SPARQLTypeError:
+                pass
+
+        def result(state: list[Any], bindings: dict[Variable, Any]) -> None:
+            if state[i] is not None:
+                bindings[var] = Literal(state[i])
+
+        self.updates.append(update)
+        self.results.append(result)
+
+    def _min(self, i: int, var: Variable, expr: Any) -> None:
+        self._extremum(i, var, expr, min)
+
+    def _max(self, i: int, var: Variable, expr: Any) -> None:
+        self._extremum(i, var, expr, max)
+
+    def _sample(self, i: int, var: Variable, expr: Any) -> None:
+        # value, whether it is set
+        self.initial.extend((None, False))
+        ev = _compileEval(expr)
+
+        def update(state: list[Any], row: FrozenBindings) -> None:
+            if state[i + 1]:
+                return
+            try:
+                state[i] = ev(row)
+                state[i + 1] = True
+            except NotBoundError:
+                pass
+
+        def result(state: list[Any], bindings: dict[Variable, Any]) -> None:
+            bindings[var] = state[i]
+
+        self.updates.append(update)
+        self.results.append(result)
+
+    slot_builders = {
+        "Aggregate_Count": _count,
+        "Aggregate_Sample": _sample,
+        "Aggregate_Sum": _sum,
+        "Aggregate_Avg": _avg,
+        "Aggregate_Min": _min,
+        "Aggregate_Max": _max,
+    }
@@ -111,14 +111,63 @@ def _knownTerms(
     )
 
 
+def _estimateCardinality(
+    triple: tuple[Identifier, Identifier, Identifier],
+    varsknown: set[typing.Union[BNode, Variable]],
+    statistics: Callable[[Identifier | None], tuple[int, int, int] | None],
+) -> float:
+    """
+    Estimate how many triples the pattern matches once the variables in
+    varsknown are bound, assuming values are spread evenly over the
+    distinct subjects and objects of its predicate
+    """
+    s, p, o = triple
+    stats = statistics(p) if isinstance(p, URIRef) else None
+    if stats is None:
+        stats = statistics(None)
+    if stats is None:
+        return 0.0
+    count, subjects, objects = stats
+    estimate = float(count)
+    if not isinstance(s, (Variable, BNode)) or s in varsknown:
+        estimate /= max(subjects, 1)
+    if not isinstance(o, (Variable, BNode)) or o in varsknown:
+        estimate /= max(objects, 1)
+    return estimate
+
+
 def reorderTriples(
-    l_: Iterable[tuple[Identifier, Identifier, Identifier]]
+    l_: Iterable[tuple[Identifier, Identifier, Identifier]],
+    statistics: (
+        Callable[[Identifier | None], tuple[int, int, int] | None] | None
+    ) = None,
+    varsknown: Iterable[typing.Union[BNode, Variable]] = (),
 ) -> list[tuple[Identifier, Identifier, Identifier]]:
     """
     Reorder triple patterns so that we execute the
     ones with most bindings first
+
+    If statistics, a store's
+    [`predicate_statistics`][rdflib.store.Store.predicate_statistics], is
+    given, the pattern with the lowest estimated cardinality is executed
+    first instead, taking into account the variables bound by the patterns
+    before it and the ones in varsknown.
     """
 
+    if statistics is not None:
+        remaining = list(l_)
+        known = set(varsknown)
+        ordered = []
+        while remaining:
+            i = min(
+                range(len(remaining)),
+                key=lambda j: _estimateCardinality(remaining[j], known, statistics),
+            )
+            t = remaining.pop(i)
+            ordered.append(t)
+            known.update(x for x in t if isinstance(x, (Variable, BNode)))
+        return ordered
+
     def _addvar(term: str, varsknown: set[typing.Union[Variable, BNode]]):
         if isinstance(term, (Variable, BNode)):
             varsknown.add(term)
@@ -746,9 +795,11 @@ def translate(q: CompValue) -> tuple[CompValue | None, list[Variable]]:
             offset = q.limitoffset.offset.toPython()
 
         if q.limitoffset.limit is not None:
-            M = CompValue(
-                "Slice", p=M, start=offset, length=q.limitoffset.limit.toPython()
-            )
+            limit = q.limitoffset.limit.toPython()
+            if M.name == "Project" and M.p.name == "OrderBy":
+                # only the first offset + limit rows have to be sorted
+                M.p["limit"] = offset + limit
+            M = CompValue("Slice", p=M, start=offset, length=limit)
         else:
             M = CompValue("Slice", p=M, start=offset)
 
@@ -15,10 +15,13 @@ also return a dict of list of dicts
 
 from __future__ import annotations
 
+import heapq
 import itertools
+import operator
 import re
+import sqlite3
 from collections import defaultdict, deque
-from collections.abc import Generator, Iterable, Mapping
+from collections.abc import Generator, Iterable, Iterator, Mapping
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,16 +34,24 @@ from pyparsing import ParseException
 
 from rdflib.graph import Graph
 from rdflib.plugins.sparql import CUSTOM_EVALS, parser
-from rdflib.plugins.sparql.aggregates import Aggregator
+from rdflib.plugins.sparql.aggregates import Aggregator, CompactAggregator
+from rdflib.plugins.sparql.algebra import reorderTriples
 from rdflib.plugins.sparql.evalutils import (
+    _compileEbv,
+    _compileEval,
     _ebv,
     _eval,
+    _externalSort,
     _fillTemplate,
+    _hashJoin,
     _join,
+    _mergeJoin,
     _minus,
-    _val,
+    _orderKey,
+    _rowKey,
+    _SpillFile,
 )
-from rdflib.plugins.sparql.parserutils import CompValue, value
+from rdflib.plugins.sparql.parserutils import CompValue
 from rdflib.plugins.sparql.sparql import (
     AlreadyBound,
     FrozenBindings,
@@ -111,14 +122,113 @@ def evalBGP(
             yield x
 
 
+def evalBGPIterative(
+    ctx: QueryContext, bgp: list[_Triple]
+) -> Generator[FrozenBindings, None, None]:
+    """
+    A basic graph pattern, evaluated without recursion
+
+    Gives the same solutions as evalBGP, but keeps the variables bound
+    by the patterns in a flat list indexed by slot instead of pushing a new
+    QueryContext for every matching triple, and only creates
+    FrozenBindings for complete solutions.
+    """
+
+    if not bgp:
+        yield ctx.solution()
+        return
+
+    # For each term of each pattern: (0, term) for a constant or a
+    # variable bound in ctx, (1, slot) for a variable bound by an earlier
+    # pattern, (2, slot) for a variable this pattern binds and (3, slot)
+    # for a variable this pattern binds in an earlier position.
+    slots: dict[Identifier, int] = {}
+    plan: list[list[tuple[int, Any]]] = []
+    for triple in bgp:
+        bound_here: set[int] = set()
+        terms = []
+        for term in triple:
+            value = ctx[term]
+            if value is not None:
+                terms.append((0, value))
+            elif term in slots:
+                slot = slots[term]
+                terms.append((3 if slot in bound_here else 1, slot))
+            else:
+                slot = slots[term] = len(slots)
+                bound_here.add(slot)
+                terms.append((2, slot))
+        plan.append(terms)
+
+    graph = ctx.graph
+    solution = list(ctx.bindings.items())
+    variables = list(slots)
+    out = ctx.push()
+    row: list[Any] = [None] * len(slots)
+    last = len(plan) - 1
+
+    def lookup(terms: list[tuple[int, Any]]) -> Iterator[_Triple]:
+        # type error: Item "None" of "Optional[Graph]" has no attribute "triples"
+        return graph.triples(  # type: ignore[union-attr]
+            tuple(  # type: ignore[arg-type]
+                x if kind == 0 else row[x] if kind == 1 else None for kind, x in terms
+            )
+        )
+
+    iterators = [lookup(plan[0])]
+    while iterators:
+        depth = len(iterators) - 1
+        terms = plan[depth]
+        for triple in iterators[depth]:
+            for (kind, x), value in zip(terms, triple):
+                if kind == 2:
+                    row[x] = value
+                elif kind == 3 and row[x] != value:
+                    break
+            else:
+                if depth == last:
+                    yield FrozenBindings(
+                        out, itertools.chain(solution, zip(variables, row))
+                    )
+                else:
+                    iterators.append(lookup(plan[depth + 1]))
+                    break
+        else:
+            iterators.pop()
+
+
+def _orderBGP(ctx: QueryContext, triples: list[_Triple]) -> list[_Triple]:
+    """
+    Order the triple patterns of a BGP by the estimated number of matches,
+    if the store keeps statistics, otherwise by the number of bound nodes
+    in the current ctx
+    """
+    store = ctx.graph.store if ctx.graph is not None else None
+    if store is not None and store.predicate_statistics() is not None:
+        varsknown = set(
+            n
+            for t in triples
+            for n in t
+            if isinstance(n, (Variable, BNode)) and ctx[n] is not None
+        )
+        return reorderTriples(triples, store.predicate_statistics, varsknown)
+
+    # Do patterns with more bound nodes first
+    return sorted(triples, key=lambda t: len([n for n in t if ctx[n] is None]))
+
+
 def evalExtend(
     ctx: QueryContext, extend: CompValue
 ) -> Generator[FrozenBindings, None, None]:
     # TODO: Deal with dict returned from evalPart from GROUP BY
 
+    if extend._compiled is None:
+        extend._compiled = _compileEval(extend.expr)
+    evaluate = extend._compiled
+
     for c in evalPart(ctx, extend.p):
         try:
-            e = _eval(extend.expr, c.forget(ctx, _except=extend._vars))
+            e = evaluate(c.forget(ctx, _except=extend._vars))
             if isinstance(e, SPARQLError):
                 raise e
 
@@ -147,12 +257,161 @@ def evalJoin(ctx: QueryContext, join: CompValue) -> Generator[FrozenDict, None,
     # TODO: Deal with dict returned from evalPart from GROUP BY
     # only ever for join.p1
 
+    for values, part in ((join.p1, join.p2), (join.p2, join.p1)):
+        if _partValues(values) and part.name == "BGP":
+            res = _evalValuesBGP(ctx, values, part)
+            if res is not None:
+                return res
+
     if join.lazy:
         return evalLazyJoin(ctx, join)
-    else:
-        a = evalPart(ctx, join.p1)
-        b = set(evalPart(ctx, join.p2))
-        return _join(a, b)
+
+    joinvars = _joinVars(join.p1, join.p2)
+    sortvar = _sortedOn(join.p1)
+    if sortvar is not None and sortvar in joinvars and sortvar == _sortedOn(join.p2):
+        return _mergeJoin(evalPart(ctx, join.p1), evalPart(ctx, join.p2), sortvar)
+
+    a = evalPart(ctx, join.p1)
+    b = set(evalPart(ctx, join.p2))
+    return _hashJoin(a, b, joinvars)
+
+
+def _partValues(part: CompValue) -> bool:
+    """
+    If part is the inline data of a VALUES block
+    """
+    return (
+        part.name == "ToMultiSet"
+        and isinstance(part.p, CompValue)
+        and part.p.name == "values"
+    )
+
+
+def _partVars(part: CompValue) -> set[Variable] | None:
+    if _partValues(part):
+        # translation does not record _vars for inline data
+        return set(v for row in part.p.res for v in row)
+    return part._vars
+
+
+def _evalValuesBGP(
+    ctx: QueryContext, values: CompValue, bgp: CompValue
+) -> Generator[FrozenBindings, None, None] | None:
+    """
+    Join the solutions of a VALUES block with a BGP by looking up all the
+    values of one of its variables in a pattern of the BGP at once, with
+    triples_choices, instead of evaluating the BGP for each solution or
+    whole
+
+    None if no variable the VALUES binds in all its solutions appears once
+    in a pattern of the BGP, or if custom evaluation functions could give
+    other solutions for the BGP.
+    """
+    if CUSTOM_EVALS:
+        return None
+    rows = list(evalValues(ctx, values))
+    candidates = [
+        v
+        for v in (rows[0] if rows else ())
+        if ctx[v] is None and all(v in row for row in rows)
+    ]
+
+    # the pattern with the most bound terms, counting the variable
+    best: tuple[int, Variable, _Triple] | None = None
+    for triple in bgp.triples:
+        if not all(isinstance(t, Identifier) for t in triple):
+            # a path
+            continue
+        for v in candidates:
+            if triple.count(v) != 1:
+                continue
+            bound = sum(1 for t in triple if t == v or ctx[t] is not None)
+            if best is None or bound > best[0]:
+                best = bound, v, triple
+    if best is None:
+        return None
+    _, var, triple = best
+
+    byValue: dict[Identifier, list[FrozenBindings]] = defaultdict(list)
+    for row in rows:
+        byValue[row[var]].append(row)
+    rest = list(bgp.triples)
+    rest.remove(triple)
+    return _joinValuesBGP(ctx, var, triple, byValue, rest)
+
+
+def _joinValuesBGP(
+    ctx: QueryContext,
+    var: Variable,
+    triple: _Triple,
+    byValue: dict[Identifier, list[FrozenBindings]],
+    rest: list[_Triple],
+) -> Generator[FrozenBindings, None, None]:
+    position = triple.index(var)
+    pattern = tuple(list(byValue) if t == var else ctx[t] for t in triple)
+    unbound = [i for i, t in enumerate(triple) if ctx[t] is None]
+    evalRest = evalBGPIterative if ctx.iterativeBGP else evalBGP
+
+    # type error: Item "None" of "Optional[Graph]" has no attribute "triples_choices"
+    matches = ctx.graph.triples_choices(pattern)  # type: ignore[union-attr, arg-type]
+
+    if not rest:
+        # the solutions are the rows with the terms of the match
+        for match in matches:
+            bindings: dict[Identifier, Identifier] = {}
+            for i in unbound:
+                if bindings.setdefault(triple[i], match[i]) != match[i]:
+                    break
+            else:
+                for row in byValue[match[position]]:
+                    if row.compatible(bindings):
+                        yield row.merge(bindings)
+        return
+
+    for match in matches:
+        c = ctx.push()
+        try:
+            for i in unbound:
+                c[triple[i]] = match[i]
+        except AlreadyBound:
+            continue
+        for solution in evalRest(c, _orderBGP(c, rest)):
+            for row in byValue[match[position]]:
+                if row.compatible(solution):
+                    yield solution.merge(row)
+
+
+def _joinVars(p1: CompValue, p2: CompValue) -> list[Variable]:
+    """
+    The variables that both parts may bind
+    """
+    vars1 = _partVars(p1)
+    vars2 = _partVars(p2)
+    if vars1 is None or vars2 is None:
+        return []
+    return sorted(vars1 & vars2)
+
+
+def _sortedOn(part: CompValue) -> Variable | None:
+    """
+    If the solutions of part come out sorted ascending on a variable,
+    i.e. part is an ORDER BY on that variable, possibly wrapped in
+    order-preserving parts, return the variable
+    """
+    while isinstance(part, CompValue):
+        if part.name == "OrderBy":
+            cond = part.expr[0]
+            if isinstance(cond.expr, Variable) and cond.order != "DESC":
+                return cond.expr
+            return None
+        elif part.name == "Project":
+            var = _sortedOn(part.p)
+            return var if var in part.PV else None
+        elif part.name in ("ToMultiSet", "Distinct", "Reduced", "Slice", "Filter"):
+            part = part.p
+        else:
+            return None
+    return None
 
 
 def evalUnion(ctx: QueryContext, union: CompValue) -> list[Any]:
@@ -198,12 +457,13 @@ def evalLeftJoin(
 def evalFilter(
     ctx: QueryContext, part: CompValue
 ) -> Generator[FrozenBindings, None, None]:
+    if part._compiled is None:
+        part._compiled = _compileEbv(part.expr)
+    ebv = part._compiled
+
     # TODO: Deal with dict returned from evalPart!
     for c in evalPart(ctx, part.p):
-        if _ebv(
-            part.expr,
-            c.forget(ctx, _except=part._vars) if not part.no_isolated_scope else c,
-        ):
+        if ebv(c.forget(ctx, _except=part._vars) if not part.no_isolated_scope else c):
             yield c
 
 
@@ -273,13 +533,9 @@ def evalPart(ctx: QueryContext, part: CompValue) -> Any:
             pass  # the given custome-function did not handle this part
 
     if part.name == "BGP":
-        # Reorder triples patterns by number of bound nodes in the current ctx
-        # Do patterns with more bound nodes first
-        triples = sorted(
-            part.triples, key=lambda t: len([n for n in t if ctx[n] is None])
-        )
-
-        return evalBGP(ctx, triples)
+        if ctx.iterativeBGP:
+            return evalBGPIterative(ctx, _orderBGP(ctx, part.triples))
+        return evalBGP(ctx, _orderBGP(ctx, part.triples))
     elif part.name == "Filter":
         return evalFilter(ctx, part)
     elif part.name == "Join":
@@ -453,10 +709,24 @@ def evalAggregateJoin(
     ctx: QueryContext, agg: CompValue
 ) -> Generator[FrozenBindings, None, None]:
     # import pdb ; pdb.set_trace()
+    pattern = _countPattern(ctx, agg)
+    if pattern is not None:
+        # type error: Item "None" of "Optional[Graph]" has no attribute "count"
+        n = Literal(ctx.graph.count(pattern))  # type: ignore[union-attr]
+        yield FrozenBindings(ctx, {a.res: n for a in agg.A})
+        return
+
     p = evalPart(ctx, agg.p)
     # p is always a Group, we always get a dict back
 
     group_expr = agg.p.expr
+
+    if CompactAggregator.supports(agg.A):
+        yield from _evalCompactAggregate(
+            ctx, CompactAggregator(agg.A), group_expr, p, ctx.maxRowsInMemory
+        )
+        return
+
     res: dict[Any, Any] = defaultdict(lambda: Aggregator(aggregations=agg.A))
 
     if group_expr is None:
@@ -480,18 +750,131 @@ def evalAggregateJoin(
         yield FrozenBindings(ctx)
 
 
+# the number of temporary files groups are spilled to, at each level
+_PARTITIONS = 16
+
+
+def _countPattern(ctx: QueryContext, agg: CompValue) -> tuple[Any, Any, Any] | None:
+    """
+    The triple pattern of an aggregation that only counts the matches of a
+    single triple pattern, like `SELECT (COUNT(*) AS ?n) { ?s a :Person }`,
+    which the graph can count without the solutions being enumerated
+
+    None for other aggregations, or if custom evaluation functions could
+    give other solutions for the pattern.
+    """
+    group = agg.p
+    if group.expr is not None or group.p.name != "BGP" or CUSTOM_EVALS:
+        return None
+    if len(group.p.triples) != 1:
+        return None
+    triple = group.p.triples[0]
+    unbound = [t for t in triple if ctx[t] is None]
+    if len(set(unbound)) != len(unbound):
+        # a variable repeated in the pattern must match the same term
+        return None
+    for a in agg.A:
+        if a.name != "Aggregate_Count" or a.distinct:
+            return None
+        if a.vars != "*" and a.vars not in triple:
+            return None
+    return ctx[triple[0]], ctx[triple[1]], ctx[triple[2]]
+
+
+def _evalCompactAggregate(
+    ctx: QueryContext,
+    aggregator: CompactAggregator,
+    group_expr: list[Any] | None,
+    rows: Iterable[FrozenBindings],
+    size: int | None,
+    depth: int = 0,
+) -> Generator[FrozenBindings, None, None]:
+    """
+    Aggregate rows with a CompactAggregator, holding the state of at most
+    size groups (and at least one) in memory
+
+    Rows of further groups are partitioned by the hash of their group key
+    into temporary files, which are aggregated in turn.
+    """
+    if group_expr is None:
+        state = aggregator.new()
+        for row in rows:
+            aggregator.update(state, row)
+        yield FrozenBindings(ctx, aggregator.get_bindings(state))
+        return
+
+    extractors = [_compileEval(e, False) for e in group_expr]
+    groups: dict[tuple[Any, ...], list[Any]] = {}
+    partitions: list[_SpillFile] = []
+    for row in rows:
+        k = tuple([f(row) for f in extractors])
+        state = groups.get(k)
+        if state is None:
+            # at least one group is kept, so each partition gets smaller
+            if size is not None and len(groups) >= max(size, 1):
+                if not partitions:
+                    partitions = [_SpillFile() for _ in range(_PARTITIONS)]
+                partitions[hash((depth, k)) % _PARTITIONS].append(tuple(row.items()))
+                continue
+            state = groups[k] = aggregator.new()
+        aggregator.update(state, row)
+
+    # there were no matches
+    if not groups and depth == 0:
+        yield FrozenBindings(ctx)
+
+    for state in groups.values():
+        yield FrozenBindings(ctx, aggregator.get_bindings(state))
+    del groups
+
+    for partition in partitions:
+        yield from _evalCompactAggregate(
+            ctx,
+            aggregator,
+            group_expr,
+            (FrozenBindings(ctx, items) for items in partition.rows()),
+            size,
+            depth + 1,
+        )
+
+
 def evalOrderBy(
     ctx: QueryContext, part: CompValue
 ) -> Generator[FrozenBindings, None, None]:
     res = evalPart(ctx, part.p)
+    key = _orderKey(part.expr)
+
+    if part.limit is not None:
+        # only the first rows are used, see translate in algebra.py
+        return heapq.nsmallest(part.limit, res, key=key)
+
+    size = _maxRowsInMemory(ctx)
+    if size is not None:
+        res = iter(res)
+        rows = list(itertools.islice(res, size + 1))
+        if len(rows) > size:
+            return _spillOrderBy(ctx, itertools.chain(rows, res), key, size)
+        res = rows
 
-    for e in reversed(part.expr):
-        reverse = bool(e.order and e.order == "DESC")
-        res = sorted(
-            res, key=lambda x: _val(value(x, e.expr, variables=True)), reverse=reverse
+    return sorted(res, key=key)
+
+
+def _maxRowsInMemory(ctx: QueryContext) -> int | None:
+    """The row budget for sorting and DISTINCT, which must be at least 1"""
+    size = ctx.maxRowsInMemory
+    if size is not None and size < 1:
+        raise ValueError(
+            "SPARQL_MAX_ROWS_IN_MEMORY must be None or at least 1, not %r" % size
         )
+    return size
 
-    return res
+
+def _spillOrderBy(
+    ctx: QueryContext, res: Iterable[FrozenBindings], key, size: int
+) -> Generator[FrozenBindings, None, None]:
+    rows = ((key(x), tuple(x.items())) for x in res)
+    for _, items in _externalSort(rows, operator.itemgetter(0), size):
+        yield FrozenBindings(ctx, items)
 
 
 def evalSlice(ctx: QueryContext, slice: CompValue):
@@ -547,13 +930,57 @@ def evalReduced(
 def evalDistinct(
     ctx: QueryContext, part: CompValue
 ) -> Generator[FrozenBindings, None, None]:
-    res = evalPart(ctx, part.p)
+    res = iter(evalPart(ctx, part.p))
+    size = _maxRowsInMemory(ctx)
 
     done = set()
     for x in res:
         if x not in done:
             yield x
             done.add(x)
+            if size is not None and len(done) > size:
+                yield from _spillDistinct(done, res, size)
+                return
+
+
+def _spillDistinct(
+    done: set[FrozenBindings],
+    res: Iterable[FrozenBindings],
+    size: int,
+) -> Generator[FrozenBindings, None, None]:
+    """
+    The solutions of res that are not in done, nor before them in res, as
+    they come, holding at most size solutions in memory
+
+    The keys of the solutions seen are kept in a temporary SQLite database,
+    which is on disk, and the latest solutions seen in memory as well, to
+    look up fewer of them in the database.
+    """
+    db = sqlite3.connect("")
+    try:
+        db.execute("CREATE TABLE seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        db.executemany(
+            "INSERT INTO seen VALUES (?)", ((_distinctKey(x),) for x in done)
+        )
+        done.clear()
+        for x in res:
+            if x in done:
+                continue
+            inserted = db.execute(
+                "INSERT OR IGNORE INTO seen VALUES (?)", (_distinctKey(x),)
+            ).rowcount
+            if inserted:
+                yield x
+            if len(done) >= size:
+                done.clear()
+            done.add(x)
+    finally:
+        db.close()
+
+
+def _distinctKey(row: FrozenBindings) -> str:
+    """A string that is equal for equal solutions"""
+    return json.dumps(_rowKey(row))
 
 
 def evalProject(ctx: QueryContext, project: CompValue):
@@ -643,9 +1070,14 @@ def evalQuery(
     query: Query,
     initBindings: Mapping[str, Identifier] | None = None,
     base: str | None = None,
+    iterativeBGP: bool | None = None,
 ) -> Mapping[Any, Any]:
     """Evaluate a SPARQL query against a graph.
 
+    If iterativeBGP is given, it overrides
+    [`SPARQL_ITERATIVE_BGP`][rdflib.plugins.sparql.SPARQL_ITERATIVE_BGP]
+    for this query.
+
     !!! warning "Caution"
 
         This method can access indirectly requested network endpoints, for
@@ -668,5 +1100,7 @@ def evalQuery(
     )
 
     ctx.prologue = query.prologue
+    if iterativeBGP is not None:
+        ctx.iterativeBGP = iterativeBGP
 
     return evalPart(ctx, main)
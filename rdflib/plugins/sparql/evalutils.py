@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+import operator
+import pickle
+import re
+import tempfile
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, TypeVar, Union, overload
+from functools import reduce
+from typing import IO, TYPE_CHECKING, Any, Callable, TypeVar, Union, overload
 
-from rdflib.plugins.sparql.operators import EBV
-from rdflib.plugins.sparql.parserutils import CompValue, Expr
+from pyparsing import ParseResults
+
+from rdflib.plugins.sparql import operators
+from rdflib.plugins.sparql.operators import EBV, string
+from rdflib.plugins.sparql.parserutils import CompValue, Expr, value
 from rdflib.plugins.sparql.sparql import (
     FrozenBindings,
     FrozenDict,
@@ -15,7 +25,7 @@ from rdflib.plugins.sparql.sparql import (
 from rdflib.term import BNode, Identifier, Literal, URIRef, Variable
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable, Mapping
+    from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
 
     from typing_extensions import TypeAlias
 
@@ -25,13 +35,57 @@ _ContextType: TypeAlias = Union[FrozenBindings, QueryContext]
 _FrozenDictT = TypeVar("_FrozenDictT", bound=FrozenDict)
 
 
+class _Partitions:
+    """
+    Solutions grouped by their domain, for looking up the ones that share
+    variables with a given solution and agree with it on their values
+
+    Each group is indexed on the shared variables the first time a solution
+    with that combination of variables probes it.
+    """
+
+    def __init__(self, rows: Iterable[Mapping[Identifier, Identifier]]):
+        self.groups: defaultdict[frozenset, list] = defaultdict(list)
+        for y in rows:
+            self.groups[frozenset(y)].append(y)
+        self.domain: frozenset = frozenset().union(*self.groups)
+        self._indexes: dict[tuple[frozenset, frozenset], tuple[tuple, dict]] = {}
+
+    def candidates(
+        self, x: Mapping[Identifier, Identifier], disjoint: bool = False
+    ) -> Generator[Mapping[Identifier, Identifier], None, None]:
+        """
+        Yield the solutions that agree with x on all shared variables,
+        the ones not sharing any variables with x only if disjoint is True
+        """
+        for dom, rows in self.groups.items():
+            shared = dom.intersection(x)
+            if not shared:
+                if disjoint:
+                    yield from rows
+                continue
+            try:
+                vars, index = self._indexes[dom, shared]
+            except KeyError:
+                vars = tuple(sorted(shared))
+                index = defaultdict(list)
+                for y in rows:
+                    index[_joinKey(y, vars)].append(y)
+                self._indexes[dom, shared] = vars, index
+            yield from index.get(_joinKey(x, vars), ())
+
+
 def _diff(
     a: Iterable[_FrozenDictT], b: Iterable[_FrozenDictT], expr
 ) -> set[_FrozenDictT]:
     res = set()
+    parts = _Partitions(b)
 
     for x in a:
-        if all(not x.compatible(y) or not _ebv(expr, x.merge(y)) for y in b):
+        if all(
+            not x.compatible(y) or not _ebv(expr, x.merge(y))
+            for y in parts.candidates(x, disjoint=True)
+        ):
             res.add(x)
 
     return res
@@ -40,8 +94,12 @@ def _diff(
 def _minus(
     a: Iterable[_FrozenDictT], b: Iterable[_FrozenDictT]
 ) -> Generator[_FrozenDictT, None, None]:
+    parts = _Partitions(b)
     for x in a:
-        if all((not x.compatible(y)) or x.disjointDomain(y) for y in b):
+        if parts.domain.isdisjoint(x):
+            # no solution of b shares a variable with x
+            yield x
+        elif all(not x.compatible(y) for y in parts.candidates(x)):
             yield x
 
 
@@ -66,6 +124,127 @@ def _join(
                 yield x.merge(y)
 
 
+def _joinKey(row: Mapping[Identifier, Identifier], vars: Sequence[Variable]) -> tuple:
+    """
+    Return the values bound to vars in row, raise KeyError if any is unbound
+    """
+    return tuple([row[v] for v in vars])
+
+
+def _hashJoin(
+    a: Iterable[_FrozenDictT],
+    b: Iterable[Mapping[Identifier, Identifier]],
+    vars: Iterable[Variable],
+) -> Generator[_FrozenDictT, None, None]:
+    """
+    Join a and b by indexing b on the values of the shared variables vars
+
+    Rows of b that leave one of vars unbound are compatible with any value,
+    so they are checked against every row of a, as are rows of a that leave
+    one of vars unbound against all of b.
+    """
+    vars = list(vars)
+
+    rows = []
+    index: defaultdict[tuple, list] = defaultdict(list)
+    unbound = []
+    for y in b:
+        rows.append(y)
+        try:
+            index[_joinKey(y, vars)].append(y)
+        except KeyError:
+            unbound.append(y)
+
+    if not vars or len(unbound) == len(rows):
+        # nothing to index on
+        yield from _join(a, rows)
+        return
+
+    for x in a:
+        try:
+            k = _joinKey(x, vars)
+        except KeyError:
+            candidates: Iterable = rows
+        else:
+            candidates = itertools.chain(index.get(k, ()), unbound)
+        for y in candidates:
+            if x.compatible(y):
+                yield x.merge(y)
+
+
+def _sortKey(row: Mapping[Identifier, Identifier], var: Variable) -> tuple:
+    # the same key evalOrderBy sorts by
+    return _val(row.get(var, var))
+
+
+def _runs(
+    rows: Iterable[_FrozenDictT], var: Variable
+) -> Generator[tuple[tuple, list[_FrozenDictT]], None, None]:
+    """
+    Group rows sorted on var into runs of rows whose values for var sort equal
+    """
+    key = None
+    run: list[_FrozenDictT] = []
+    for row in rows:
+        k = _sortKey(row, var)
+        if run and (key < k or k < key):  # type: ignore[operator]
+            yield key, run
+            run = []
+        if not run:
+            key = k
+        run.append(row)
+    if run:
+        yield key, run
+
+
+def _mergeJoin(
+    a: Iterable[_FrozenDictT],
+    b: Iterable[_FrozenDictT],
+    var: Variable,
+) -> Generator[_FrozenDictT, None, None]:
+    """
+    Join a and b, both sorted ascending on the shared variable var,
+    the way evalOrderBy sorts them
+
+    Unbound values sort first, so the rows leaving var unbound are collected
+    up front and checked against all rows of the other side, the remaining
+    runs of equal values are merged in a single pass over both inputs.
+    """
+    runs_a = _runs(a, var)
+    runs_b = _runs(b, var)
+
+    def _next(runs):
+        for k, run in runs:
+            if k[0] == 0:  # var is unbound
+                return run, next(runs, None)
+            return [], (k, run)
+        return [], None
+
+    unbound_a, ra = _next(runs_a)
+    unbound_b, rb = _next(runs_b)
+    # evalJoin materialises b as a set
+    unbound_b = list(dict.fromkeys(unbound_b))
+
+    yield from _join(unbound_a, unbound_b)
+
+    while ra is not None or rb is not None:
+        if rb is None or (ra is not None and ra[0] < rb[0]):
+            _, run_a = ra  # type: ignore[misc]
+            yield from _join(run_a, unbound_b)
+            ra = next(runs_a, None)
+        elif ra is None or rb[0] < ra[0]:
+            _, run_b = rb
+            yield from _join(unbound_a, dict.fromkeys(run_b))
+            rb = next(runs_b, None)
+        else:
+            run_a = ra[1]
+            run_b = list(dict.fromkeys(rb[1]))
+            yield from _join(run_a, run_b + unbound_b)
+            yield from _join(unbound_a, run_b)
+            ra = next(runs_a, None)
+            rb = next(runs_b, None)
+
+
 def _ebv(expr: Literal | Variable | Expr, ctx: FrozenDict) -> bool:
     """
     Return true/false for the given expr
@@ -134,6 +313,220 @@ def _eval(
         raise Exception("Cannot eval thing: %s (%s)" % (expr, type(expr)))
 
 
+def _compileEval(
+    expr: Any, raise_not_bound_error: bool = True
+) -> Callable[[FrozenBindings], Any]:
+    """
+    Return a function evaluating expr for a row, like _eval(expr, row),
+    without deciding what kind of expression it is for every row
+    """
+    if isinstance(expr, (Literal, URIRef)):
+        return lambda row: expr
+    if isinstance(expr, Variable) and raise_not_bound_error:
+
+        def get(row: FrozenBindings) -> Any:
+            try:
+                return row[expr]
+            except KeyError:
+                raise NotBoundError("Variable %s is not bound" % expr)
+
+        return get
+    if isinstance(expr, Variable):
+        return lambda row: row.get(expr)
+    if isinstance(expr, Expr):
+        return _compileExpr(expr)
+    return lambda row: _eval(expr, row, raise_not_bound_error)
+
+
+def _compileEbv(expr: Literal | Variable | Expr) -> Callable[[FrozenDict], bool]:
+    """
+    Return a function giving _ebv(expr, row) for a row, evaluating Expr
+    trees with _compileExpr
+    """
+    if not isinstance(expr, Expr):
+        return lambda row: _ebv(expr, row)
+
+    f = _compileExpr(expr)
+
+    def ebv(row: FrozenDict) -> bool:
+        try:
+            return EBV(f(row))
+        except SPARQLError:
+            return False  # filter error == False
+
+    return ebv
+
+
+class _Evaluated:
+    """
+    Stands in for an Expr when calling its evaluation function, with the
+    values of its parameters evaluated already
+    """
+
+    __slots__ = ("name", "values")
+
+    def __init__(self, name: str, values: dict[str, Any]):
+        self.name = name
+        self.values = values
+
+    def __getattr__(self, a: str) -> Any:
+        return self.values.get(a)
+
+
+# Evaluation functions that get every parameter of their Expr, and always
+# get them before deciding on a result that is not an error. They may be
+# called with all parameters evaluated beforehand.
+_EAGER_EVALFNS = {
+    operators.RelationalExpression,
+    operators.ConditionalAndExpression,
+    operators.ConditionalOrExpression,
+    operators.AdditiveExpression,
+    operators.MultiplicativeExpression,
+    operators.UnaryNot,
+    operators.UnaryMinus,
+    operators.UnaryPlus,
+    operators.Builtin_IRI,
+    operators.Builtin_isBLANK,
+    operators.Builtin_isLITERAL,
+    operators.Builtin_isIRI,
+    operators.Builtin_isNUMERIC,
+    operators.Builtin_ABS,
+    operators.Builtin_CEIL,
+    operators.Builtin_FLOOR,
+    operators.Builtin_ROUND,
+    operators.Builtin_MD5,
+    operators.Builtin_SHA1,
+    operators.Builtin_SHA256,
+    operators.Builtin_SHA384,
+    operators.Builtin_SHA512,
+    operators.Builtin_REGEX,
+    operators.Builtin_REPLACE,
+    operators.Builtin_STRDT,
+    operators.Builtin_STRLANG,
+    operators.Builtin_CONCAT,
+    operators.Builtin_STRSTARTS,
+    operators.Builtin_STRENDS,
+    operators.Builtin_STRBEFORE,
+    operators.Builtin_STRAFTER,
+    operators.Builtin_CONTAINS,
+    operators.Builtin_ENCODE_FOR_URI,
+    operators.Builtin_SUBSTR,
+    operators.Builtin_STRLEN,
+    operators.Builtin_STR,
+    operators.Builtin_LCASE,
+    operators.Builtin_UCASE,
+    operators.Builtin_LANGMATCHES,
+    operators.Builtin_YEAR,
+    operators.Builtin_MONTH,
+    operators.Builtin_DAY,
+    operators.Builtin_HOURS,
+    operators.Builtin_MINUTES,
+    operators.Builtin_SECONDS,
+    operators.Builtin_TIMEZONE,
+    operators.Builtin_TZ,
+    operators.Builtin_LANG,
+    operators.Builtin_DATATYPE,
+    operators.Builtin_sameTerm,
+}
+
+_REGEX_FLAGS = {"i": re.IGNORECASE, "s": re.DOTALL, "m": re.MULTILINE}
+
+
+def _compileValue(val: Any) -> tuple[bool, Any]:
+    """
+    Compile a parameter of an Expr to (True, function) if
+    value(row, val) has to be evaluated for each row, otherwise to
+    (False, the value)
+    """
+    if isinstance(val, Expr):
+        return True, _compileExpr(val)
+    elif isinstance(val, CompValue):
+        return True, lambda row: value(row, val)
+    elif isinstance(val, list):
+        compiled = [_compileValue(x) for x in val]
+        if not any(dynamic for dynamic, _ in compiled):
+            return False, [x for _, x in compiled]
+        fs = [f if dynamic else (lambda row, x=f: x) for dynamic, f in compiled]
+        return True, lambda row: [f(row) for f in fs]
+    elif isinstance(val, (BNode, Variable)):
+
+        def get(row: FrozenDict) -> Any:
+            r = row.get(val)
+            if isinstance(r, SPARQLError):
+                raise r
+            if r is not None:
+                return r
+            raise NotBoundError
+
+        return True, get
+    elif isinstance(val, ParseResults) and len(val) == 1:
+        return _compileValue(val[0])
+    return False, val
+
+
+def _compileRegex(expr: Expr) -> Callable[[FrozenDict], Any] | None:
+    """REGEX with a constant pattern and flags, compiled once"""
+    dynamic, text = _compileValue(expr["text"])
+    pattern_dynamic, pattern = _compileValue(expr["pattern"])
+    flags_dynamic, flags = _compileValue(expr.get("flags") if "flags" in expr else None)
+    if not dynamic or pattern_dynamic or flags_dynamic:
+        return None
+    try:
+        cFlag = reduce(operator.or_, [_REGEX_FLAGS.get(f, 0) for f in flags or ""], 0)
+        regex = re.compile(str(string(pattern)), cFlag)
+    except (SPARQLError, re.error):
+        return None
+
+    def regexMatch(row: FrozenDict) -> Any:
+        try:
+            return Literal(bool(regex.search(string(text(row)))))
+        except SPARQLError as e:
+            return e
+
+    return regexMatch
+
+
+def _compileExpr(expr: Expr) -> Callable[[FrozenDict], Any]:
+    """
+    Compile an expression tree into a function giving expr.eval(row)
+
+    The parameters of the operators in _EAGER_EVALFNS are compiled
+    recursively, so they are evaluated without setting Expr.ctx and without
+    looking up how to evaluate each node again. Constant parameters are
+    evaluated once, and so are REGEX patterns. Other operators, and their
+    parameters, are evaluated by Expr.eval.
+    """
+    evalfn = getattr(expr._evalfn, "__func__", None)
+    if evalfn not in _EAGER_EVALFNS:
+        return expr.eval
+
+    if evalfn is operators.Builtin_REGEX:
+        regexMatch = _compileRegex(expr)
+        if regexMatch is not None:
+            return regexMatch
+
+    name = expr.name
+    constants: dict[str, Any] = {}
+    params: list[tuple[str, Callable[[FrozenDict], Any]]] = []
+    for k in list(expr.keys()):
+        dynamic, x = _compileValue(expr[k])
+        if dynamic:
+            params.append((k, x))
+        else:
+            constants[k] = x
+
+    def evaluate(row: FrozenDict) -> Any:
+        try:
+            values = constants.copy()
+            for k, f in params:
+                values[k] = f(row)
+            return evalfn(_Evaluated(name, values), row)
+        except SPARQLError as e:
+            return e
+
+    return evaluate
+
+
 def _filter(
     a: Iterable[FrozenDict], expr: Literal | Variable | Expr
 ) -> Generator[FrozenDict, None, None]:
@@ -182,3 +575,167 @@ def _val(v: _ValueT) -> tuple[int, _ValueT]:
         return (2, v)
     elif isinstance(v, Literal):
         return (3, v)
+
+
+class _OrderKey:
+    """
+    A compound sort key for ORDER BY conditions
+
+    Orders like sorting stably once per condition, from the last to the first:
+    a later condition only decides between rows that the earlier ones
+    consider neither smaller nor larger.
+    """
+
+    __slots__ = ("values", "desc")
+
+    def __init__(self, values: list[tuple[int, Any]], desc: list[bool]):
+        self.values = values
+        self.desc = desc
+
+    def __lt__(self, other: _OrderKey) -> bool:
+        for a, b, desc in zip(self.values, other.values, self.desc):
+            if desc:
+                a, b = b, a
+            if a < b:
+                return True
+            if b < a:
+                return False
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        # heapq compares keys for equality before ordering them
+        return not (self < other or other < self)  # type: ignore[operator]
+
+
+def _orderKey(conditions: list[CompValue]):
+    """
+    Return a function giving the sort key of a solution for the given
+    OrderCondition list
+    """
+    exprs = [c.expr for c in conditions]
+    desc = [c.order == "DESC" for c in conditions]
+    return lambda x: _OrderKey([_val(value(x, e, variables=True)) for e in exprs], desc)
+
+
+_T = TypeVar("_T")
+
+_SPILL_BATCH = 1000
+
+
+def _spill(rows: list[Any]) -> IO[bytes]:
+    """Pickle rows to a new temporary file, returned rewound"""
+    f = tempfile.TemporaryFile()
+    for i in range(0, len(rows), _SPILL_BATCH):
+        pickle.dump(rows[i : i + _SPILL_BATCH], f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+class _SpillFile:
+    """Rows appended to a temporary file in batches of pickled lists"""
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.batch: list[Any] = []
+
+    def append(self, row: Any) -> None:
+        self.batch.append(row)
+        if len(self.batch) >= _SPILL_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.batch:
+            pickle.dump(self.batch, self.file, pickle.HIGHEST_PROTOCOL)
+            self.batch = []
+
+    def rows(self) -> Generator[Any, None, None]:
+        """Read back the rows, closing the file at the end"""
+        self.flush()
+        self.file.seek(0)
+        return _unspill(self.file)
+
+
+def _unspill(f: IO[bytes]) -> Generator[Any, None, None]:
+    """Read back the rows written by _spill, closing the file at the end"""
+    with f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+# the most runs merged at once, each of which holds a file open and a batch
+# of rows in memory
+_MERGE_FAN_IN = 64
+
+
+def _mergeRuns(runs: list[IO[bytes]], key: Callable[[Any], Any]) -> IO[bytes]:
+    """Merge sorted runs into one, written to a new temporary file"""
+    if len(runs) == 1:
+        return runs[0]
+    merged = _SpillFile()
+    for row in heapq.merge(*map(_unspill, runs), key=key):
+        merged.append(row)
+    merged.flush()
+    merged.file.seek(0)
+    return merged.file
+
+
+def _externalSort(
+    rows: Iterable[_T], key: Callable[[_T], Any], size: int
+) -> Iterator[_T]:
+    """
+    Sort picklable rows, holding at most size of them in memory
+
+    Runs of size rows are sorted and written to temporary files, which are
+    then merged. No more than _MERGE_FAN_IN runs are merged at once: when
+    there are that many of the same level, they are merged into one of the
+    next level, and what is left is merged in passes. Like sorted, this is
+    stable.
+    """
+    it = iter(rows)
+    # levels[i] are the runs merged from _MERGE_FAN_IN ** i runs of size
+    # rows, those of higher levels coming from earlier rows
+    levels: list[list[IO[bytes]]] = []
+    while True:
+        run = list(itertools.islice(it, size))
+        if not run:
+            break
+        run.sort(key=key)
+        f = _spill(run)
+        del run
+        for level in itertools.count():
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(f)
+            if len(levels[level]) < _MERGE_FAN_IN:
+                break
+            f = _mergeRuns(levels[level], key)
+            levels[level] = []
+    runs = [f for level in reversed(levels) for f in level]
+    while len(runs) > _MERGE_FAN_IN:
+        runs = [
+            _mergeRuns(runs[i : i + _MERGE_FAN_IN], key)
+            for i in range(0, len(runs), _MERGE_FAN_IN)
+        ]
+    return heapq.merge(*map(_unspill, runs), key=key)
+
+
+def _termKey(term: Identifier | None) -> tuple[str, str, str, str]:
+    if isinstance(term, Literal):
+        # language tags are compared case-insensitively, as by Literal
+        language = term.language.lower() if term.language else ""
+        return ("Literal", str(term), language, term.datatype or "")
+    if term is None:
+        return ("", "", "", "")
+    return (type(term).__name__, str(term), "", "")
+
+
+def _rowKey(row: Mapping[Identifier, Identifier]) -> tuple:
+    """
+    A key for a solution that is totally ordered and equal for equal
+    solutions
+    """
+    return tuple(sorted((str(k), _termKey(v)) for k, v in row.items()))
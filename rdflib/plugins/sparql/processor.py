@@ -6,9 +6,12 @@ These should be automatically registered with RDFLib
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
-from typing import Any, Union
+from typing import Any, NamedTuple, Union
 
+import rdflib.plugins.sparql
 from rdflib.graph import Graph
 from rdflib.plugins.sparql.algebra import translateQuery, translateUpdate
 from rdflib.plugins.sparql.evaluate import evalQuery
@@ -65,6 +68,92 @@ def processUpdate(
     )
 
 
+class QueryCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _QueryCache:
+    """
+    The translated queries of SPARQLProcessor.query, least recently used
+    first, bounded by SPARQL_QUERY_CACHE_SIZE
+    """
+
+    def __init__(self):
+        self.queries: OrderedDict[Any, Query] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        queryString: str,
+        initNs: Mapping[str, Any] | None = None,
+        base: str | None = None,
+    ) -> Query:
+        maxsize = rdflib.plugins.sparql.SPARQL_QUERY_CACHE_SIZE
+        try:
+            key = (queryString, frozenset(initNs.items()) if initNs else None, base)
+            hash(key)
+        except TypeError:
+            # unhashable namespaces
+            maxsize = 0
+
+        if maxsize:
+            with self.lock:
+                query = self.queries.get(key)
+                if query is not None:
+                    self.queries.move_to_end(key)
+                    self.hits += 1
+                    return query
+
+        query = translateQuery(parseQuery(queryString), base, initNs)
+
+        with self.lock:
+            self.misses += 1
+            if maxsize:
+                self.queries[key] = query
+                while len(self.queries) > maxsize:
+                    self.queries.popitem(last=False)
+        return query
+
+    def info(self) -> QueryCacheInfo:
+        with self.lock:
+            return QueryCacheInfo(
+                self.hits,
+                self.misses,
+                rdflib.plugins.sparql.SPARQL_QUERY_CACHE_SIZE,
+                len(self.queries),
+            )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.queries.clear()
+            self.hits = self.misses = 0
+
+
+_query_cache = _QueryCache()
+
+
+def queryCacheInfo() -> QueryCacheInfo:
+    """
+    Return the hits, misses, maximum size and current size of the cache of
+    translated queries used by SPARQLProcessor.query, like the cache_info of
+    functools.lru_cache
+    """
+    return _query_cache.info()
+
+
+def clearQueryCache() -> None:
+    """
+    Clear the cache of translated queries used by SPARQLProcessor.query and
+    reset its statistics
+    """
+    _query_cache.clear()
+
+
 class SPARQLResult(Result):
     def __init__(self, res: Mapping[str, Any]):
         Result.__init__(self, res["type_"])
@@ -121,12 +210,20 @@ class SPARQLProcessor(Processor):
         initNs: Mapping[str, Any] | None = None,
         base: str | None = None,
         DEBUG: bool = False,
+        iterativeBGP: bool | None = None,
     ) -> Mapping[str, Any]:
         """
         Evaluate a query with the given initial bindings, and initial
         namespaces. The given base is used to resolve relative URIs in
         the query and will be overridden by any BASE given in the query.
 
+        Query strings are translated once and then taken from a cache, see
+        [`SPARQL_QUERY_CACHE_SIZE`][rdflib.plugins.sparql.SPARQL_QUERY_CACHE_SIZE].
+
+        If iterativeBGP is given, it selects whether basic graph patterns are
+        evaluated by the iterative engine for this query, see
+        [`SPARQL_ITERATIVE_BGP`][rdflib.plugins.sparql.SPARQL_ITERATIVE_BGP].
+
         !!! warning "Caution"
 
             This method can access indirectly requested network endpoints, for
@@ -142,6 +239,6 @@ class SPARQLProcessor(Processor):
         """
 
         if isinstance(strOrQuery, str):
-            strOrQuery = translateQuery(parseQuery(strOrQuery), base, initNs)
+            strOrQuery = _query_cache.get(strOrQuery, initNs, base)
 
-        return evalQuery(self.graph, strOrQuery, initBindings, base)
+        return evalQuery(self.graph, strOrQuery, initBindings, base, iterativeBGP)
@@ -71,7 +71,13 @@ class CSVResultSerializer(ResultSerializer):
         if result.type != "SELECT":
             raise Exception("CSVSerializer can only serialize select query results")
 
-    def serialize(self, stream: IO, encoding: str = "utf-8", **kwargs) -> None:
+    def serialize(
+        self,
+        stream: IO,
+        encoding: str = "utf-8",
+        stream_bindings: bool = False,
+        **kwargs,
+    ) -> None:
         # the serialiser writes bytes in the given encoding
         # in py3 csv.writer is unicode aware and writes STRINGS,
         # so we encode afterward
@@ -90,7 +96,7 @@ class CSVResultSerializer(ResultSerializer):
 
         vs = [self.serializeTerm(v, encoding) for v in self.result.vars]  # type: ignore[union-attr]
         out.writerow(vs)
-        for row in self.result.bindings:
+        for row in self.result._iterbindings(keep=not stream_bindings):
             out.writerow(
                 [self.serializeTerm(row.get(v), encoding) for v in self.result.vars]  # type: ignore[union-attr]
             )
@@ -10,8 +10,10 @@ Authors: Drew Perttula, Gunnar Aastrand Grimnes
 
 from __future__ import annotations
 
+import codecs
 import json
-from collections.abc import Mapping, MutableSequence
+from collections.abc import Callable, Iterator, Mapping, MutableSequence
+from itertools import chain
 from typing import IO, TYPE_CHECKING, Any
 
 from rdflib.query import Result, ResultException, ResultParser, ResultSerializer
@@ -34,7 +36,16 @@ class JSONResultParser(ResultParser):
     """Parses SPARQL JSON results into a Result object."""
 
     # type error: Signature of "parse" incompatible with supertype "ResultParser"
-    def parse(self, source: IO, content_type: str | None = None) -> Result:  # type: ignore[override]
+    def parse(  # type: ignore[override]
+        self, source: IO, content_type: str | None = None, stream: bool = False
+    ) -> Result:
+        """
+        If stream is True, the rows of a SELECT result are parsed while they
+        are iterated, reading the source incrementally, rather than parsing
+        the whole document up front.
+        """
+        if stream:
+            return _streamResult(source)
         inp = source.read()
         if _HAS_ORJSON:
             try:
@@ -48,6 +59,159 @@ class JSONResultParser(ResultParser):
         return JSONResult(loaded)
 
 
+class _JSONReader:
+    """
+    Reads JSON values one at a time from a source that is read in chunks
+    """
+
+    def __init__(self, source: IO, chunk_size: int = 65536):
+        self.read = getattr(source, "read1", source.read)
+        self.chunk_size = chunk_size
+        self.decoder = None
+        if isinstance(source.read(0), bytes):
+            self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self) -> bool:
+        """
+        Append the next chunk of the source to the buffer, returns False at
+        the end of the source
+        """
+        if self.eof:
+            return False
+        chunk = self.read(self.chunk_size)
+        if self.decoder is not None:
+            text = self.decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        self.buf = self.buf[self.pos :] + text
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+        return bool(text) or not self.eof
+
+    def peek(self) -> str:
+        """
+        The next character that is not whitespace
+        """
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                raise ResultException("Failed to parse result: unexpected end")
+
+    def next(self) -> str:
+        c = self.peek()
+        self.pos += 1
+        return c
+
+    def expect(self, c: str) -> None:
+        if self.next() != c:
+            raise ResultException(
+                f"Failed to parse result: expected {c!r} at {self.pos - 1}"
+            )
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                v, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.more():
+                    continue
+                raise ResultException(f"Failed to parse result: {e}")
+            # a number at the end of the buffer may go on in the next chunk
+            if end == len(self.buf) and self.more():
+                continue
+            self.pos = end
+            return v
+
+
+_decoder = json.JSONDecoder()
+
+
+def _events(reader: _JSONReader) -> Iterator[tuple[str, Any]]:
+    """
+    The top level members of a JSON result document as (key, value) pairs,
+    except for results, which give ("results", None) followed by one
+    ("binding", value) pair for each of its bindings
+    """
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "results" and reader.peek() == "{":
+            yield "results", None
+            reader.expect("{")
+            while reader.peek() != "}":
+                k = reader.value()
+                reader.expect(":")
+                if k == "bindings" and reader.peek() == "[":
+                    reader.expect("[")
+                    while reader.peek() != "]":
+                        yield "binding", reader.value()
+                        if reader.peek() == ",":
+                            reader.expect(",")
+                    reader.expect("]")
+                else:
+                    reader.value()
+                if reader.peek() == ",":
+                    reader.expect(",")
+            reader.expect("}")
+        else:
+            yield key, reader.value()
+        if reader.next() == "}":
+            return
+
+
+def _streamResult(source: IO) -> Result:
+    events = _events(_JSONReader(source))
+    head = None
+    select = False
+    # bindings that come before the head
+    early: list[dict[str, Any]] = []
+    for key, value in events:
+        if key == "head":
+            head = value
+            if select:
+                break
+        elif key == "boolean":
+            r = Result("ASK")
+            r.askAnswer = bool(value)
+            return r
+        elif key == "results":
+            select = True
+            if head is not None:
+                break
+        elif key == "binding":
+            early.append(value)
+
+    if not select:
+        raise ResultException("No boolean or results in json!")
+    if head is None:
+        raise ResultException("No head in json!")
+
+    r = Result("SELECT")
+    r.vars = [Variable(x) for x in head["vars"]]
+    r.bindings = _streamBindings(
+        chain(early, (value for key, value in events if key == "binding"))
+    )
+    return r
+
+
+def _streamBindings(
+    rows: Iterator[dict[str, Any]],
+) -> Iterator[Mapping[Variable, QueryResultValueType]]:
+    for row in rows:
+        yield {Variable(k): parseJsonTerm(v) for k, v in row.items()}
+
+
 class JSONResultSerializer(ResultSerializer):
     """Serializes SPARQL results to JSON format."""
 
@@ -55,42 +219,33 @@ class JSONResultSerializer(ResultSerializer):
         ResultSerializer.__init__(self, result)
 
     # type error: Signature of "serialize" incompatible with supertype "ResultSerializer"
-    def serialize(self, stream: IO, encoding: str = None) -> None:  # type: ignore[override]
+    def serialize(  # type: ignore[override]
+        self, stream: IO, encoding: str = None, stream_bindings: bool = False
+    ) -> None:
+        write = _writer(stream, encoding)
         res: dict[str, Any] = {}
         if self.result.type == "ASK":
             res["head"] = {}
             res["boolean"] = self.result.askAnswer
-        else:
-            # select
-            res["results"] = {}
-            res["head"] = {}
-            res["head"]["vars"] = self.result.vars
-            res["results"]["bindings"] = [
-                self._bindingToJSON(x) for x in self.result.bindings
-            ]
-        if _HAS_ORJSON:
-            try:
-                r_bytes = orjson.dumps(res, option=orjson.OPT_NON_STR_KEYS)
-            except Exception as e:
-                raise ResultException(f"Failed to serialize result: {e}")
-            if encoding is not None:
-                # Note, orjson will always write utf-8 even if
-                # encoding is specified as something else.
-                try:
-                    stream.write(r_bytes)
-                except (TypeError, ValueError):
-                    stream.write(r_bytes.decode("utf-8"))
-            else:
-                stream.write(r_bytes.decode("utf-8"))
-        else:
-            r_str = json.dumps(res, allow_nan=False, ensure_ascii=False)
-            if encoding is not None:
-                try:
-                    stream.write(r_str.encode(encoding))
-                except (TypeError, ValueError):
-                    stream.write(r_str)
-            else:
-                stream.write(r_str)
+            write(_dumps(res))
+            return
+        # select
+        res["results"] = {}
+        res["head"] = {}
+        res["head"]["vars"] = self.result.vars
+        res["results"]["bindings"] = []
+        # the bindings are written one at a time into the empty list, which
+        # comes first in the document, as they are produced, rather than
+        # dumping them all in one document
+        document = _dumps(res)
+        split = document.index(b"[]" if isinstance(document, bytes) else "[]") + 1
+        write(document[:split])
+        separator = b"," if isinstance(document, bytes) else ", "
+        for i, b in enumerate(self.result._iterbindings(keep=not stream_bindings)):
+            if i:
+                write(separator)
+            write(_dumps(self._bindingToJSON(b)))
+        write(document[split:])
 
     def _bindingToJSON(
         self, b: Mapping[Variable, QueryResultValueType]
@@ -104,6 +259,37 @@ class JSONResultSerializer(ResultSerializer):
         return res
 
 
+def _dumps(value: Any) -> bytes | str:
+    """JSON of a value, as UTF-8 bytes with orjson and as str without"""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except Exception as e:
+            raise ResultException(f"Failed to serialize result: {e}")
+    return json.dumps(value, allow_nan=False, ensure_ascii=False)
+
+
+def _writer(stream: IO, encoding: str | None) -> Callable[[bytes | str], None]:
+    """
+    A function that writes the JSON from `_dumps` to a stream, encoded if
+    an encoding is given and the stream takes bytes. orjson always gives
+    UTF-8, whatever the encoding.
+    """
+    text = encoding is None
+
+    def write(data: bytes | str) -> None:
+        nonlocal text
+        if not text:
+            try:
+                stream.write(data if isinstance(data, bytes) else data.encode(encoding))  # type: ignore[arg-type]
+                return
+            except (TypeError, ValueError):
+                text = True
+        stream.write(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+    return write
+
+
 class JSONResult(Result):
     def __init__(self, json: dict[str, Any]):
         self.json = json
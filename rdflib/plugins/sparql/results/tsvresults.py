@@ -7,6 +7,7 @@ It is implemented with pyparsing, reusing the elements from the SPARQL Parser
 from __future__ import annotations
 
 import codecs
+from collections.abc import Iterator
 from typing import IO, Union
 
 from pyparsing import (
@@ -68,7 +69,13 @@ class TSVResultParser(ResultParser):
     """Parses SPARQL TSV results into a Result object."""
 
     # type error: Signature of "parse" incompatible with supertype "ResultParser"  [override]
-    def parse(self, source: IO, content_type: str | None = None) -> Result:  # type: ignore[override]
+    def parse(  # type: ignore[override]
+        self, source: IO, content_type: str | None = None, stream: bool = False
+    ) -> Result:
+        """
+        If stream is True, the rows are parsed while they are iterated,
+        reading the source line by line, rather than all up front.
+        """
         if isinstance(source.read(0), bytes):
             # if reading from source returns bytes do utf-8 decoding
             # type error: Incompatible types in assignment (expression has type "StreamReader", variable has type "IO[Any]")
@@ -79,7 +86,13 @@ class TSVResultParser(ResultParser):
         header = source.readline()
 
         r.vars = list(HEADER.parse_string(header.strip(), parse_all=True))
-        r.bindings = []
+        rows = self._parseRows(source, r.vars)
+        r.bindings = rows if stream else list(rows)
+        return r
+
+    def _parseRows(
+        self, source: IO, vars_: list[Variable]
+    ) -> Iterator[dict[Variable, IdentifiedNode | RDFLiteral]]:
         while True:
             line = source.readline()
             if not line:
@@ -90,15 +103,14 @@ class TSVResultParser(ResultParser):
 
             row = ROW.parse_string(line, parse_all=True)
             this_row_dict: dict[Variable, IdentifiedNode | RDFLiteral] = {}
-            for var, val_read in zip(r.vars, row):
+            for var, val_read in zip(vars_, row):
                 val = self.convertTerm(val_read)
                 if val is None:
                     # Skip unbound vars
                     continue
                 this_row_dict[var] = val
             if len(this_row_dict) > 0:
-                r.bindings.append(this_row_dict)
-        return r
+                yield this_row_dict
 
     def convertTerm(
         self, t: Union[object, RDFLiteral, BNode, CompValue, URIRef]
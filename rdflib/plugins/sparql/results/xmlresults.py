@@ -12,8 +12,7 @@ from __future__ import annotations
 
 import logging
 import xml.etree.ElementTree as xml_etree  # noqa: N813
-from collections.abc import Sequence
-from io import BytesIO
+from collections.abc import Iterator, Mapping, Sequence
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -48,10 +47,102 @@ class XMLResultParser(ResultParser):
     """A Parser for SPARQL results in XML."""
 
     # TODO FIXME: content_type should be a keyword only arg.
-    def parse(self, source: IO, content_type: str | None = None) -> Result:  # type: ignore[override]
+    def parse(  # type: ignore[override]
+        self, source: IO, content_type: str | None = None, stream: bool = False
+    ) -> Result:
+        """
+        If stream is True, the rows of a SELECT result are parsed while they
+        are iterated, reading the source incrementally, rather than parsing
+        the whole document up front.
+        """
+        if stream:
+            return _streamResult(source)
         return XMLResult(source)
 
 
+class _UTF8Reader:
+    """A text stream read as UTF-8 bytes, as much of it at a time as the
+    parser asks for"""
+
+    def __init__(self, source: TextIO):
+        self.source = source
+        self.buffer = b""
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            data = self.buffer + self.source.read().encode("utf-8")
+            self.buffer = b""
+            return data
+        while len(self.buffer) < size:
+            text = self.source.read(size)
+            if not text:
+                break
+            self.buffer += text.encode("utf-8")
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+def _streamResult(source: IO) -> Result:
+    parser_encoding: str | None = None
+    if hasattr(source, "encoding"):
+        parser_encoding = "utf-8"
+        source = _UTF8Reader(source)  # type: ignore[assignment]
+
+    if FOUND_LXML:
+        events = lxml_etree.iterparse(
+            source, events=("start", "end"), huge_tree=True, encoding=parser_encoding
+        )
+    else:
+        events = xml_etree.iterparse(
+            source,
+            events=("start", "end"),
+            parser=xml_etree.XMLParser(encoding=parser_encoding),
+        )
+
+    vars_ = []
+    for event, element in events:
+        if event == "start":
+            if element.tag == RESULTS_NS_ET + "results":
+                r = Result("SELECT")
+                r.vars = vars_
+                r.bindings = _streamBindings(events, element)
+                return r
+        elif element.tag == RESULTS_NS_ET + "variable":
+            vars_.append(Variable(element.get("name")))
+        elif element.tag == RESULTS_NS_ET + "boolean":
+            r = Result("ASK")
+            r.askAnswer = element.text.lower().strip() == "true"
+            return r
+
+    raise ResultException("No RDF result-bindings or boolean answer found!")
+
+
+def _streamBindings(
+    events: Iterator[tuple[str, Any]], results: xml_etree.Element
+) -> Iterator[Mapping[Variable, Identifier]]:
+    for event, element in events:
+        if event == "end" and element.tag == RESULTS_NS_ET + "result":
+            yield _parseResult(element)
+            # drop the parsed result from the tree
+            results.remove(element)
+
+
+def _parseResult(result: xml_etree.Element) -> dict[Variable, Identifier]:
+    r = {}
+    for binding in result:
+        if binding.tag != f"{RESULTS_NS_ET}binding":
+            # This is here because with lxml this also gets
+            # comments, not just elements. Also this should not
+            # operate on non "binding" elements.
+            continue
+        # type error: error: Argument 1 to "Variable" has incompatible type "Union[str, None, Any]"; expected "str"
+        # NOTE on type error: Element.get() can return None, and
+        # this will invariably fail if passed into Variable
+        # constructor as value
+        r[Variable(binding.get("name"))] = parseTerm(binding[0])  # type: ignore[arg-type] # FIXME
+    return r
+
+
 class XMLResult(Result):
     def __init__(self, source: IO, content_type: str | None = None):
         parser_encoding: str | None = None
@@ -59,8 +150,7 @@ class XMLResult(Result):
             if TYPE_CHECKING:
                 assert isinstance(source, TextIO)
             parser_encoding = "utf-8"
-            source_str = source.read()
-            source = BytesIO(source_str.encode(parser_encoding))
+            source = _UTF8Reader(source)  # type: ignore[assignment]
         else:
             if TYPE_CHECKING:
                 assert isinstance(source, BinaryIO)
@@ -95,19 +185,7 @@ class XMLResult(Result):
                     # not just elements. Also this should not operate on non
                     # "result" elements.
                     continue
-                r = {}
-                for binding in result:
-                    if binding.tag != f"{RESULTS_NS_ET}binding":
-                        # This is here because with lxml this also gets
-                        # comments, not just elements. Also this should not
-                        # operate on non "binding" elements.
-                        continue
-                    # type error: error: Argument 1 to "Variable" has incompatible type "Union[str, None, Any]"; expected "str"
-                    # NOTE on type error: Element.get() can return None, and
-                    # this will invariably fail if passed into Variable
-                    # constructor as value
-                    r[Variable(binding.get("name"))] = parseTerm(binding[0])  # type: ignore[arg-type] # FIXME
-                self.bindings.append(r)
+                self.bindings.append(_parseResult(result))
 
             self.vars = [
                 # type error: Argument 1 to "Variable" has incompatible type "Optional[str]"; expected "str"
@@ -157,7 +235,13 @@ class XMLResultSerializer(ResultSerializer):
     def __init__(self, result: Result):
         ResultSerializer.__init__(self, result)
 
-    def serialize(self, stream: IO, encoding: str = "utf-8", **kwargs: Any) -> None:
+    def serialize(
+        self,
+        stream: IO,
+        encoding: str = "utf-8",
+        stream_bindings: bool = False,
+        **kwargs: Any,
+    ) -> None:
         writer = SPARQLXMLWriter(stream, encoding)
         if self.result.type == "ASK":
             writer.write_header([])
@@ -167,7 +251,7 @@ class XMLResultSerializer(ResultSerializer):
             # type error: Argument 1 to "write_header" of "SPARQLXMLWriter" has incompatible type "Optional[List[Variable]]"; expected "Sequence[Variable]"
             writer.write_header(self.result.vars)  # type: ignore[arg-type]
             writer.write_results_header()
-            for b in self.result.bindings:
+            for b in self.result._iterbindings(keep=not stream_bindings):
                 writer.write_start_result()
                 for key, val in b.items():
                     writer.write_binding(key, val)
@@ -285,6 +285,10 @@ class QueryContext:
 
         self.prologue: Prologue | None = None
         self._now: datetime.datetime | None = None
+        self.iterativeBGP: bool = rdflib.plugins.sparql.SPARQL_ITERATIVE_BGP
+        self.maxRowsInMemory: int | None = (
+            rdflib.plugins.sparql.SPARQL_MAX_ROWS_IN_MEMORY
+        )
 
         self.bnodes: t.MutableMapping[Identifier, BNode] = collections.defaultdict(
             BNode
@@ -307,6 +311,8 @@ class QueryContext:
         r.prologue = self.prologue
         r.graph = self.graph
         r.bnodes = self.bnodes
+        r.iterativeBGP = self.iterativeBGP
+        r.maxRowsInMemory = self.maxRowsInMemory
         return r
 
     @property
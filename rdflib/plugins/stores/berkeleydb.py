@@ -248,6 +248,15 @@ class BerkeleyDB(Store):
         self.__i2k.set_flags(dbsetflags)
         self.__i2k.open("i2k", dbname, db.DB_RECNO, dbopenflags, dbmode)
 
+        # "triples^subjects^objects" counts keyed by predicate, and by "^" for
+        # all triples, see predicate_statistics
+        self.__stats = db.DB(db_env)
+        self.__stats.set_flags(dbsetflags)
+        self.__stats.open("stats", dbname, dbtype, dbopenflags, dbmode)
+        if self.__stats.get(b"^") is None:
+            # a store created before statistics were kept
+            self.__rebuild_stats()
+
         self.__needs_sync = False
         t = Thread(target=self.__sync_run)
         t.setDaemon(True)
@@ -288,6 +297,7 @@ class BerkeleyDB(Store):
             self.__prefix.sync()
             self.__i2k.sync()
             self.__k2i.sync()
+            self.__stats.sync()
 
     def close(self, commit_pending_transaction: bool = False) -> None:
         self.__open = False
@@ -299,6 +309,7 @@ class BerkeleyDB(Store):
         self.__prefix.close()
         self.__i2k.close()
         self.__k2i.close()
+        self.__stats.close()
         self.db_env.close()
 
     def add(
@@ -329,9 +340,8 @@ class BerkeleyDB(Store):
         if value is None:
             self.__contexts.put(bb(c), b"", txn=txn)
 
-            contexts_value = cspo.get(
-                bb("%s^%s^%s^%s^" % ("", s, p, o)), txn=txn
-            ) or "".encode("latin-1")
+            conjunctive_value = cspo.get(bb("%s^%s^%s^%s^" % ("", s, p, o)), txn=txn)
+            contexts_value = conjunctive_value or "".encode("latin-1")
             contexts = set(contexts_value.split("^".encode("latin-1")))
             contexts.add(bb(c))
             contexts_value = "^".encode("latin-1").join(contexts)
@@ -341,6 +351,8 @@ class BerkeleyDB(Store):
             cpos.put(bb("%s^%s^%s^%s^" % (c, p, o, s)), b"", txn=txn)
             cosp.put(bb("%s^%s^%s^%s^" % (c, o, s, p)), b"", txn=txn)
             if not quoted:
+                if conjunctive_value is None:
+                    self.__update_stats((bb(s), bb(p), bb(o)), 1, txn=txn)
                 cspo.put(bb("%s^%s^%s^%s^" % ("", s, p, o)), contexts_value, txn=txn)
                 cpos.put(bb("%s^%s^%s^%s^" % ("", p, o, s)), contexts_value, txn=txn)
                 cosp.put(bb("%s^%s^%s^%s^" % ("", o, s, p)), contexts_value, txn=txn)
@@ -356,12 +368,13 @@ class BerkeleyDB(Store):
     ) -> None:
         s, p, o = spo
         cspo, cpos, cosp = self.__indicies
-        contexts_value = cspo.get(
+        conjunctive_value = cspo.get(
             "^".encode("latin-1").join(
                 ["".encode("latin-1"), s, p, o, "".encode("latin-1")]
             ),
             txn=txn,
-        ) or "".encode("latin-1")
+        )
+        contexts_value = conjunctive_value or "".encode("latin-1")
         contexts = set(contexts_value.split("^".encode("latin-1")))
         contexts.discard(c)
         contexts_value = "^".encode("latin-1").join(contexts)
@@ -381,6 +394,8 @@ class BerkeleyDB(Store):
                         i.delete(_to_key((s, p, o), "".encode("latin-1")), txn=txn)
                     except db.DBNotFoundError:
                         pass  # TODO: is it okay to ignore these?
+                if conjunctive_value is not None:
+                    self.__update_stats((s, p, o), -1, txn=txn)
 
     # type error: Signature of "remove" incompatible with supertype "Store"
     def remove(  # type: ignore[override]
@@ -454,6 +469,8 @@ class BerkeleyDB(Store):
                                 # type error: Argument 1 has incompatible type "tuple[str, str, str]"; expected "tuple[bytes, bytes, bytes]"
                                 # type error: Argument 2 has incompatible type "str"; expected "bytes"
                                 i.delete(_to_key((s, p, o), c), txn=txn)  # type: ignore[arg-type]
+                        # type error: Argument 1 to "__update_stats" of "BerkeleyDB" has incompatible type "tuple[str, str, str]"; expected "tuple[bytes, bytes, bytes]"
+                        self.__update_stats((s, p, o), -1, txn=txn)  # type: ignore[arg-type]
                     else:
                         # type error: Argument 1 to "__remove" of "BerkeleyDB" has incompatible type "tuple[str, str, str]"; expected "tuple[bytes, bytes, bytes]"
                         # type error: Argument 2 to "__remove" of "BerkeleyDB" has incompatible type "str"; expected "bytes"
@@ -549,6 +566,92 @@ class BerkeleyDB(Store):
         cursor.close()
         return count
 
+    def predicate_statistics(
+        self, predicate: Node | None = None
+    ) -> tuple[int, int, int]:
+        assert self.__open, "The Store must be open."
+        if predicate is None:
+            key = "^".encode("latin-1")
+        else:
+            # look the term up without adding it to the term dictionary
+            key = self.__k2i.get(self._dumps(predicate))
+            if key is None:
+                return 0, 0, 0
+        value = self.__stats.get(key)
+        if value is None:
+            return 0, 0, 0
+        triples, subjects, objects = value.split("^".encode("latin-1"))
+        return int(triples), int(subjects), int(objects)
+
+    def __has_prefix(self, index: db.DB, prefix: bytes, txn: Any | None = None) -> bool:
+        cursor = index.cursor(txn=txn)
+        try:
+            current = cursor.set_range(prefix)
+        except db.DBNotFoundError:
+            current = None
+        cursor.close()
+        return bool(current) and current[0].startswith(prefix)
+
+    def __update_stats(
+        self, spo: tuple[bytes, bytes, bytes], delta: int, txn: Any | None = None
+    ) -> None:
+        """update the statistics for a triple about to be added to (delta 1)
+        or just removed from (delta -1) the conjunctive indices"""
+        s, p, o = spo
+        cspo, cpos, cosp = self.__indicies
+        sep = "^".encode("latin-1")
+        empty = "".encode("latin-1")
+        # the triple is (or was) the only one for whatever is not in the indices
+        unique_sp = not self.__has_prefix(cspo, sep.join((empty, s, p, empty)), txn)
+        unique_s = unique_sp and not self.__has_prefix(
+            cspo, sep.join((empty, s, empty)), txn
+        )
+        unique_po = not self.__has_prefix(cpos, sep.join((empty, p, o, empty)), txn)
+        unique_o = unique_po and not self.__has_prefix(
+            cosp, sep.join((empty, o, empty)), txn
+        )
+        for key, subject_delta, object_delta in (
+            (p, unique_sp, unique_po),
+            (sep, unique_s, unique_o),
+        ):
+            value = self.__stats.get(key, txn=txn)
+            counts = [int(x) for x in value.split(sep)] if value else [0, 0, 0]
+            counts[0] += delta
+            counts[1] += delta * subject_delta
+            counts[2] += delta * object_delta
+            self.__stats.put(key, sep.join(b"%d" % x for x in counts), txn=txn)
+
+    def __rebuild_stats(self) -> None:
+        """count the statistics from the conjunctive index"""
+        sep = "^".encode("latin-1")
+        stats: dict[bytes, tuple[int, set[bytes], set[bytes]]] = {}
+        triples = 0
+        subjects: set[bytes] = set()
+        objects: set[bytes] = set()
+        cursor = self.__indicies[0].cursor()
+        try:
+            current = cursor.set_range(sep)
+        except db.DBNotFoundError:
+            current = None
+        while current:
+            key, value = current
+            if not key.startswith(sep):
+                break
+            _, s, p, o, _ = key.split(sep)
+            count, p_subjects, p_objects = stats.get(p, (0, set(), set()))
+            p_subjects.add(s)
+            p_objects.add(o)
+            stats[p] = (count + 1, p_subjects, p_objects)
+            triples += 1
+            subjects.add(s)
+            objects.add(o)
+            # Hack to stop 2to3 converting this to next(cursor)
+            current = getattr(cursor, "next")()
+        cursor.close()
+        for p, (count, p_subjects, p_objects) in stats.items():
+            self.__stats.put(p, b"%d^%d^%d" % (count, len(p_subjects), len(p_objects)))
+        self.__stats.put(sep, b"%d^%d^%d" % (triples, len(subjects), len(objects)))
+
     def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
         # NOTE on type error: this is because the variables are reused with
         # another type.
@@ -0,0 +1,531 @@
+"""
+A compact in memory store.
+
+Every term is mapped to an integer ID once, and the statements are kept as
+rows of IDs in four sorted permutations (subject-predicate-object-context,
+predicate-object-subject-context, object-subject-predicate-context and
+context-subject-predicate-object), each held in `array` columns, so a
+pattern with any bound positions is a binary search for a contiguous range
+of rows. New statements go to a small write buffer and removed ones to a set
+of deleted rows. When these grow beyond a quarter of the sorted rows, they
+are merged into new sorted columns.
+
+This takes several times less memory than
+[`Memory`][rdflib.plugins.stores.memory.Memory], which keeps nested
+dictionaries of terms, and gives the same results for `triples` and
+`contexts`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterable, Iterator
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from rdflib.store import Store
+from rdflib.util import _coalesce
+
+if TYPE_CHECKING:
+    from rdflib.graph import (
+        Graph,
+        _ContextType,
+        _TriplePatternType,
+        _TripleType,
+    )
+    from rdflib.term import Identifier, Node, URIRef
+
+__all__ = ["CompactMemory"]
+
+_IDS = "I"
+"""The array typecode of term IDs"""
+
+_BUFFER_SIZE = 4096
+"""The number of changes kept before they are merged into the sorted rows,
+if that is more than a quarter of the rows"""
+
+_CHUNK = 4096
+
+# the column order of each permutation, positions are subject, predicate,
+# object and context
+_SPOC = (0, 1, 2, 3)
+_POSC = (1, 2, 0, 3)
+_OSPC = (2, 0, 1, 3)
+_CSPO = (3, 0, 1, 2)
+_ORDERS = (_SPOC, _POSC, _OSPC, _CSPO)
+
+_IdTriple = tuple[int, int, int]
+_Quad = tuple[int, int, int, int]
+
+
+class CompactMemory(Store):
+    """An in memory store of dictionary-encoded, sorted statements.
+
+    It is Context-aware, Graph-aware and Formula-aware, like
+    [`Memory`][rdflib.plugins.stores.memory.Memory].
+
+    The context column of a row holds the ID of the context shifted left by
+    one, with the lowest bit set if the statement is quoted. The context ID
+    0 stands for statements added without a context.
+    """
+
+    context_aware = True
+    formula_aware = True
+    graph_aware = True
+
+    def __init__(
+        self,
+        configuration: str | None = None,
+        identifier: Identifier | None = None,
+    ):
+        super(CompactMemory, self).__init__(configuration)
+        self.identifier = identifier
+
+        # term dictionary, ID 0 is reserved for no context
+        self.__ids: dict[Node, int] = {}
+        self.__terms: list[Node | None] = [None]
+
+        # sorted rows, by column order
+        self.__rows: dict[tuple[int, ...], list[array]] = {
+            order: [array(_IDS) for _ in order] for order in _ORDERS
+        }
+        # rows that are removed but not yet merged
+        self.__deleted: set[_Quad] = set()
+        # statements that are added but not yet merged, by triple
+        self.__buffer: dict[_IdTriple, set[int]] = {}
+        # triples in the buffer, by subject, predicate and object
+        self.__bufferIndex: tuple[dict[int, set[_IdTriple]], ...] = ({}, {}, {})
+        # triples in the buffer, by context ID
+        self.__bufferContexts: dict[int, set[_IdTriple]] = {}
+        self.__bufferSize = 0
+        # number of running scans of the sorted rows, merges wait for them
+        self.__readers = 0
+
+        # number of triples by context ID, and in the default context
+        self.__contextLen: dict[int, int] = {}
+        self.__defaultLen = 0
+
+        self.__namespace: dict[str, URIRef] = {}
+        self.__prefix: dict[URIRef, str] = {}
+        self.__context_obj_map: dict[int, Graph] = {}
+        # all contexts used in store (unencoded)
+        self.__all_contexts: set[Graph] = set()
+
+    def add(
+        self,
+        triple: _TripleType,
+        context: _ContextType,
+        quoted: bool = False,
+    ) -> None:
+        """Add a triple to the store of triples."""
+        Store.add(self, triple, context, quoted=quoted)
+        if context is not None:
+            self.__all_contexts.add(context)
+
+        t = (self.__id(triple[0]), self.__id(triple[1]), self.__id(triple[2]))
+        cid = self.__ctx_to_id(context)
+        c = cid << 1 | bool(quoted)
+
+        cs = self.__find(t)
+        was_default = _is_default(cs)
+        if not quoted and c != 0 and 1 in cs:
+            # quoted without a context, asserting it makes that implied
+            self.__delete(t, 1)
+            cs.discard(1)
+            self.__contextLen[0] -= 1
+        if c not in cs:
+            if c ^ 1 in cs:
+                # the same context with the other quoted flag
+                self.__delete(t, c ^ 1)
+                cs.discard(c ^ 1)
+            else:
+                self.__contextLen[cid] = self.__contextLen.get(cid, 0) + 1
+            self.__insert(t, c)
+            cs.add(c)
+            if was_default and not _is_default(cs):
+                # quoted where it was asserted, it stays in the default context
+                self.__insert(t, 0)
+                cs.add(0)
+                self.__contextLen[0] = self.__contextLen.get(0, 0) + 1
+        self.__defaultLen += _is_default(cs) - was_default
+        self.__maybe_merge()
+
+    def remove(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> None:
+        Store.remove(self, triple_pattern, context)
+        pattern = self.__pattern(triple_pattern)
+        if pattern is None:
+            return
+        if context is None:
+            cid = None
+        else:
+            cid = self.__ctx_to_id(context, create=False)
+            if cid is None:
+                return
+
+        for t in list(self.__match(pattern, cid)):
+            cs = self.__find(t)
+            was_default = _is_default(cs)
+            if cid is None:
+                removed = cs
+            else:
+                removed = {c for c in cs if c >> 1 == cid}
+                rest = cs - removed
+                if {c for c in rest if not c & 1} == {0}:
+                    # only asserted without a context, which is removed from
+                    # the default graph too
+                    removed.add(0)
+            for c in removed:
+                self.__delete(t, c)
+                self.__contextLen[c >> 1] -= 1
+            self.__defaultLen += _is_default(cs - removed) - was_default
+        self.__maybe_merge()
+
+    def triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> Generator[
+        tuple[_TripleType, Generator[_ContextType | None, None, None]],
+        None,
+        None,
+    ]:
+        """A generator over all the triples matching"""
+        pattern = self.__pattern(triple_pattern)
+        if pattern is None:
+            return
+        if context is None:
+            cid = None
+        else:
+            cid = self.__ctx_to_id(context, create=False)
+            if cid is None:
+                return
+
+        terms = self.__terms
+        for t in self.__match(pattern, cid):
+            # type error: Incompatible types in "yield" (actual type "tuple[tuple[Node | None, Node | None, Node | None], ...]", expected type "tuple[tuple[IdentifiedNode, IdentifiedNode, Identifier], ...]")
+            yield (terms[t[0]], terms[t[1]], terms[t[2]]), self.__contexts(t)  # type: ignore[misc]
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        # should be identical to `Memory.bind`
+        bound_namespace = self.__namespace.get(prefix)
+        bound_prefix = _coalesce(
+            self.__prefix.get(namespace),
+            # type error: error: Argument 1 to "get" of "Mapping" has incompatible type "Optional[URIRef]"; expected "URIRef"
+            self.__prefix.get(bound_namespace),  # type: ignore[arg-type]
+        )
+        if override:
+            if bound_prefix is not None:
+                del self.__namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self.__prefix[bound_namespace]
+            self.__prefix[namespace] = prefix
+            self.__namespace[prefix] = namespace
+        else:
+            # type error: Invalid index type "Optional[URIRef]" for "dict[URIRef, str]"; expected type "URIRef"
+            self.__prefix[_coalesce(bound_namespace, namespace)] = _coalesce(  # type: ignore[index]
+                bound_prefix, default=prefix
+            )
+            # type error: Invalid index type "Optional[str]" for "dict[str, URIRef]"; expected type "str"
+            # type error: Incompatible types in assignment (expression has type "Optional[URIRef]", target has type "URIRef")
+            self.__namespace[_coalesce(bound_prefix, prefix)] = _coalesce(  # type: ignore[index]
+                bound_namespace, default=namespace
+            )
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self.__namespace.get(prefix, None)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self.__prefix.get(namespace, None)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        for prefix, namespace in self.__namespace.items():
+            yield prefix, namespace
+
+    def contexts(
+        self, triple: _TripleType | None = None
+    ) -> Generator[_ContextType, None, None]:
+        if triple is None or triple == (None, None, None):
+            return (context for context in list(self.__all_contexts))
+
+        t = self.__pattern(triple)
+        if t is None or not self.__find(t):  # type: ignore[arg-type]
+            return (_ for _ in [])
+        return self.__contexts(t)  # type: ignore[arg-type]
+
+    def __len__(self, context: _ContextType | None = None) -> int:
+        if context is None:
+            return self.__defaultLen
+        cid = self.__ctx_to_id(context, create=False)
+        return self.__contextLen.get(cid, 0)  # type: ignore[arg-type]
+
+    def add_graph(self, graph: Graph) -> None:
+        if not self.graph_aware:
+            Store.add_graph(self, graph)
+        else:
+            self.__all_contexts.add(graph)
+
+    def remove_graph(self, graph: Graph) -> None:
+        if not self.graph_aware:
+            Store.remove_graph(self, graph)
+        else:
+            self.remove((None, None, None), graph)
+            try:
+                self.__all_contexts.remove(graph)
+            except KeyError:
+                pass  # we didn't know this graph, no problem
+
+    # internal utility methods below
+    def __id(self, term: Node) -> int:
+        try:
+            return self.__ids[term]
+        except KeyError:
+            i = self.__ids[term] = len(self.__terms)
+            self.__terms.append(term)
+            return i
+
+    def __pattern(
+        self, triple_pattern: _TriplePatternType
+    ) -> tuple[int | None, int | None, int | None] | None:
+        """the IDs of the given terms, or None if a term is not in the
+        store"""
+        ids = self.__ids
+        pattern = []
+        for term in triple_pattern:
+            if term is None:
+                pattern.append(None)
+            else:
+                i = ids.get(term)
+                if i is None:
+                    return None
+                pattern.append(i)
+        return tuple(pattern)  # type: ignore[return-value]
+
+    def __ctx_to_id(self, ctx: _ContextType | None, create: bool = True) -> int | None:
+        if ctx is None:
+            return 0
+        try:
+            identifier = ctx.identifier
+        except AttributeError:
+            raise RuntimeError("Cannot use that type of object as a Graph context")
+        if create:
+            cid = self.__id(identifier)
+        else:
+            cid = self.__ids.get(identifier)
+            if cid is None:
+                return None
+        self.__context_obj_map[cid] = ctx
+        return cid
+
+    def __contexts(self, t: _IdTriple) -> Generator[_ContextType, None, None]:
+        """return a generator for all the non-quoted contexts
+        (dereferenced) the encoded triple appears in"""
+        for c in sorted(self.__find(t)):
+            if not c & 1 and c > 1:
+                yield self.__context_obj_map[c >> 1]
+
+    def __find(self, t: _IdTriple) -> set[int]:
+        """the context column values of the statements of the triple"""
+        cols = self.__rows[_SPOC]
+        lo, hi = _range(cols, t)
+        cs = set(cols[3][lo:hi])
+        if self.__deleted:
+            cs.difference_update(
+                [c for c in cs if (t[0], t[1], t[2], c) in self.__deleted]
+            )
+        buffered = self.__buffer.get(t)
+        if buffered:
+            cs.update(buffered)
+        return cs
+
+    def __insert(self, t: _IdTriple, c: int) -> None:
+        q = (t[0], t[1], t[2], c)
+        if q in self.__deleted:
+            # still in the sorted rows
+            self.__deleted.remove(q)
+            return
+        cs = self.__buffer.get(t)
+        if cs is None:
+            cs = self.__buffer[t] = set()
+            for index, i in zip(self.__bufferIndex, t):
+                try:
+                    index[i].add(t)
+                except KeyError:
+                    index[i] = {t}
+        cs.add(c)
+        try:
+            self.__bufferContexts[c >> 1].add(t)
+        except KeyError:
+            self.__bufferContexts[c >> 1] = {t}
+        self.__bufferSize += 1
+
+    def __delete(self, t: _IdTriple, c: int) -> None:
+        cs = self.__buffer.get(t)
+        if cs is None or c not in cs:
+            self.__deleted.add((t[0], t[1], t[2], c))
+            return
+        cs.remove(c)
+        self.__bufferSize -= 1
+        _discard(self.__bufferContexts, c >> 1, t)
+        if not cs:
+            del self.__buffer[t]
+            for index, i in zip(self.__bufferIndex, t):
+                _discard(index, i, t)
+
+    def __maybe_merge(self) -> None:
+        changes = self.__bufferSize + len(self.__deleted)
+        if (
+            self.__readers == 0
+            and changes > _BUFFER_SIZE
+            and changes > len(self.__rows[_SPOC][0]) >> 2
+        ):
+            self.__merge()
+
+    def __merge(self) -> None:
+        """merge the buffer and the deleted rows into the sorted rows"""
+        added = [(*t, c) for t, cs in self.__buffer.items() for c in cs]
+        for order in _ORDERS:
+            key = itemgetter(*order)
+            deleted = {key(q) for q in self.__deleted}
+            rows = sorted(map(key, added))
+            cols = self.__rows[order]
+            new = [array(_IDS) for _ in order]
+            i = 0
+            for start in range(0, len(cols[0]), _CHUNK):
+                chunk = list(zip(*(col[start : start + _CHUNK] for col in cols)))
+                # the added rows that sort before the end of the chunk
+                j = bisect_right(rows, chunk[-1], i)
+                if j > i:
+                    chunk += rows[i:j]
+                    chunk.sort()
+                    i = j
+                _extend(new, chunk, deleted)
+            _extend(new, rows[i:], deleted)
+            self.__rows[order] = new
+
+        self.__deleted = set()
+        self.__buffer = {}
+        self.__bufferIndex = ({}, {}, {})
+        self.__bufferContexts = {}
+        self.__bufferSize = 0
+
+    def __scan(
+        self, order: tuple[int, ...], prefix: Iterable[tuple[int, int]]
+    ) -> Iterator[_Quad]:
+        """the rows of a permutation within the given ranges of its leading
+        columns, as (subject, predicate, object, context)"""
+        cols = self.__rows[order]
+        lo, hi = _range(cols, prefix)
+        if lo == hi:
+            return
+        to_quad = itemgetter(*(order.index(i) for i in range(4)))
+        deleted = self.__deleted
+        self.__readers += 1
+        try:
+            for start in range(lo, hi, _CHUNK):
+                end = min(start + _CHUNK, hi)
+                for row in zip(*(col[start:end] for col in cols)):
+                    q = to_quad(row)
+                    if deleted and q in deleted:
+                        continue
+                    yield q
+        finally:
+            self.__readers -= 1
+
+    def __match(
+        self, pattern: tuple[int | None, int | None, int | None], cid: int | None
+    ) -> Iterator[_IdTriple]:
+        """the triples that match the pattern in the context with the given
+        ID, or in the default context if it is None"""
+        s, p, o = pattern
+        if s is not None:
+            if p is None and o is not None:
+                order, prefix = _OSPC, (o, s)
+            else:
+                order, prefix = _SPOC, pattern
+        elif p is not None:
+            order, prefix = _POSC, (p, o)
+        elif o is not None:
+            order, prefix = _OSPC, (o,)
+        elif cid is not None:
+            order, prefix = _CSPO, ()
+        else:
+            order, prefix = _SPOC, ()
+        ranges = [(i, i) for i in prefix if i is not None]
+        if cid is not None and len(ranges) == (3 if order != _CSPO else 0):
+            # the context column follows
+            ranges.append((cid << 1, cid << 1 | 1))
+
+        # statements in the buffer, by triple
+        buffered: dict[_IdTriple, set[int]] = {}
+        candidates: Iterable[_IdTriple] | None = None
+        for index, i in zip(self.__bufferIndex, pattern):
+            if i is not None:
+                found = index.get(i, ())
+                if candidates is None or len(found) < len(candidates):  # type: ignore[arg-type]
+                    candidates = found
+        if candidates is None:
+            if cid is None:
+                candidates = self.__buffer
+            else:
+                candidates = self.__bufferContexts.get(cid, ())
+        for t in candidates:
+            if all(i is None or i == j for i, j in zip(pattern, t)):
+                buffered[t] = self.__buffer[t]
+
+        rows = self.__scan(order, ranges)
+        if cid is not None:
+            for q in rows:
+                if q[3] >> 1 == cid:
+                    yield q[:3]
+            for t, cs in list(buffered.items()):
+                if any(c >> 1 == cid for c in cs):
+                    yield t
+            return
+
+        # the default context has the triples that are asserted in any
+        # context, and the rows of a triple are next to each other
+        for t, group in groupby(rows, itemgetter(0, 1, 2)):
+            cs = buffered.pop(t, None) or self.__buffer.get(t, ())
+            if _is_default(q[3] for q in group) or _is_default(cs):
+                yield t
+        for t, cs in list(buffered.items()):
+            if _is_default(cs):
+                yield t
+
+
+def _range(cols: list[array], prefix: Iterable[Any]) -> tuple[int, int]:
+    """the rows of sorted columns that start with the prefix, which holds
+    IDs or (low, high) ranges of IDs"""
+    lo, hi = 0, len(cols[0])
+    for col, i in zip(cols, prefix):
+        low, high = i if isinstance(i, tuple) else (i, i)
+        lo = bisect_left(col, low, lo, hi)
+        hi = bisect_right(col, high, lo, hi)
+    return lo, hi
+
+
+def _extend(cols: list[array], rows: list[tuple[int, ...]], deleted: set) -> None:
+    if deleted:
+        rows = [row for row in rows if row not in deleted]
+    for col, values in zip(cols, zip(*rows)):
+        col.extend(values)
+
+
+def _is_default(cs: Iterable[int]) -> bool:
+    """whether a triple with these context column values is in the default
+    context, that is asserted in some context or added without one"""
+    return any(not c & 1 or c == 1 for c in cs)
+
+
+def _discard(index: dict[int, set[_IdTriple]], i: int, t: _IdTriple) -> None:
+    ts = index.get(i)
+    if ts is not None:
+        ts.discard(t)
+        if not ts:
+            del index[i]
@@ -1,97 +1,502 @@
-from threading import Lock
+"""
+A wrapper that lets many threads share a store, and snapshots of it that
+keep giving the statements of a moment while the store changes.
 
+Any number of threads can read the store at once, and a thread writing to
+it waits until the reads in progress are done, while reads that start after
+a write is waiting wait for the write. The results of a read are gathered
+while the read is done, so a thread can iterate them, or write to the
+store, while other threads write.
 
-class ResponsibleGenerator:
-    """A generator that will help clean up when it is done being used."""
+A long read, like a SPARQL query, is made of many reads of the store and
+sees the writes made between them. A snapshot gives the statements of the
+store at the moment it was taken instead. It keeps the statements a write
+changes in the store as they were before the first write after the
+snapshot that changes them. Its reads cost more as more statements change.
 
-    __slots__ = ["cleanup", "gen"]
+```python
+>>> from rdflib import Dataset, Graph, URIRef
+>>> from rdflib.plugins.stores.concurrent import ConcurrentStore
+>>> store = ConcurrentStore()
+>>> g = Graph(store, identifier=URIRef("urn:example:g"))
+>>> _ = g.add((URIRef("urn:example:a"), URIRef("urn:example:p"), URIRef("urn:example:b")))
+>>> with store.snapshot() as snapshot:
+...     _ = g.remove((None, None, None))
+...     len(g), len(Graph(snapshot, identifier=URIRef("urn:example:g")))
+(0, 1)
 
-    def __init__(self, gen, cleanup):
-        self.cleanup = cleanup
-        self.gen = gen
+```
+"""
 
-    def __del__(self):
-        self.cleanup()
+from __future__ import annotations
 
-    def __iter__(self):
-        return self
+import threading
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Union
+from weakref import WeakSet
+
+from rdflib.graph import Graph, QuotedGraph
+from rdflib.store import Store
+
+if TYPE_CHECKING:
+    from rdflib.graph import (
+        _ContextType,
+        _PredicateType,
+        _QuadType,
+        _TriplePatternType,
+        _TripleType,
+    )
+    from rdflib.plugins.sparql.sparql import Query, Update
+    from rdflib.query import Result
+    from rdflib.term import Identifier, URIRef
+
+__all__ = ["ConcurrentStore", "ReadWriteLock", "Snapshot"]
+
+# the state of a statement: whether it is asserted, and the contexts it is
+# asserted in
+_StateType = tuple[bool, list["_ContextType"]]
+
+
+class ReadWriteLock:
+    """A lock that many threads can hold to read, or one thread to write.
+
+    Threads waiting to write go before threads that start waiting to read
+    after them. The thread holding the lock to write can also take it to
+    read or write again, and a thread holding it to read can take it to
+    read again, but not to write.
+    """
+
+    def __init__(self) -> None:
+        self.__condition = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__waiting_writers = 0
+        self.__writer: int | None = None
+        self.__writes = 0
+        self.__local = threading.local()
+
+    def acquire_read(self) -> None:
+        me = threading.get_ident()
+        reads = getattr(self.__local, "reads", 0)
+        with self.__condition:
+            if self.__writer != me and not reads:
+                while self.__writer is not None or self.__waiting_writers:
+                    self.__condition.wait()
+            self.__readers += 1
+        self.__local.reads = reads + 1
+
+    def release_read(self) -> None:
+        self.__local.reads -= 1
+        with self.__condition:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__condition.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self.__condition:
+            if self.__writer == me:
+                self.__writes += 1
+                return
+            if getattr(self.__local, "reads", 0):
+                raise RuntimeError("Can't write while holding the lock to read")
+            self.__waiting_writers += 1
+            try:
+                while self.__writer is not None or self.__readers:
+                    self.__condition.wait()
+            finally:
+                self.__waiting_writers -= 1
+            self.__writer = me
+            self.__writes = 1
+
+    def release_write(self) -> None:
+        with self.__condition:
+            self.__writes -= 1
+            if not self.__writes:
+                self.__writer = None
+                self.__condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Generator[None, None, None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Generator[None, None, None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentStore(Store):
+    """A store that many threads can read and write at once, wrapping
+    another store, by default a Memory store.
+
+    The events of the wrapped store are dispatched to the subscribers of
+    this one.
+    """
+
+    def __init__(self, store: Store | None = None):
+        super(ConcurrentStore, self).__init__()
+        if store is None:
+            from rdflib.plugins.stores.memory import Memory
+
+            store = Memory()
+        self.store = store
+        self.dispatcher = store.dispatcher
+        self.context_aware = store.context_aware
+        self.formula_aware = store.formula_aware
+        self.transaction_aware = store.transaction_aware
+        self.graph_aware = store.graph_aware
+        self.lock = ReadWriteLock()
+        self.__snapshots: WeakSet[Snapshot] = WeakSet()
+
+    def snapshot(self) -> Snapshot:
+        """A read only store of the statements of this store now"""
+        with self.lock.read():
+            snapshot = Snapshot(self, list(self.store.contexts()))
+            self.__snapshots.add(snapshot)
+        return snapshot
+
+    def _release(self, snapshot: Snapshot) -> None:
+        with self.lock.write():
+            self.__snapshots.discard(snapshot)
+
+    def _state(self, triple: _TripleType) -> _StateType:
+        """whether the triple is asserted, and its contexts"""
+        asserted = any(True for _ in self.store.triples(triple, None))
+        return asserted, list(self.store.contexts(triple))
+
+    def __changing(self, triples: Iterable[_TripleType]) -> None:
+        """keep the state of the triples a write is about to change for the
+        snapshots that do not have it yet"""
+        snapshots = list(self.__snapshots)
+        for triple in triples:
+            state = None
+            for snapshot in snapshots:
+                if triple not in snapshot._changed:
+                    if state is None:
+                        state = self._state(triple)
+                    snapshot._changed[triple] = state
+
+    def open(self, configuration: str, create: bool = False) -> int | None:
+        with self.lock.write():
+            return self.store.open(configuration, create)
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        with self.lock.write():
+            self.store.close(commit_pending_transaction=commit_pending_transaction)
+
+    def destroy(self, configuration: str) -> None:
+        with self.lock.write():
+            self.store.destroy(configuration)
+
+    def gc(self) -> None:
+        with self.lock.write():
+            self.store.gc()
+
+    def add(
+        self,
+        triple: _TripleType,
+        context: _ContextType,
+        quoted: bool = False,
+    ) -> None:
+        with self.lock.write():
+            if self.__snapshots:
+                self.__changing([triple])
+            self.store.add(triple, context, quoted)
+
+    def addN(self, quads: Iterable[_QuadType]) -> None:  # noqa: N802
+        with self.lock.write():
+            if self.__snapshots:
+                quads = list(quads)
+                self.__changing(dict.fromkeys((s, p, o) for s, p, o, _ in quads))
+            self.store.addN(quads)
+
+    @contextmanager
+    def bulk_load(self) -> Generator[None, None, None]:
+        """Holds the lock to write while the wrapped store loads"""
+        with self.lock.write():
+            with self.store.bulk_load():
+                yield
+
+    def remove(
+        self,
+        triple: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> None:
+        with self.lock.write():
+            if self.__snapshots:
+                self.__changing([t for t, _ in self.store.triples(triple, context)])
+            self.store.remove(triple, context)
+
+    def triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType | None]]]:
+        with self.lock.read():
+            matches = [
+                (triple, list(contexts))
+                for triple, contexts in self.store.triples(triple_pattern, context)
+            ]
+        return ((triple, iter(contexts)) for triple, contexts in matches)
 
-    def __next__(self):
-        return next(self.gen)
+    # type error: Signature of "triples_choices" incompatible with supertype "Store"
+    def triples_choices(  # type: ignore[override]
+        self,
+        triple: Any,
+        context: _ContextType | None = None,
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType | None]]]:
+        with self.lock.read():
+            matches = [
+                (t, list(contexts))
+                for t, contexts in self.store.triples_choices(triple, context)
+            ]
+        return ((t, iter(contexts)) for t, contexts in matches)
 
+    def __len__(self, context: _ContextType | None = None) -> int:
+        with self.lock.read():
+            return self.store.__len__(context)
 
-class ConcurrentStore:
-    """A store that allows concurrent reads and writes."""
+    def count(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> int:
+        with self.lock.read():
+            return self.store.count(triple_pattern, context)
 
-    def __init__(self, store):
+    def predicate_statistics(
+        self, predicate: _PredicateType | None = None
+    ) -> tuple[int, int, int] | None:
+        with self.lock.read():
+            return self.store.predicate_statistics(predicate)
+
+    def contexts(
+        self, triple: _TripleType | None = None
+    ) -> Generator[_ContextType, None, None]:
+        with self.lock.read():
+            contexts = list(self.store.contexts(triple))
+        return (context for context in contexts)
+
+    def query(
+        self,
+        query: Union[Query, str],
+        initNs: dict[str, Any],  # noqa: N803
+        initBindings: dict[Identifier, Identifier],  # noqa: N803
+        queryGraph: str,  # noqa: N803
+        **kwargs: Any,
+    ) -> Result:
+        with self.lock.read():
+            return self.store.query(query, initNs, initBindings, queryGraph, **kwargs)
+
+    def update(
+        self,
+        update: Union[Update, str],
+        initNs: dict[str, Any],  # noqa: N803
+        initBindings: dict[Identifier, Identifier],  # noqa: N803
+        queryGraph: str,  # noqa: N803
+        **kwargs: Any,
+    ) -> None:
+        with self.lock.write():
+            self.store.update(update, initNs, initBindings, queryGraph, **kwargs)
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        with self.lock.write():
+            self.store.bind(prefix, namespace, override=override)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        with self.lock.read():
+            return self.store.prefix(namespace)
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        with self.lock.read():
+            return self.store.namespace(prefix)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        with self.lock.read():
+            namespaces = list(self.store.namespaces())
+        return iter(namespaces)
+
+    def commit(self) -> None:
+        with self.lock.write():
+            self.store.commit()
+
+    def rollback(self) -> None:
+        """Rolls back the wrapped store. The statements this changes are
+        not kept for the snapshots."""
+        with self.lock.write():
+            self.store.rollback()
+
+    def add_graph(self, graph: Graph) -> None:
+        with self.lock.write():
+            self.store.add_graph(graph)
+
+    def remove_graph(self, graph: Graph) -> None:
+        with self.lock.write():
+            if self.__snapshots:
+                self.__changing(
+                    [t for t, _ in self.store.triples((None, None, None), graph)]
+                )
+            self.store.remove_graph(graph)
+
+
+class Snapshot(Store):
+    """The statements of a ConcurrentStore at the moment the snapshot was
+    taken, made with `ConcurrentStore.snapshot`.
+
+    The statements of a snapshot can't be changed, but empty graphs can be
+    added to it, as a Dataset does. A snapshot is released by `close` or by
+    using it as a context manager. Its namespace bindings, and the
+    statements of quoted graphs, are those of the store now.
+    """
+
+    def __init__(self, store: ConcurrentStore, contexts: list[_ContextType]):
+        super(Snapshot, self).__init__()
         self.store = store
+        self.context_aware = store.context_aware
+        self.formula_aware = store.formula_aware
+        self.graph_aware = store.graph_aware
+        self.__graphs: dict[Identifier, Graph] = {}
+        self.__contexts = [self.__graph(context) for context in contexts]
+        # the state of the statements changed since the snapshot was taken,
+        # before they were first changed
+        self._changed: dict[_TripleType, _StateType] = {}
+
+    def __graph(self, context: _ContextType) -> Graph:
+        """the context as a graph read from this snapshot"""
+        graph = self.__graphs.get(context.identifier)
+        if graph is None:
+            graph = self.__graphs[context.identifier] = Graph(
+                self, identifier=context.identifier
+            )
+        return graph
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        self.store._release(self)
+
+    def add(
+        self,
+        triple: _TripleType,
+        context: _ContextType,
+        quoted: bool = False,
+    ) -> None:
+        raise TypeError("A snapshot is read only")
+
+    def addN(self, quads: Iterable[_QuadType]) -> None:  # noqa: N802
+        raise TypeError("A snapshot is read only")
+
+    def remove(
+        self,
+        triple: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> None:
+        raise TypeError("A snapshot is read only")
+
+    def add_graph(self, graph: Graph) -> None:
+        """Adds an empty graph to the graphs of this snapshot, not of the
+        store"""
+        if all(c.identifier != graph.identifier for c in self.__contexts):
+            self.__contexts.append(self.__graph(graph))
+
+    def remove_graph(self, graph: Graph) -> None:
+        raise TypeError("A snapshot is read only")
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("A snapshot is read only")
 
-        # number of calls to visit still in progress
-        self.__visit_count = 0
-
-        # lock for locking down the indices
-        self.__lock = Lock()
-
-        # lists for keeping track of added and removed triples while
-        # we wait for the lock
-        self.__pending_removes = []
-        self.__pending_adds = []
-
-    def add(self, triple):
-        (s, p, o) = triple
-        if self.__visit_count == 0:
-            self.store.add((s, p, o))
-        else:
-            self.__pending_adds.append((s, p, o))
-
-    def remove(self, triple):
-        (s, p, o) = triple
-        if self.__visit_count == 0:
-            self.store.remove((s, p, o))
-        else:
-            self.__pending_removes.append((s, p, o))
-
-    def triples(self, triple):
-        (su, pr, ob) = triple
-        g = self.store.triples((su, pr, ob))
-        pending_removes = self.__pending_removes
-        self.__begin_read()
-        for s, p, o in ResponsibleGenerator(g, self.__end_read):
-            if not (s, p, o) in pending_removes:  # noqa: E713
-                yield s, p, o
-
-        for s, p, o in self.__pending_adds:
+    def triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType | None]]]:
+        store = self.store
+        if isinstance(context, QuotedGraph):
+            return store.triples(triple_pattern, context)
+        with store.lock.read():
+            changed = self._changed
+            matches: list[tuple[_TripleType, list[Any]]] = [
+                (triple, list(contexts))
+                for triple, contexts in store.store.triples(triple_pattern, context)
+                if triple not in changed
+            ]
+            for triple, (asserted, contexts) in self.__changed(triple_pattern):
+                if context is None and asserted:
+                    matches.append((triple, contexts))
+                elif context is not None and context in contexts:
+                    matches.append((triple, contexts))
+        return ((triple, iter(contexts)) for triple, contexts in matches)
+
+    def __changed(
+        self, triple_pattern: _TriplePatternType
+    ) -> Iterator[tuple[_TripleType, _StateType]]:
+        """the changed statements matching the pattern"""
+        if None not in triple_pattern:
+            state = self._changed.get(triple_pattern)  # type: ignore[arg-type]
+            if state is not None:
+                yield triple_pattern, state  # type: ignore[misc]
+            return
+        s, p, o = triple_pattern
+        for triple, state in self._changed.items():
             if (
-                (su is None or su == s)
-                and (pr is None or pr == p)
-                and (ob is None or ob == o)
+                (s is None or s == triple[0])
+                and (p is None or p == triple[1])
+                and (o is None or o == triple[2])
             ):
-                yield s, p, o
-
-    def __len__(self):
-        return self.store.__len__()
-
-    def __begin_read(self):
-        lock = self.__lock
-        lock.acquire()
-        self.__visit_count = self.__visit_count + 1
-        lock.release()
-
-    def __end_read(self):
-        lock = self.__lock
-        lock.acquire()
-        self.__visit_count = self.__visit_count - 1
-        if self.__visit_count == 0:
-            pending_removes = self.__pending_removes
-            while pending_removes:
-                (s, p, o) = pending_removes.pop()
-                try:
-                    self.store.remove((s, p, o))
-                except:  # noqa: E722
-                    # TODO: change to try finally?
-                    print(s, p, o, "Not in store to remove")
-            pending_adds = self.__pending_adds
-            while pending_adds:
-                (s, p, o) = pending_adds.pop()
-                self.store.add((s, p, o))
-        lock.release()
+                yield triple, state
+
+    def __len__(self, context: _ContextType | None = None) -> int:
+        store = self.store
+        if isinstance(context, QuotedGraph):
+            return store.__len__(context)
+        with store.lock.read():
+            n = store.store.__len__(context)
+            for triple, (asserted, contexts) in self._changed.items():
+                now = any(True for _ in store.store.triples(triple, context))
+                then = asserted if context is None else context in contexts
+                n += then - now
+        return n
+
+    def predicate_statistics(
+        self, predicate: _PredicateType | None = None
+    ) -> tuple[int, int, int] | None:
+        # the statistics of the store now are estimates as good
+        return self.store.predicate_statistics(predicate)
+
+    def contexts(
+        self, triple: _TripleType | None = None
+    ) -> Generator[_ContextType, None, None]:
+        if triple is None:
+            return (context for context in self.__contexts)
+        store = self.store
+        with store.lock.read():
+            state = self._changed.get(triple)
+            if state is None:
+                contexts = list(store.store.contexts(triple))
+            else:
+                contexts = state[1]
+        return (self.__graph(context) for context in contexts)
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        self.store.bind(prefix, namespace, override=override)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self.store.prefix(namespace)
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self.store.namespace(prefix)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        return self.store.namespaces()
@@ -2,7 +2,8 @@
 #
 from __future__ import annotations
 
-from collections.abc import Collection, Generator, Iterator, Mapping
+from collections.abc import Collection, Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,7 +11,7 @@ from typing import (
     overload,
 )
 
-from rdflib.store import Store
+from rdflib.store import Store, TripleAddedEvent
 from rdflib.util import _coalesce
 
 if TYPE_CHECKING:
@@ -19,7 +20,9 @@ if TYPE_CHECKING:
         _ContextType,
         _ObjectType,
         _PredicateType,
+        _QuadType,
         _SubjectType,
+        _TripleChoiceType,
         _TriplePatternType,
         _TripleType,
     )
@@ -32,6 +35,90 @@ __all__ = ["SimpleMemory", "Memory"]
 ANY: None = None
 
 
+def _choices(
+    spo: dict[Any, dict[Any, dict[Any, int]]],
+    pos: dict[Any, dict[Any, dict[Any, int]]],
+    osp: dict[Any, dict[Any, dict[Any, int]]],
+    triple: tuple[Any, Any, Any],
+) -> Iterator[_TripleType] | None:
+    """The triples of the indices matching a pattern where one position is
+    a list of terms, probing the indices for each term, or None if no
+    position is a non-empty list or more than one is a list"""
+    subject, predicate, object_ = triple
+    lists = [isinstance(t, (list, tuple)) for t in triple]
+    if lists.count(True) != 1 or not triple[lists.index(True)]:
+        return None
+
+    def subjects() -> Iterator[_TripleType]:
+        for s in subject:
+            po = spo.get(s)
+            if po is None:
+                continue
+            if predicate is not None:
+                os = po.get(predicate)
+                if os is None:
+                    continue
+                if object_ is not None:
+                    if object_ in os:
+                        yield s, predicate, object_
+                else:
+                    for o in list(os):
+                        yield s, predicate, o
+            elif object_ is not None:
+                for p in list(osp.get(object_, {}).get(s, ())):
+                    yield s, p, object_
+            else:
+                for p, os in list(po.items()):
+                    for o in list(os):
+                        yield s, p, o
+
+    def predicates() -> Iterator[_TripleType]:
+        for p in predicate:
+            if subject is not None:
+                os = spo.get(subject, {}).get(p)
+                if os is None:
+                    continue
+                if object_ is not None:
+                    if object_ in os:
+                        yield subject, p, object_
+                else:
+                    for o in list(os):
+                        yield subject, p, o
+            else:
+                os = pos.get(p)
+                if os is None:
+                    continue
+                if object_ is not None:
+                    for s in list(os.get(object_, ())):
+                        yield s, p, object_
+                else:
+                    for o, ss in list(os.items()):
+                        for s in list(ss):
+                            yield s, p, o
+
+    def objects() -> Iterator[_TripleType]:
+        for o in object_:
+            if subject is not None:
+                ps = osp.get(o, {}).get(subject)
+                if ps is None:
+                    continue
+                if predicate is not None:
+                    if predicate in ps:
+                        yield subject, predicate, o
+                else:
+                    for p in list(ps):
+                        yield subject, p, o
+            elif predicate is not None:
+                for s in list(pos.get(predicate, {}).get(o, ())):
+                    yield s, predicate, o
+            else:
+                for s, ps in list(osp.get(o, {}).items()):
+                    for p in list(ps):
+                        yield s, p, o
+
+    return (subjects, predicates, objects)[lists.index(True)]()
+
+
 class SimpleMemory(Store):
     """A fast naive in memory implementation of a triple store.
 
@@ -117,6 +204,7 @@ class SimpleMemory(Store):
         triple_pattern: _TriplePatternType,
         context: _ContextType | None = None,
     ) -> None:
+        Store.remove(self, triple_pattern, context)
         for (subject, predicate, object), c in list(self.triples(triple_pattern)):
             del self.__spo[subject][predicate][object]
             del self.__pos[predicate][object][subject]
@@ -186,6 +274,20 @@ class SimpleMemory(Store):
                     for o in subjectDictionary[p].keys():
                         yield (s, p, o), self.__contexts()
 
+    def triples_choices(
+        self,
+        triple: _TripleChoiceType,
+        context: _ContextType | None = None,
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType | None]]]:
+        """A variant of triples where one position can be a list of terms,
+        looked up in the indices for each term"""
+        matches = _choices(self.__spo, self.__pos, self.__osp, triple)
+        if matches is None:
+            yield from Store.triples_choices(self, triple, context)
+            return
+        for match in matches:
+            yield match, self.__contexts()
+
     def __len__(self, context: _ContextType | None = None) -> int:
         # @@ optimize
         i = 0
@@ -293,6 +395,11 @@ class Memory(Store):
             {}
         )
 
+        # [number of triples, number of distinct subjects] by predicate, the
+        # number of distinct objects is the size of the predicate's __pos entry
+        self.__predicateStats: dict[_PredicateType, list[int]] = {}
+        self.__tripleCount = 0
+
         self.__namespace: dict[str, URIRef] = {}
         self.__prefix: dict[URIRef, str] = {}
         self.__context_obj_map: dict[str, Graph] = {}
@@ -302,6 +409,8 @@ class Memory(Store):
         self.__all_contexts: set[Graph] = set()
         # default context information for triples
         self.__defaultContexts: dict[str | None, bool] | None = None
+        # triples that are not yet in __pos and __osp, during a bulk load
+        self.__pending: list[_TripleType] | None = None
 
     def add(
         self,
@@ -341,33 +450,107 @@ class Memory(Store):
             # No need to insert twice this triple.
             return
 
-        pos = self.__pos
+        self.__tripleCount += 1
         try:
-            os = pos[predicate]
-        except LookupError:
-            os = pos[predicate] = {}
-        try:
-            s = os[object_]
-        except LookupError:
-            s = os[object_] = {}
-        s[subject] = 1
-
-        osp = self.__osp
-        try:
-            sp = osp[object_]
-        except LookupError:
-            sp = osp[object_] = {}
+            stats = self.__predicateStats[predicate]
+        except KeyError:
+            stats = self.__predicateStats[predicate] = [0, 0]
+        stats[0] += 1
+        if len(o) == 1:
+            # first triple with this subject and predicate
+            stats[1] += 1
+
+        if self.__pending is not None:
+            self.__pending.append(triple)
+        else:
+            self.__index((triple,))
+
+    def addN(self, quads: Iterable[_QuadType]) -> None:  # noqa: N802
+        """Add the quads in a bulk load, see
+        [`bulk_load`][rdflib.plugins.stores.memory.Memory.bulk_load].
+        Consecutive quads with the same subject and predicate share the
+        lookup of their objects."""
+        dispatch = self.dispatcher.get_map() is not None
+        spo = self.__spo
+        predicateStats = self.__predicateStats  # noqa: N806
+        last: tuple[_SubjectType, _PredicateType] | None = None
+        o: dict[_ObjectType, int] = {}
+        with self.bulk_load():
+            pending = self.__pending
+            assert pending is not None
+            for subject, predicate, object_, context in quads:
+                assert (
+                    context is not None
+                ), "Context associated with %s %s %s is None!" % (
+                    subject,
+                    predicate,
+                    object_,
+                )
+                triple = (subject, predicate, object_)
+                if dispatch:
+                    self.dispatcher.dispatch(
+                        TripleAddedEvent(triple=triple, context=context)
+                    )
+                self.__all_contexts.add(context)
+
+                # a lookup of objects is shared unless the quads read
+                # removed the triples of that subject and predicate, which
+                # drops their emptied objects from the index
+                if (
+                    last is None
+                    or last[0] is not subject
+                    or last[1] is not predicate
+                    or not o
+                ):
+                    try:
+                        po = spo[subject]
+                    except LookupError:
+                        po = spo[subject] = {}
+                    try:
+                        o = po[predicate]
+                    except LookupError:
+                        o = po[predicate] = {}
+                    last = (subject, predicate)
+
+                if object_ in o:
+                    self.__add_triple_context(triple, True, context, False)
+                    continue
+                o[object_] = 1
+                self.__add_triple_context(triple, False, context, False)
+
+                self.__tripleCount += 1
+                try:
+                    stats = predicateStats[predicate]
+                except KeyError:
+                    stats = predicateStats[predicate] = [0, 0]
+                stats[0] += 1
+                if len(o) == 1:
+                    stats[1] += 1
+                pending.append(triple)
+
+    @contextmanager
+    def bulk_load(self) -> Generator[None, None, None]:
+        """A context in which triples are only added to the subject index,
+        the predicate and object indexes are built when the outermost
+        context exits, or when a lookup needs them"""
+        if self.__pending is not None:
+            yield
+            return
+        self.__pending = []
         try:
-            p = sp[subject]
-        except LookupError:
-            p = sp[subject] = {}
-        p[predicate] = 1
+            yield
+        finally:
+            pending = self.__pending
+            self.__pending = None
+            self.__index(pending)
 
     def remove(
         self,
         triple_pattern: _TriplePatternType,
         context: _ContextType | None = None,
     ) -> None:
+        Store.remove(self, triple_pattern, context)
+        self.__flush()
         req_ctx = self.__ctx_to_str(context)
         for triple, c in self.triples(triple_pattern, context=context):
             subject, predicate, object_ = triple
@@ -380,9 +563,7 @@ class Memory(Store):
                 # remove from default graph too
                 self.__remove_triple_context(triple, None)
             if len(self.__get_context_for_triple(triple)) == 0:
-                del self.__spo[subject][predicate][object_]
-                del self.__pos[predicate][object_][subject]
-                del self.__osp[object_][subject][predicate]
+                self.__remove_triple(triple)
                 del self.__tripleContexts[triple]
         if (
             req_ctx is not None
@@ -458,20 +639,21 @@ class Memory(Store):
                 else:  # subject given, predicate unbound
                     for p in list(subjectDictionary.keys()):
                         if object_ is not None:  # object is given
-                            if object_ in subjectDictionary[p]:
+                            if object_ in subjectDictionary.get(p, ()):
                                 triple = (subject, p, object_)
                                 if self.__triple_has_context(triple, req_ctx):
                                     yield triple, self.__contexts(triple)
                             else:  # given object not found
                                 pass
                         else:  # object unbound
-                            for o in list(subjectDictionary[p].keys()):
+                            for o in list(subjectDictionary.get(p, ())):
                                 triple = (subject, p, o)
                                 if self.__triple_has_context(triple, req_ctx):
                                     yield triple, self.__contexts(triple)
             else:  # given subject not found
                 pass
         elif predicate is not None:  # predicate is given, subject unbound
+            self.__flush()
             pos = self.__pos
             if predicate in pos:
                 predicateDictionary = pos[predicate]  # noqa: N806
@@ -485,16 +667,17 @@ class Memory(Store):
                         pass
                 else:  # predicate is given, object+subject unbound
                     for o in list(predicateDictionary.keys()):
-                        for s in list(predicateDictionary[o].keys()):
+                        for s in list(predicateDictionary.get(o, ())):
                             triple = (s, predicate, o)
                             if self.__triple_has_context(triple, req_ctx):
                                 yield triple, self.__contexts(triple)
         elif object_ is not None:  # object is given, subject+predicate unbound
+            self.__flush()
             osp = self.__osp
             if object_ in osp:
                 objectDictionary = osp[object_]  # noqa: N806
                 for s in list(objectDictionary.keys()):
-                    for p in list(objectDictionary[s].keys()):
+                    for p in list(objectDictionary.get(s, ())):
                         triple = (s, p, object_)
                         if self.__triple_has_context(triple, req_ctx):
                             yield triple, self.__contexts(triple)
@@ -502,13 +685,42 @@ class Memory(Store):
             # Shouldn't get here if all other cases above worked correctly.
             spo = self.__spo
             for s in list(spo.keys()):
-                subjectDictionary = spo[s]  # noqa: N806
+                subjectDictionary = spo.get(s, {})  # noqa: N806
                 for p in list(subjectDictionary.keys()):
-                    for o in list(subjectDictionary[p].keys()):
+                    for o in list(subjectDictionary.get(p, ())):
                         triple = (s, p, o)
                         if self.__triple_has_context(triple, req_ctx):
                             yield triple, self.__contexts(triple)
 
+    def triples_choices(
+        self,
+        triple: _TripleChoiceType,
+        context: _ContextType | None = None,
+    ) -> Generator[
+        tuple[_TripleType, Generator[_ContextType | None, None, None]],
+        None,
+        None,
+    ]:
+        """A variant of triples where one position can be a list of terms,
+        looked up in the indices for each term"""
+        self.__flush()
+        matches = _choices(self.__spo, self.__pos, self.__osp, triple)
+        if matches is None:
+            yield from Store.triples_choices(self, triple, context)
+            return
+        req_ctx = self.__ctx_to_str(context)
+        triples = self.__contextTriples.get(req_ctx)
+        if not triples:
+            return
+        if len(triples) == self.__tripleCount:
+            # every triple of the indices is in the context
+            for match in matches:
+                yield match, self.__contexts(match)
+        else:
+            for match in matches:
+                if self.__triple_has_context(match, req_ctx):
+                    yield match, self.__contexts(match)
+
     def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
         # should be identical to `SimpleMemory.bind`
         bound_namespace = self.__namespace.get(prefix)
@@ -564,6 +776,44 @@ class Memory(Store):
             return 0
         return len(self.__contextTriples[ctx])
 
+    def count(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> int:
+        """The number of triples matching, from the sizes of the indices
+        when every triple is in the context"""
+        req_ctx = self.__ctx_to_str(context)
+        triples = self.__contextTriples.get(req_ctx)
+        if not triples:
+            return 0
+        subject, predicate, object_ = triple_pattern
+        if subject is None and predicate is None and object_ is None:
+            return len(triples)
+        if len(triples) != self.__tripleCount:
+            # the indices hold triples of other contexts too
+            return Store.count(self, triple_pattern, context)
+
+        try:
+            if subject is not None:
+                po = self.__spo[subject]
+                if predicate is not None:
+                    if object_ is not None:
+                        return 1 if object_ in po[predicate] else 0
+                    return len(po[predicate])
+                if object_ is not None:
+                    self.__flush()
+                    return len(self.__osp[object_][subject])
+                return sum(len(o) for o in po.values())
+            self.__flush()
+            if predicate is not None:
+                if object_ is not None:
+                    return len(self.__pos[predicate][object_])
+                return self.__predicateStats[predicate][0]
+            return sum(len(p) for p in self.__osp[object_].values())
+        except KeyError:
+            return 0
+
     def add_graph(self, graph: Graph) -> None:
         if not self.graph_aware:
             Store.add_graph(self, graph)
@@ -580,7 +830,85 @@ class Memory(Store):
             except KeyError:
                 pass  # we didn't know this graph, no problem
 
+    def predicate_statistics(
+        self, predicate: _PredicateType | None = None
+    ) -> tuple[int, int, int]:
+        self.__flush()
+        if predicate is None:
+            return self.__tripleCount, len(self.__spo), len(self.__osp)
+        try:
+            triples, subjects = self.__predicateStats[predicate]
+        except KeyError:
+            return 0, 0, 0
+        return triples, subjects, len(self.__pos[predicate])
+
     # internal utility methods below
+    def __index(self, triples: Iterable[_TripleType]) -> None:
+        """add the triples to the predicate and object indexes"""
+        pos = self.__pos
+        osp = self.__osp
+        for subject, predicate, object_ in triples:
+            try:
+                os = pos[predicate]
+            except LookupError:
+                os = pos[predicate] = {}
+            try:
+                s = os[object_]
+            except LookupError:
+                s = os[object_] = {}
+            s[subject] = 1
+
+            try:
+                sp = osp[object_]
+            except LookupError:
+                sp = osp[object_] = {}
+            try:
+                p = sp[subject]
+            except LookupError:
+                p = sp[subject] = {}
+            p[predicate] = 1
+
+    def __flush(self) -> None:
+        """index the triples pending in a bulk load"""
+        if self.__pending:
+            # in place, as addN holds on to the list
+            self.__index(self.__pending)
+            self.__pending.clear()
+
+    def __remove_triple(self, triple: _TripleType) -> None:
+        """remove the triple from the indices, dropping index entries
+        that become empty so their sizes stay accurate for statistics"""
+        subject, predicate, object_ = triple
+        self.__tripleCount -= 1
+        stats = self.__predicateStats[predicate]
+        stats[0] -= 1
+
+        po = self.__spo[subject]
+        o = po[predicate]
+        del o[object_]
+        if not o:
+            stats[1] -= 1
+            del po[predicate]
+            if not po:
+                del self.__spo[subject]
+
+        os = self.__pos[predicate]
+        s = os[object_]
+        del s[subject]
+        if not s:
+            del os[object_]
+            if not os:
+                del self.__pos[predicate]
+                del self.__predicateStats[predicate]
+
+        sp = self.__osp[object_]
+        p = sp[subject]
+        del p[predicate]
+        if not p:
+            del sp[subject]
+            if not sp:
+                del self.__osp[object_]
+
     def __add_triple_context(
         self,
         triple: _TripleType,
@@ -611,12 +939,15 @@ class Memory(Store):
         else:
             # the triple didn't exist before in the store
             if quoted:  # this context only
-                triple_context = self.__tripleContexts[triple] = {ctx: quoted}
+                triple_context = {ctx: quoted}
             else:  # default context as well
-                triple_context = self.__tripleContexts[triple] = {
-                    ctx: quoted,
-                    None: quoted,
-                }
+                triple_context = {ctx: quoted, None: quoted}
+            # if this is the first ever triple in the store, set default ctx info
+            if self.__defaultContexts is None:
+                self.__defaultContexts = triple_context
+            # only store the context info if it differs from the default
+            if triple_context != self.__defaultContexts:
+                self.__tripleContexts[triple] = triple_context
 
         # if the triple is not quoted add it to the default context
         if not quoted:
@@ -627,11 +958,8 @@ class Memory(Store):
             self.__contextTriples[ctx] = set()
         self.__contextTriples[ctx].add(triple)
 
-        # if this is the first ever triple in the store, set default ctx info
-        if self.__defaultContexts is None:
-            self.__defaultContexts = triple_context
         # if the context info is the same as default, no need to store it
-        if triple_context == self.__defaultContexts:
+        if triple_exists and triple_context == self.__defaultContexts:
             del self.__tripleContexts[triple]
 
     def __get_context_for_triple(
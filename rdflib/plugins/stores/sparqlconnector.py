@@ -3,8 +3,9 @@ from __future__ import annotations
 import base64
 import copy
 import logging
+from collections.abc import Iterator
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.error import HTTPError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
@@ -16,12 +17,30 @@ from rdflib.util import FORMAT_MIMETYPE_MAP, RESPONSE_TABLE_FORMAT_MIMETYPE_MAP
 
 log = logging.getLogger(__name__)
 
+# result formats whose parsers can read the rows incrementally
+_STREAMED_CONTENT_TYPES = {
+    "application/sparql-results+json",
+    "application/sparql-results+xml",
+    "text/tab-separated-values",
+}
+
 if TYPE_CHECKING:
     import typing_extensions as te
 
     SUPPORTED_METHODS = te.Literal["GET", "POST", "POST_FORM"]
     SUPPORTED_FORMATS = te.Literal["xml", "json", "csv", "tsv", "application/rdf+xml"]
 
+_T = TypeVar("_T")
+
+
+def _closing(rows: Iterator[_T], response: Any) -> Iterator[_T]:
+    """the rows, closing the response after the last one, or when they are
+    no longer wanted"""
+    try:
+        yield from rows
+    finally:
+        response.close()
+
 
 class SPARQLConnectorException(Exception):  # noqa: N818
     pass
@@ -143,9 +162,21 @@ class SPARQLConnector:
                 return e.code, str(e), None  # type: ignore[return-value]
         else:
             raise SPARQLConnectorException("Unknown method %s" % self.method)
-        return Result.parse(
-            BytesIO(res.read()), content_type=res.headers["Content-Type"].split(";")[0]
-        )
+        content_type = res.headers["Content-Type"].split(";")[0]
+        if content_type in _STREAMED_CONTENT_TYPES:
+            # rows are parsed as they are read from the response, which is
+            # closed once they are all read or no longer wanted
+            try:
+                result = Result.parse(res, content_type=content_type, stream=True)
+            except BaseException:
+                res.close()
+                raise
+            if result.type == "SELECT":
+                result.bindings = _closing(result.stream_bindings(), res)
+            else:
+                res.close()
+            return result
+        return Result.parse(BytesIO(res.read()), content_type=content_type)
 
     def update(
         self,
@@ -18,6 +18,7 @@ from typing import (
 
 from rdflib.graph import DATASET_DEFAULT_GRAPH_ID, Graph
 from rdflib.plugins.stores.regexmatching import NATIVE_REGEX
+from rdflib.query import ResultRow
 from rdflib.store import Store
 from rdflib.term import (
     BNode,
@@ -44,7 +45,7 @@ if TYPE_CHECKING:
         _ContextIdentifierType,
     )
     from rdflib.plugins.sparql.sparql import Query, Update
-    from rdflib.query import Result, ResultRow
+    from rdflib.query import Result
     from .sparqlconnector import SUPPORTED_FORMATS, SUPPORTED_METHODS
 
 from .sparqlconnector import SPARQLConnector
@@ -265,6 +266,14 @@ class SPARQLStore(SPARQLConnector, Store):
         queryGraph: str | None = None,  # noqa: N803
         DEBUG: bool = False,  # noqa: N803
     ) -> Result:
+        """
+        The rows of a SELECT result in JSON, XML or TSV are parsed as they
+        are read from the response. Iterating over the result still keeps
+        them on it, as with any other result, so that it can be read
+        again. To read a large result once without keeping its rows, as
+        `triples` does, use
+        [`Result.stream_bindings`][rdflib.query.Result.stream_bindings].
+        """
         self.debug = DEBUG
         assert isinstance(query, str)
 
@@ -410,11 +419,13 @@ class SPARQLStore(SPARQLConnector, Store):
                     raise ValueError(
                         "It looks like you need to authenticate with this SPARQL Store. HTTP unauthorized"
                     )
-            for row in result:
-                if TYPE_CHECKING:
-                    # This will be a ResultRow because if vars is truthish then
-                    # the query will be a SELECT query.
-                    assert isinstance(row, ResultRow)
+            # the rows as they are parsed, without keeping them on the result
+            for b in result.stream_bindings():
+                if not b:
+                    # like iterating the result, skip empty bindings
+                    continue
+                # type error: Argument 2 to "ResultRow" has incompatible type "Optional[List[Variable]]"; expected "List[Variable]"
+                row = ResultRow(b, result.vars)  # type: ignore[arg-type]
                 yield (
                     (
                         row.get(s, URIRef(f"urn:undef:{s}"))
@@ -0,0 +1,705 @@
+"""
+A persistent store in an SQLite database, using the `sqlite3` module of the
+standard library.
+
+Every term is kept once in a `terms` table, and the statements are rows of
+term IDs in a `quads` table with a context-subject-predicate-object primary
+key and covering subject-predicate-object, predicate-object-subject and
+object-subject-predicate indexes, so `triples`, `triples_choices` and
+`__len__` are answered by ranges of an index. The database is opened in WAL
+mode.
+
+Changes are made in a transaction, which [`commit`][rdflib.plugins.stores.sqlite.SQLite.commit]
+makes durable and [`rollback`][rdflib.plugins.stores.sqlite.SQLite.rollback]
+discards.
+
+```python
+>>> import os, tempfile
+>>> from rdflib import Graph, Literal, URIRef
+>>> path = os.path.join(tempfile.mkdtemp(), "store.sqlite")
+>>> g = Graph("SQLite", identifier=URIRef("http://example.org/g"))
+>>> g.open(path, create=True)
+1
+>>> g.add((URIRef("http://example.org/a"), URIRef("http://example.org/b"), Literal(1)))
+<Graph identifier=http://example.org/g (<class 'rdflib.graph.Graph'>)>
+>>> g.commit()
+<Graph identifier=http://example.org/g (<class 'rdflib.graph.Graph'>)>
+>>> g.close()
+>>> g = Graph("SQLite", identifier=URIRef("http://example.org/g"))
+>>> g.open(path)
+1
+>>> len(g)
+1
+>>> g.close()
+
+```
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING
+from urllib.request import pathname2url
+
+from rdflib.store import (
+    NO_STORE,
+    VALID_STORE,
+    Store,
+    TransactionRolledBackEvent,
+    TripleAddedEvent,
+)
+from rdflib.term import BNode, Literal, URIRef, Variable
+
+if TYPE_CHECKING:
+    from rdflib.graph import (
+        Graph,
+        _ContextType,
+        _QuadType,
+        _TripleChoiceType,
+        _TriplePatternType,
+        _TripleType,
+    )
+    from rdflib.term import Identifier, Node
+
+__all__ = ["SQLite"]
+
+_DATABASE = "rdflib.sqlite"
+"""The name of the database file in a directory given as configuration"""
+
+_BATCH_SIZE = 1000
+"""The number of statements added by each `addN` batch, and the number of
+rows read by each query of `triples`"""
+
+_CACHE_SIZE = 100_000
+"""The number of terms whose IDs are kept in memory"""
+
+_DEFAULT_CONTEXT = 0
+"""The context ID of the statements added without a context, which is not the
+ID of a term"""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS terms ("
+    " id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE)",
+    "CREATE TABLE IF NOT EXISTS quads ("
+    " s INTEGER NOT NULL, p INTEGER NOT NULL, o INTEGER NOT NULL,"
+    " c INTEGER NOT NULL, quoted INTEGER NOT NULL,"
+    " PRIMARY KEY (c, s, p, o)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS quads_spo ON quads (s, p, o, c, quoted)",
+    "CREATE INDEX IF NOT EXISTS quads_pos ON quads (p, o, s, c, quoted)",
+    "CREATE INDEX IF NOT EXISTS quads_osp ON quads (o, s, p, c, quoted)",
+    "CREATE TABLE IF NOT EXISTS contexts ("
+    " c INTEGER PRIMARY KEY, quoted INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS namespaces ("
+    " prefix TEXT PRIMARY KEY, namespace TEXT NOT NULL UNIQUE)",
+)
+
+# the column order used to read each combination of bound positions
+_SPOC = ("s", "p", "o", "c")
+_POSC = ("p", "o", "s", "c")
+_OSPC = ("o", "s", "p", "c")
+
+
+class _Database:
+    """A connection to a database, shared by the stores of the process that
+    have it open, with the term IDs it has read"""
+
+    __slots__ = ("connection", "users", "ids", "terms", "stats")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.users = 1
+        # term IDs by term, and terms by ID
+        self.ids: dict[Node, int] = {}
+        self.terms: dict[int, Node] = {}
+        self.stats: dict[int | None, tuple[int, int, int]] = {}
+
+    def clear(self) -> None:
+        self.ids.clear()
+        self.terms.clear()
+        self.stats.clear()
+
+
+_databases: dict[str, _Database] = {}
+_databases_lock = threading.Lock()
+
+
+def _path(configuration: str) -> str:
+    """the path of the database file of a configuration"""
+    if os.path.isdir(configuration):
+        return os.path.join(configuration, _DATABASE)
+    return configuration
+
+
+def _encode(term: Node) -> str:
+    """The text of a term in the terms table"""
+    if isinstance(term, URIRef):
+        return "U%s" % term
+    if isinstance(term, BNode):
+        return "B%s" % term
+    if isinstance(term, Literal):
+        # language tags are compared case-insensitively, as by Literal
+        language = term.language.lower() if term.language else ""
+        return "L%s\x1f%s\x1f%s" % (language, term.datatype or "", term)
+    if isinstance(term, Variable):
+        return "V%s" % term
+    from rdflib.graph import Graph, QuotedGraph
+
+    if isinstance(term, QuotedGraph):
+        return "Q" + _encode(term.identifier)
+    if isinstance(term, Graph):
+        return "G" + _encode(term.identifier)
+    raise TypeError("Cannot store %r" % (term,))
+
+
+class SQLite(Store):
+    """A persistent store of statements in an SQLite database.
+
+    It is Context-aware, Graph-aware, Formula-aware and Transaction-aware.
+    The configuration is the path of the database file, or of a directory
+    to keep a `rdflib.sqlite` file in, or `:memory:`. Changes that are not
+    committed are rolled back when the store is closed, unless
+    `commit_pending_transaction` is given. The stores of a process that
+    open the same database file share its connection, and so its
+    transaction.
+    """
+
+    context_aware = True
+    formula_aware = True
+    transaction_aware = True
+    graph_aware = True
+
+    def __init__(
+        self,
+        configuration: str | None = None,
+        identifier: Identifier | None = None,
+    ):
+        self.__database: _Database | None = None
+        self.__path: str | None = None
+        self.__identifier = identifier
+        # graphs by identifier
+        self.__graphs: dict[Node, Graph] = {}
+        super(SQLite, self).__init__(configuration)
+
+    @property
+    def identifier(self) -> Identifier | None:
+        return self.__identifier
+
+    def open(self, configuration: str, create: bool = False) -> int | None:
+        path = _path(configuration)
+        if path != ":memory:" and not os.path.exists(path):
+            if not create:
+                return NO_STORE
+            directory = os.path.dirname(path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+        if self.__identifier is None and path != ":memory:":
+            self.__identifier = URIRef(pathname2url(os.path.abspath(path)))
+
+        if path != ":memory:":
+            path = os.path.abspath(path)
+        with _databases_lock:
+            database = _databases.get(path)
+            if database is not None:
+                database.users += 1
+            else:
+                connection = sqlite3.connect(path, check_same_thread=False)
+                if path != ":memory:":
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute("PRAGMA synchronous=NORMAL")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                connection.commit()
+                database = _Database(connection)
+                if path != ":memory:":
+                    _databases[path] = database
+        self.__database = database
+        self.__path = path
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        database = self.__database
+        if database is None:
+            return
+        connection = database.connection
+        with _databases_lock:
+            database.users -= 1
+            if commit_pending_transaction:
+                connection.commit()
+            if database.users == 0:
+                # the changes nobody committed are discarded
+                connection.rollback()
+                connection.close()
+                _databases.pop(self.__path, None)  # type: ignore[arg-type]
+        self.__database = None
+        self.__graphs.clear()
+
+    def destroy(self, configuration: str) -> None:
+        path = _path(configuration)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    def commit(self) -> None:
+        self.__db.commit()
+
+    def rollback(self) -> None:
+        self.__db.rollback()
+        # terms and contexts may be gone
+        self.__cache.clear()
+        self.__graphs.clear()
+        self.dispatcher.dispatch(TransactionRolledBackEvent())
+
+    def add(
+        self,
+        triple: _TripleType,
+        context: _ContextType,
+        quoted: bool = False,
+    ) -> None:
+        """Add a triple to the store of triples."""
+        Store.add(self, triple, context, quoted=quoted)
+        self.__insert([(*triple, context)], quoted)
+
+    def addN(self, quads: Iterable[_QuadType]) -> None:  # noqa: N802
+        """Add the quads in batches of one `INSERT` per table"""
+        dispatch = self.dispatcher.get_map() is not None
+        batch: list[_QuadType] = []
+        for s, p, o, c in quads:
+            assert c is not None, "Context associated with %s %s %s is None!" % (
+                s,
+                p,
+                o,
+            )
+            if dispatch:
+                self.dispatcher.dispatch(TripleAddedEvent(triple=(s, p, o), context=c))
+            batch.append((s, p, o, c))
+            if len(batch) == _BATCH_SIZE:
+                self.__insert(batch, False)
+                batch = []
+        if batch:
+            self.__insert(batch, False)
+
+    def remove(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> None:
+        Store.remove(self, triple_pattern, context)
+        where = self.__where(triple_pattern, context, False)
+        if where is None:
+            return
+        clauses, params = where
+        if context is None:
+            # the statements of the triples asserted in some context, in
+            # all contexts
+            clauses.append(
+                "EXISTS (SELECT 1 FROM quads AS a WHERE a.s = quads.s"
+                " AND a.p = quads.p AND a.o = quads.o AND a.quoted = 0)"
+            )
+        self.__db.execute(
+            "DELETE FROM quads WHERE " + " AND ".join(clauses or ["1"]), params
+        )
+        self.__cache.stats.clear()
+
+    def triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> Iterator[tuple[_TripleType, Iterator[_ContextType]]]:
+        """A generator over all the triples matching the pattern, reading
+        a range of an index in batches"""
+        return self.__triples(triple_pattern, context)
+
+    def triples_choices(
+        self,
+        triple: _TripleChoiceType,
+        context: _ContextType | None = None,
+    ) -> Generator[tuple[_TripleType, Iterator[_ContextType]], None, None]:
+        """A variant of triples where one position can be a list of terms,
+        read with a single `IN` query"""
+        # type error: Argument 1 has incompatible type "_TripleChoiceType"; expected "_TriplePatternType"
+        return self.__triples(triple, context)  # type: ignore[arg-type]
+
+    def __len__(self, context: _ContextType | None = None) -> int:
+        if context is None:
+            sql = (
+                "SELECT count(*) FROM (SELECT DISTINCT s, p, o FROM quads"
+                " WHERE quoted = 0)"
+            )
+            return self.__db.execute(sql).fetchone()[0]
+        c = self.__lookup(context.identifier)
+        if c is None:
+            return 0
+        return self.__db.execute(
+            "SELECT count(*) FROM quads WHERE c = ?", (c,)
+        ).fetchone()[0]
+
+    def count(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> int:
+        """The number of triples matching the pattern, counted by a single
+        query"""
+        where = self.__where(triple_pattern, context, True)
+        if where is None:
+            return 0
+        clauses, params = where
+        condition = " AND ".join(clauses or ["1"])
+        if context is None:
+            # a triple of several contexts is counted once
+            sql = (
+                "SELECT count(*) FROM (SELECT DISTINCT s, p, o FROM quads WHERE %s)"
+                % condition
+            )
+        else:
+            sql = "SELECT count(*) FROM quads WHERE " + condition
+        return self.__db.execute(sql, params).fetchone()[0]
+
+    def predicate_statistics(
+        self, predicate: Node | None = None
+    ) -> tuple[int, int, int]:
+        if predicate is None:
+            p = None
+            sql = (
+                "SELECT count(*), count(DISTINCT s), count(DISTINCT o) FROM"
+                " (SELECT DISTINCT s, p, o FROM quads WHERE quoted = 0)"
+            )
+            params: tuple[int, ...] = ()
+        else:
+            p = self.__lookup(predicate)
+            if p is None:
+                return 0, 0, 0
+            sql = (
+                "SELECT count(*), count(DISTINCT s), count(DISTINCT o) FROM"
+                " (SELECT DISTINCT s, o FROM quads WHERE p = ? AND quoted = 0)"
+            )
+            params = (p,)
+        cache = self.__cache.stats
+        try:
+            return cache[p]
+        except KeyError:
+            stats = cache[p] = tuple(self.__db.execute(sql, params).fetchone())
+            return stats  # type: ignore[return-value]
+
+    def contexts(
+        self, triple: _TripleType | None = None
+    ) -> Generator[_ContextType, None, None]:
+        if triple is None or triple == (None, None, None):
+            rows = self.__db.execute("SELECT c, quoted FROM contexts").fetchall()
+            self.__decode([c for c, _ in rows])
+            for c, quoted in rows:
+                yield self.__graph(c, quoted)
+            return
+
+        ids = [self.__lookup(term) for term in triple]
+        if None in ids:
+            return
+        yield from self.__contexts(*ids)  # type: ignore[arg-type]
+
+    def add_graph(self, graph: Graph) -> None:
+        c = self.__encode([graph.identifier])[graph.identifier]
+        self.__graphs[graph.identifier] = graph
+        self.__db.execute(
+            "INSERT OR IGNORE INTO contexts (c, quoted) VALUES (?, 0)", (c,)
+        )
+
+    def remove_graph(self, graph: Graph) -> None:
+        self.remove((None, None, None), graph)
+        c = self.__lookup(graph.identifier)
+        if c is not None:
+            self.__db.execute("DELETE FROM contexts WHERE c = ?", (c,))
+        self.__graphs.pop(graph.identifier, None)
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        if override:
+            self.__db.execute(
+                "DELETE FROM namespaces WHERE prefix = ? OR namespace = ?",
+                (prefix, namespace),
+            )
+        # without override, a prefix or namespace that is bound stays bound
+        self.__db.execute(
+            "INSERT OR IGNORE INTO namespaces (prefix, namespace) VALUES (?, ?)",
+            (prefix, namespace),
+        )
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        row = self.__db.execute(
+            "SELECT namespace FROM namespaces WHERE prefix = ?", (prefix,)
+        ).fetchone()
+        return URIRef(row[0]) if row else None
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        row = self.__db.execute(
+            "SELECT prefix FROM namespaces WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        rows = self.__db.execute("SELECT prefix, namespace FROM namespaces")
+        for prefix, namespace in rows.fetchall():
+            yield prefix, URIRef(namespace)
+
+    # internal utility methods below
+    @property
+    def __cache(self) -> _Database:
+        assert self.__database is not None, "The Store must be open."
+        return self.__database
+
+    @property
+    def __db(self) -> sqlite3.Connection:
+        return self.__cache.connection
+
+    def __insert(self, quads: Sequence[_QuadType], quoted: bool) -> None:
+        """add the statements, with the terms and contexts they use"""
+        terms = {term for s, p, o, _ in quads for term in (s, p, o)}
+        terms.update(c.identifier for _, _, _, c in quads if c is not None)
+        ids = self.__encode(terms)
+        contexts = set()
+        rows = []
+        for s, p, o, context in quads:
+            if context is None:
+                # only a formula quotes statements
+                rows.append((ids[s], ids[p], ids[o], _DEFAULT_CONTEXT, False))
+                continue
+            c = ids[context.identifier]
+            if c not in contexts:
+                contexts.add(c)
+                self.__graphs.setdefault(context.identifier, context)
+            rows.append((ids[s], ids[p], ids[o], c, quoted))
+        db = self.__db
+        db.executemany(
+            "INSERT OR IGNORE INTO contexts (c, quoted) VALUES (?, ?)",
+            [(c, quoted) for c in contexts],
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO quads (s, p, o, c, quoted) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.__cache.stats.clear()
+
+    def __encode(self, terms: Iterable[Node]) -> dict[Node, int]:
+        """the IDs of the terms, adding those not yet in the terms table"""
+        cache = self.__cache.ids
+        result = {}
+        missing = {}
+        for term in terms:
+            try:
+                result[term] = cache[term]
+            except KeyError:
+                missing[_encode(term)] = term
+        if missing:
+            db = self.__db
+            db.executemany(
+                "INSERT OR IGNORE INTO terms (term) VALUES (?)",
+                [(text,) for text in missing],
+            )
+            if len(cache) + len(missing) > _CACHE_SIZE:
+                cache.clear()
+            texts = list(missing)
+            for i in range(0, len(texts), 500):
+                chunk = texts[i : i + 500]
+                rows = db.execute(
+                    "SELECT id, term FROM terms WHERE term IN (%s)"
+                    % ", ".join("?" * len(chunk)),
+                    chunk,
+                )
+                for id, text in rows:
+                    term = missing[text]
+                    result[term] = cache[term] = id
+        return result
+
+    def __lookup(self, term: Node) -> int | None:
+        """the ID of the term, None if it is not in the terms table"""
+        cache = self.__cache.ids
+        try:
+            return cache[term]
+        except KeyError:
+            pass
+        try:
+            text = _encode(term)
+        except TypeError:
+            return None
+        row = self.__db.execute("SELECT id FROM terms WHERE term = ?", (text,))
+        row = row.fetchone()
+        if row is None:
+            return None
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[term] = row[0]
+        return row[0]
+
+    def __decode(self, ids: Iterable[int]) -> dict[int, Node]:
+        """the terms of the IDs"""
+        cache = self.__cache.terms
+        result = {}
+        missing = []
+        for id in ids:
+            try:
+                result[id] = cache[id]
+            except KeyError:
+                missing.append(id)
+        if missing:
+            if len(cache) + len(missing) > _CACHE_SIZE:
+                cache.clear()
+            for i in range(0, len(missing), 500):
+                chunk = missing[i : i + 500]
+                rows = self.__db.execute(
+                    "SELECT id, term FROM terms WHERE id IN (%s)"
+                    % ", ".join("?" * len(chunk)),
+                    chunk,
+                )
+                for id, text in rows:
+                    result[id] = cache[id] = self.__term(text)
+        return result
+
+    def __term(self, text: str) -> Node:
+        from rdflib.graph import Graph, QuotedGraph
+
+        kind, value = text[0], text[1:]
+        if kind == "U":
+            return URIRef(value)
+        if kind == "B":
+            return BNode(value)
+        if kind == "L":
+            language, datatype, lexical = value.split("\x1f", 2)
+            return Literal(
+                lexical,
+                lang=language or None,
+                datatype=URIRef(datatype) if datatype else None,
+            )
+        if kind == "V":
+            return Variable(value)
+        if kind == "Q":
+            # type error: Argument 2 to "QuotedGraph" has incompatible type "Node"
+            return QuotedGraph(self, self.__term(value))  # type: ignore[arg-type]
+        # type error: Argument "identifier" to "Graph" has incompatible type "Node"
+        return Graph(self, identifier=self.__term(value))  # type: ignore[arg-type]
+
+    def __graph(self, c: int, quoted: bool) -> Graph:
+        """the graph of the context ID"""
+        from rdflib.graph import Graph, QuotedGraph
+
+        identifier = self.__decode((c,))[c]
+        try:
+            return self.__graphs[identifier]
+        except KeyError:
+            graph = self.__graphs[identifier] = (
+                QuotedGraph(self, identifier)  # type: ignore[arg-type]
+                if quoted
+                else Graph(self, identifier=identifier)  # type: ignore[arg-type]
+            )
+            return graph
+
+    def __contexts(self, s: int, p: int, o: int) -> Generator[_ContextType, None, None]:
+        """the non-quoted contexts of a triple"""
+        rows = self.__db.execute(
+            "SELECT c FROM quads WHERE s = ? AND p = ? AND o = ? AND quoted = 0"
+            " AND c != ?",
+            (s, p, o, _DEFAULT_CONTEXT),
+        ).fetchall()
+        self.__decode([c for c, in rows])
+        for (c,) in rows:
+            yield self.__graph(c, False)
+
+    def __where(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None,
+        asserted: bool,
+    ) -> tuple[list[str], list[int]] | None:
+        """the SQL conditions and parameters of a pattern, where a position
+        can be a list of terms, None if nothing can match"""
+        clauses = []
+        params: list[int] = []
+        for column, term in zip("spo", triple_pattern):
+            if term is None:
+                continue
+            if isinstance(term, (list, tuple)):
+                if not term:
+                    continue
+                ids = [self.__lookup(t) for t in term]
+                ids = [id for id in ids if id is not None]
+                if not ids:
+                    return None
+                clauses.append("%s IN (%s)" % (column, ", ".join("?" * len(ids))))
+                params.extend(ids)
+            else:
+                id = self.__lookup(term)
+                if id is None:
+                    return None
+                clauses.append(column + " = ?")
+                params.append(id)
+        if context is not None:
+            c = self.__lookup(context.identifier)
+            if c is None:
+                return None
+            clauses.append("c = ?")
+            params.append(c)
+        elif asserted:
+            clauses.append("quoted = 0")
+        return clauses, params
+
+    def __triples(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None,
+    ) -> Generator[tuple[_TripleType, Iterator[_ContextType]], None, None]:
+        where = self.__where(triple_pattern, context, True)
+        if where is None:
+            return
+        clauses, params = where
+        subject, predicate, object_ = triple_pattern
+        if subject is not None or (predicate is None and object_ is None):
+            order = _SPOC
+        elif predicate is not None:
+            order = _POSC
+        else:
+            order = _OSPC
+        columns = ", ".join(order)
+        sql = "SELECT %s FROM quads WHERE %s%%s ORDER BY %s LIMIT %d" % (
+            columns,
+            " AND ".join(clauses or ["1"]),
+            columns,
+            _BATCH_SIZE,
+        )
+        after = " AND (%s) > (?, ?, ?, ?)" % columns
+        positions = [order.index(column) for column in "spoc"]
+        db = self.__db
+
+        rows = db.execute(sql % "", params).fetchall()
+        # the triple being read and its contexts, when the context is None
+        last: tuple[int, int, int] | None = None
+        contexts: list[int] = []
+        while rows:
+            terms = self.__decode({id for row in rows for id in row})
+            for row in rows:
+                s, p, o, c = (row[i] for i in positions)
+                if context is not None:
+                    yield (terms[s], terms[p], terms[o]), self.__contexts(s, p, o)
+                elif (s, p, o) == last:
+                    contexts.append(c)
+                else:
+                    if last is not None:
+                        yield self.__triple(last, contexts)
+                    last = (s, p, o)
+                    contexts = [c]
+            if len(rows) < _BATCH_SIZE:
+                break
+            rows = db.execute(sql % after, [*params, *rows[-1]]).fetchall()
+        if last is not None:
+            yield self.__triple(last, contexts)
+
+    def __triple(
+        self, triple: tuple[int, int, int], contexts: list[int]
+    ) -> tuple[_TripleType, Iterator[_ContextType]]:
+        contexts = [c for c in contexts if c != _DEFAULT_CONTEXT]
+        terms = self.__decode((*triple, *contexts))
+        s, p, o = triple
+        return (
+            # type error: Incompatible types in assignment
+            (terms[s], terms[p], terms[o]),  # type: ignore[return-value]
+            iter([self.__graph(c, False) for c in contexts]),
+        )
@@ -257,6 +257,45 @@ class Result:
             # type error: Incompatible types in assignment (expression has type "Union[MutableSequence[Mapping[Variable, Identifier]], Iterator[Mapping[Variable, Identifier]]]", variable has type "MutableSequence[Mapping[Variable, Identifier]]")
             self._bindings = b  # type: ignore[assignment]
 
+    def stream_bindings(self) -> Iterator[Mapping[Variable, QueryResultValueType]]:
+        """
+        The bindings, with those that are still being produced, as when the
+        result is parsed with `stream=True`, read one at a time and not
+        kept. The result then only has the bindings that were read before,
+        so this is for reading a large result once.
+        """
+        bindings = self._bindings if self._bindings is not None else []
+        generator = self._genbindings
+        self._genbindings = None
+        if generator is None:
+            return iter(bindings)
+        return itertools.chain(list(bindings), generator)
+
+    def _iterbindings(
+        self, keep: bool = True
+    ) -> Iterator[Mapping[Variable, QueryResultValueType]]:
+        """
+        The bindings, with those of a generator read one at a time rather
+        than all at once as with `bindings`, for serializers to write each
+        of them as it is produced. They are kept as they are read, as when
+        iterating over the result, so it can be read again, unless keep is
+        False, see `stream_bindings`.
+        """
+        if not keep:
+            yield from self.stream_bindings()
+            return
+        bindings = self._bindings if self._bindings is not None else []
+        i = 0
+        while i < len(bindings) or self._genbindings:
+            if i == len(bindings):
+                b = next(self._genbindings, None)  # type: ignore[arg-type]
+                if b is None:
+                    self._genbindings = None
+                    return
+                bindings.append(b)
+            yield bindings[i]
+            i += 1
+
     @staticmethod
     def parse(
         source: IO | None = None,
@@ -286,6 +325,7 @@ class Result:
         destination: str | IO | None = None,
         encoding: str = "utf-8",
         format: str = "xml",
+        stream: bool = False,
         **args: Any,
     ) -> bytes | None:
         """
@@ -302,6 +342,10 @@ class Result:
             destination: Path of file output or BufferedIOBase object to write the output to.
             encoding: Encoding of output.
             format: One of ['csv', 'json', 'txt', xml']
+            stream: If True, the csv, json and xml serializers write the
+                bindings that are still being produced, as those of a query
+                or of a result parsed with `stream=True`, without keeping
+                them on the result, which can then not be read again.
 
         Returns:
             bytes
@@ -317,6 +361,8 @@ class Result:
         from rdflib import plugin
 
         serializer = plugin.get(format, ResultSerializer)(self)
+        if stream:
+            args["stream_bindings"] = True
         if destination is None:
             streamb: BytesIO = BytesIO()
             stream2 = EncodeOnlyUnicode(streamb)  # TODO: Remove the need for this
@@ -20,6 +20,7 @@ RDF operations performed on it.
 from __future__ import annotations
 
 import pickle
+from contextlib import contextmanager
 from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
@@ -56,6 +57,7 @@ __all__ = [
     "StoreCreatedEvent",
     "TripleAddedEvent",
     "TripleRemovedEvent",
+    "TransactionRolledBackEvent",
     "NodePickler",
     "Store",
 ]
@@ -89,6 +91,13 @@ class TripleRemovedEvent(Event):
     """
 
 
+class TransactionRolledBackEvent(Event):
+    """This event is fired when a transaction-aware store rolls back the
+    changes of a transaction, which it does not fire TripleAddedEvent and
+    TripleRemovedEvent events for.
+    """
+
+
 class NodePickler:
     def __init__(self) -> None:
         self._objects: dict[str, Any] = {}
@@ -239,7 +248,8 @@ class Store:
             argument be True. It should also be an error for the quoted argument
             to be True when the store is not formula-aware.
         """
-        self.dispatcher.dispatch(TripleAddedEvent(triple=triple, context=context))
+        if self.dispatcher.get_map() is not None:
+            self.dispatcher.dispatch(TripleAddedEvent(triple=triple, context=context))
 
     def addN(self, quads: Iterable[_QuadType]) -> None:  # noqa: N802
         """Adds each item in the list of statements to a specific context.
@@ -261,6 +271,21 @@ class Store:
             )
             self.add((s, p, o), c)
 
+    @contextmanager
+    def bulk_load(self) -> Generator[None, None, None]:
+        """A context in which many statements are added at once, such as
+        while parsing a document.
+
+        Stores can defer work, like building secondary indexes, until the
+        outermost `bulk_load` context exits. Statements added in it must
+        still be visible to `triples` and the other methods while it is
+        active. Contexts can be nested.
+
+        Note:
+            The default implementation does nothing.
+        """
+        yield
+
     def remove(
         self,
         triple: _TriplePatternType,
@@ -365,6 +390,47 @@ class Store:
             context: a graph instance to query or None
         """
 
+    def count(
+        self,
+        triple_pattern: _TriplePatternType,
+        context: _ContextType | None = None,
+    ) -> int:
+        """
+        The number of statements matching the pattern, the same as the
+        number of statements `triples` gives for it.
+
+        Stores that can count statements without enumerating them should
+        override this, the default implementation counts the statements
+        `triples` gives.
+
+        Args:
+            triple_pattern: The pattern of the statements to count
+            context: A graph instance to count the statements of, or None
+                for all asserted statements
+        """
+        return sum(1 for _ in self.triples(triple_pattern, context))
+
+    def predicate_statistics(
+        self, predicate: Node | None = None
+    ) -> tuple[int, int, int] | None:
+        """
+        Statistics that query planning can use to estimate how many triples
+        a pattern will match.
+
+        Stores that keep statistics should override this, the default
+        implementation returns None to indicate that none are available.
+
+        Args:
+            predicate: The predicate to get statistics for, or None for
+                statistics over all triples in the store.
+
+        Returns:
+            A tuple of the number of triples, the number of distinct subjects
+            and the number of distinct objects for the given predicate, or
+            None if the store keeps no statistics.
+        """
+        return None
+
     # type error: Missing return statement
     def contexts(  # type: ignore[empty-body]
         self, triple: _TripleType | None = None
@@ -56,6 +56,7 @@ from typing import (
 )
 from urllib.parse import urldefrag, urljoin, urlparse
 from uuid import uuid4
+from weakref import WeakValueDictionary
 
 import rdflib
 import rdflib.util
@@ -94,6 +95,10 @@ skolem_genid = "/.well-known/genid/"
 rdflib_skolem_genid = "/.well-known/genid/rdflib/"
 skolems: dict[str, BNode] = {}
 
+# the terms made while rdflib.INTERN_TERMS is set, for the terms made after
+# to be the same objects
+_interned: WeakValueDictionary[Any, Identifier] = WeakValueDictionary()
+
 
 _invalid_uri_chars = '<>" {}|\\^`'
 
@@ -289,7 +294,7 @@ class URIRef(IdentifiedNode):
     IRIs are a generalization of URIs [RFC3986] that permits a wider range of Unicode characters.
     """
 
-    __slots__ = ()
+    __slots__ = ("__weakref__",)
 
     __or__: Callable[[URIRef, URIRef | Path], AlternativePath]
     __invert__: Callable[[URIRef], InvPath]
@@ -305,6 +310,15 @@ class URIRef(IdentifiedNode):
                 if not value.endswith("#"):
                     value += "#"
 
+        key = None
+        if rdflib.INTERN_TERMS and cls is URIRef:
+            # the pool is keyed by plain strings, which don't keep its
+            # terms alive
+            key = value if type(value) is str else str(value)
+            rt = _interned.get(key)
+            if rt is not None:
+                return rt
+
         if not _is_valid_uri(value):
             logger.warning(
                 f"{value} does not look like a valid URI, trying to serialize this will break."
@@ -315,6 +329,8 @@ class URIRef(IdentifiedNode):
         except UnicodeDecodeError:
             # type error: No overload variant of "__new__" of "str" matches argument types "type[URIRef]", "str", "str"
             rt = str.__new__(cls, value, "utf-8")  # type: ignore[call-overload]
+        if key is not None:
+            _interned[key] = rt
         return rt
 
     def n3(self, namespace_manager: NamespaceManager | None = None) -> str:
@@ -535,6 +551,10 @@ class BNode(IdentifiedNode):
         return URIRef(urljoin(authority, skolem))
 
 
+# the value of a Literal that has not been cast from its lexical form yet
+_UNCAST: Any = object()
+
+
 class Literal(Identifier):
     """
 
@@ -556,6 +576,10 @@ class Literal(Identifier):
     at construction time. Default behaviour is set by `rdflib.NORMALIZE_LITERALS`
     and can be overridden by the normalize parameter to `__new__`
 
+    The lexical form of a literal that is not normalized, or of a datatype
+    that is unknown or maps it to the same string, is only cast to the
+    `value`, and checked to be well formed, when those are needed.
+
     Equality and hashing of Literals are done based on the lexical form, i.e.:
 
     ```python
@@ -649,7 +673,15 @@ class Literal(Identifier):
     # NOTE: _datatype should maybe be of type URIRef, and not optional.
     _datatype: URIRef | None
     _ill_typed: bool | None
-    __slots__ = ("_language", "_datatype", "_value", "_ill_typed")
+    _hash: int | None
+    __slots__ = (
+        "_language",
+        "_datatype",
+        "_value",
+        "_ill_typed",
+        "_hash",
+        "__weakref__",
+    )
 
     def __new__(
         cls,
@@ -673,9 +705,21 @@ class Literal(Identifier):
         if lang is not None and not _is_valid_langtag(lang):
             raise ValueError(f"'{str(lang)}' is not a valid language tag!")
 
-        if datatype is not None:
+        if datatype is not None and type(datatype) is not URIRef:
             datatype = URIRef(datatype)
 
+        key = None
+        if (
+            rdflib.INTERN_TERMS
+            and datatype is not None
+            and type(lexical_or_value) is str
+            and cls is Literal
+        ):
+            key = (lexical_or_value, datatype, normalize)
+            inst = _interned.get(key)
+            if inst is not None:
+                return inst
+
         value = None
         ill_typed: bool | None = None
         if isinstance(lexical_or_value, Literal):
@@ -689,6 +733,24 @@ class Literal(Identifier):
                 datatype = lexical_or_value.datatype
                 value = lexical_or_value.value
 
+        elif (
+            isinstance(lexical_or_value, str)
+            and (not normalize or _toPythonMapping.get(datatype) is None)
+            and datatype not in (_XSD_NORMALISED_STRING, _XSD_TOKEN)
+        ):
+            # passed a string that is kept as it is, as it is not normalized
+            # or its datatype is unknown or maps it to the same string: the
+            # value is only cast from it, and checked, when it is needed
+            inst = str.__new__(cls, lexical_or_value)
+            inst._language = lang
+            inst._datatype = datatype
+            inst._value = _UNCAST
+            inst._ill_typed = None
+            inst._hash = None
+            if key is not None:
+                _interned[key] = inst
+            return inst
+
         elif isinstance(lexical_or_value, str) or isinstance(lexical_or_value, bytes):
             # passed a string
             # try parsing lexical form of datatyped literal
@@ -736,9 +798,23 @@ class Literal(Identifier):
         inst._datatype = datatype
         inst._value = value
         inst._ill_typed = ill_typed
+        inst._hash = None
+        if key is not None:
+            _interned[key] = inst
 
         return inst
 
+    def _cast(self) -> None:
+        """Casts the lexical form of a literal made without it to its value,
+        and checks that it is well formed"""
+        lexical = str(self)
+        datatype = self._datatype
+        value = _castLexicalToPython(lexical, datatype)
+        if datatype is not None and datatype in _toPythonMapping:
+            checker = _check_well_formed_types.get(datatype, _well_formed_by_value)
+            self._ill_typed = not checker(lexical, value)
+        self._value = value
+
     def normalize(self) -> Literal:
         """
         Returns a new literal with a normalised lexical representation
@@ -776,10 +852,14 @@ class Literal(Identifier):
         If the literal's datatype is `None` or not in the set of `recognized datatype IRIs
         <https://www.w3.org/TR/rdf11-concepts/#dfn-recognized-datatype-iris>`_ this value will be `None`.
         """
+        if self._value is _UNCAST:
+            self._cast()
         return self._ill_typed
 
     @property
     def value(self) -> Any:
+        if self._value is _UNCAST:
+            self._cast()
         return self._value
 
     @property
@@ -1350,13 +1430,16 @@ class Literal(Identifier):
             * The two datatype URIs, if any, compare equal, character by character."
             -- 6.5.1 Literal Equality (RDF: Concepts and Abstract Syntax)
         """
-        # don't use super()... for efficiency reasons, see Identifier.__hash__
-        res = str.__hash__(self)
-        # Directly accessing the member is faster than the property.
-        if self._language:
-            res ^= hash(self._language.lower())
-        if self._datatype is not None:
-            res ^= hash(self._datatype)
+        res = self._hash
+        if res is None:
+            # don't use super()... for efficiency reasons, see Identifier.__hash__
+            res = str.__hash__(self)
+            # Directly accessing the member is faster than the property.
+            if self._language:
+                res ^= hash(self._language.lower())
+            if self._datatype is not None:
+                res ^= hash(self._datatype)
+            self._hash = res
         return res
 
     def __eq__(self, other: Any) -> bool:
@@ -2250,6 +2333,7 @@ def _reset_bindings() -> None:
     """Reset lexical<->value space binding for `Literal`."""
     _toPythonMapping.clear()
     _toPythonMapping.update(XSDToPython)
+    _interned.clear()
 
     _GenericPythonToXSDRules.clear()
     _GenericPythonToXSDRules.extend(_OriginalGenericPythonToXSDRules)
@@ -2348,6 +2432,8 @@ def bind(
     if constructor is None:
         constructor = pythontype
     _toPythonMapping[datatype] = constructor
+    # the literals made after this are made with the binding
+    _interned.clear()
     if datatype_specific:
         _SpecificPythonToXSDRules.append(((pythontype, datatype), lexicalizer))
     else:
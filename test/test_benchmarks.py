@@ -0,0 +1,80 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.__main__ import compare, run
+
+ROOT_DIR = Path(__file__).parent.parent
+
+
+def _results(seconds: float, memory: int, products: int = 10) -> dict:
+    return {
+        "metadata": {"products": products},
+        "results": {
+            "parse/turtle": {"seconds": seconds, "peak_memory_bytes": memory},
+            "sparql/bi-1": {"error": "ValueError()"},
+        },
+    }
+
+
+def test_compare() -> None:
+    baseline = _results(1.0, 1000)
+    assert compare(_results(1.1, 1100), baseline, 0.2) == []
+    assert compare(_results(0.5, 500), baseline, 0.2) == []
+    assert compare(_results(1.5, 1000), baseline, 0.2) == [
+        "parse/turtle: 1.50 times as slow"
+    ]
+    assert compare(_results(1.0, 2000), baseline, 0.2) == [
+        "parse/turtle: 2.00 times as much memory"
+    ]
+    # times too short to compare
+    assert compare(_results(0.0, 0), _results(0.0, 0), 0.2) == []
+    assert compare(_results(0.000001, 0), _results(0.0, 0), 0.2) == []
+    assert compare(_results(0.0009, 1000), _results(0.0001, 1000), 0.2) == []
+    failed = _results(1.0, 1000)
+    failed["results"]["parse/turtle"] = {"error": "ValueError()"}
+    assert compare(failed, baseline, 0.2) == ["parse/turtle: failed, ValueError()"]
+
+
+def test_run(tmp_path: Path) -> None:
+    """
+    The benchmarks run, and the results are no regression from themselves.
+    """
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks",
+            "--products=5",
+            "--repeat=1",
+            "-k",
+            "turtle",
+            "-k",
+            "memory/add",
+            "-k",
+            "sparql",
+            f"--output={output}",
+            f"--baseline={output}",
+        ],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+    )
+    results = json.loads(output.read_text())
+    assert results["metadata"]["products"] == 5
+    assert {"parse/turtle", "serialize/turtle", "memory/add", "sparql/bi-1"} <= set(
+        results["results"]
+    )
+    for result in results["results"].values():
+        assert result["items_per_second"] > 0
+        assert result["peak_memory_bytes"] >= 0
+
+
+def test_run_explicit() -> None:
+    # the slow canonicalization only runs when named in full
+    results = run(5, 1, ["canonicalize"])["results"]
+    assert set(results) == {"canonicalize/rdfc10"}
+    results = run(5, 1, ["canonicalize/rgda1"])["results"]
+    assert set(results) == {"canonicalize/rgda1"}
@@ -1,3 +1,4 @@
+import random
 from collections import Counter
 from io import StringIO
 from typing import TYPE_CHECKING
@@ -6,7 +7,7 @@ import pytest
 
 import rdflib
 from rdflib import RDF, BNode, ConjunctiveGraph, Graph, Literal, Namespace, URIRef
-from rdflib.compare import to_canonical_graph, to_isomorphic
+from rdflib.compare import isomorphic, to_canonical_graph, to_isomorphic
 from rdflib.namespace import FOAF
 from rdflib.plugins.stores.memory import Memory
 from test.utils import GraphHelper
@@ -181,6 +182,37 @@ def test_negative_graph_match(fn, rdf1, rdf2, identical):
     fn(rdf1, rdf2, identical)
 
 
+@pytest.mark.parametrize("fn, rdf1, rdf2, identical", negative_graph_match_test())
+def test_negative_isomorphic(fn, rdf1, rdf2, identical):
+    g1 = Graph().parse(data=rdf1, format="turtle")
+    g2 = Graph().parse(data=rdf2, format="turtle")
+    assert isomorphic(g1, g2) == identical
+    assert isomorphic(g2, g1) == identical
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_isomorphic_relabelled(seed):
+    rng = random.Random(seed)
+    terms = [URIRef(f"urn:example:{i}") for i in range(3)] + [Literal("x")]
+    bnodes = [BNode() for _ in range(12)]
+    triples = set()
+    for _ in range(40):
+        s = rng.choice(bnodes + terms[:3])
+        o = rng.choice(bnodes + terms)
+        triples.add((s, rng.choice(terms[:3]), o))
+    g1 = Graph()
+    g1 += triples
+    relabel = {b: BNode() for b in bnodes}
+    g2 = Graph()
+    g2 += [tuple(relabel.get(x, x) for x in t) for t in triples]
+    assert isomorphic(g1, g2)
+    assert isomorphic(g1, g1)
+    s, p, o = triple = rng.choice(sorted(g2))
+    g2.remove(triple)
+    g2.add((s, p, rng.choice(bnodes)))
+    assert isomorphic(g1, g2) == (to_isomorphic(g1) == to_isomorphic(g2))
+
+
 def test_issue494_collapsing_bnodes():
     """Test for https://github.com/RDFLib/rdflib/issues/494 collapsing BNodes"""
     g = Graph()
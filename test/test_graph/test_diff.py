@@ -51,7 +51,6 @@ class TestDiff:
 
         graph_diff(g, g)
 
-    @pytest.mark.xfail()
     def test_subsets(self) -> None:
         """
         This test verifies that `graph_diff` returns the correct values
@@ -91,6 +90,22 @@ class TestDiff:
         assert len(in_second) > 0
         assert len(in_both) > 0
 
+    def test_copies(self) -> None:
+        """
+        Copies of the same bnode component are told apart.
+        """
+        g0 = Graph()
+        g1 = Graph()
+        for g, copies in ((g0, 2), (g1, 1)):
+            for _ in range(copies):
+                bnode = BNode()
+                g.add((bnode, FOAF.name, Literal("Golan Trevize")))
+                g.add((bnode, RDF.type, FOAF.Person))
+        in_both, in_first, in_second = GraphHelper.triple_sets(graph_diff(g0, g1))
+        assert len(in_both) == 2
+        assert len(in_first) == 2
+        assert in_second == set()
+
 
 _ElementSetType = Union[Collection[GHTriple], Collection[GHQuad]]
 
@@ -70,7 +70,6 @@ def get_store_names() -> set[str | None]:
             "default",
             "Memory",
             "Auditable",
-            "Concurrent",
             "SPARQLStore",
             "SPARQLUpdateStore",
             "SimpleMemory",
@@ -0,0 +1,141 @@
+import random
+
+import pytest
+
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.compare import canonical_nquads
+from rdflib.namespace import XSD
+from test.utils.namespace import EGDO
+
+# the examples of https://www.w3.org/TR/rdf-canon/
+UNIQUE_HASHES = """
+<http://example.com/#p> <http://example.com/#q> _:e0 .
+<http://example.com/#p> <http://example.com/#r> _:e1 .
+_:e0 <http://example.com/#s> <http://example.com/#u> .
+_:e1 <http://example.com/#t> <http://example.com/#u> .
+"""
+
+UNIQUE_HASHES_CANONICAL = """\
+<http://example.com/#p> <http://example.com/#q> _:c14n0 .
+<http://example.com/#p> <http://example.com/#r> _:c14n1 .
+_:c14n0 <http://example.com/#s> <http://example.com/#u> .
+_:c14n1 <http://example.com/#t> <http://example.com/#u> .
+"""
+
+SHARED_HASHES = """
+<http://example.com/#p> <http://example.com/#q> _:e0 .
+<http://example.com/#p> <http://example.com/#q> _:e1 .
+_:e0 <http://example.com/#p> _:e2 .
+_:e1 <http://example.com/#p> _:e3 .
+_:e2 <http://example.com/#r> _:e3 .
+"""
+
+SHARED_HASHES_CANONICAL = """\
+<http://example.com/#p> <http://example.com/#q> _:c14n2 .
+<http://example.com/#p> <http://example.com/#q> _:c14n3 .
+_:c14n0 <http://example.com/#r> _:c14n1 .
+_:c14n2 <http://example.com/#p> _:c14n1 .
+_:c14n3 <http://example.com/#p> _:c14n0 .
+"""
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (UNIQUE_HASHES, UNIQUE_HASHES_CANONICAL),
+        (SHARED_HASHES, SHARED_HASHES_CANONICAL),
+    ],
+)
+def test_spec_examples(data: str, expected: str):
+    graph = Graph().parse(data=data, format="nt")
+    assert canonical_nquads(graph) == expected
+    dataset = Dataset().parse(data=data, format="nquads")
+    assert canonical_nquads(dataset) == expected
+
+
+def relabelled(quads, rng: random.Random):
+    """The quads with other bnodes, in another order"""
+    bnodes: dict[BNode, BNode] = {}
+    quads = [
+        tuple(bnodes.setdefault(x, BNode()) if isinstance(x, BNode) else x for x in q)
+        for q in quads
+    ]
+    rng.shuffle(quads)
+    dataset = Dataset()
+    dataset.addN(quads)
+    return dataset
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_relabelled(seed: int):
+    rng = random.Random(seed)
+    terms = [EGDO[f"t{i}"] for i in range(2)]
+    bnodes = [BNode() for _ in range(10)]
+    graphs = [EGDO.g, BNode(), Dataset().default_graph.identifier]
+    quads = set()
+    for _ in range(30):
+        s = rng.choice(bnodes + terms)
+        o = rng.choice(bnodes + terms + [Literal("x")])
+        quads.add((s, rng.choice(terms), o, rng.choice(graphs)))
+    # cycles of bnodes that only the n-degree hashes tell apart
+    for length in (3, 3, 6):
+        cycle = [BNode() for _ in range(length)]
+        for i, bnode in enumerate(cycle):
+            quads.add((bnode, EGDO.next, cycle[i - 1], EGDO.g))
+    dataset1 = relabelled(quads, rng)
+    dataset2 = relabelled(quads, rng)
+    canonical = canonical_nquads(dataset1)
+    assert canonical == canonical_nquads(dataset2)
+    assert len(canonical.splitlines()) == len(quads)
+    parsed = Dataset().parse(data=canonical, format="nquads")
+    assert canonical_nquads(parsed) == canonical
+
+
+def test_not_isomorphic():
+    # two cycles of three bnodes, and one of six
+    graph1 = Graph()
+    graph2 = Graph()
+    for graph, lengths in ((graph1, (3, 3)), (graph2, (6,))):
+        for length in lengths:
+            cycle = [BNode() for _ in range(length)]
+            for i, bnode in enumerate(cycle):
+                graph.add((bnode, EGDO.next, cycle[i - 1]))
+    assert canonical_nquads(graph1) != canonical_nquads(graph2)
+
+
+def test_terms():
+    graph = Graph()
+    graph.add((EGDO.s, EGDO.p, Literal('a "b"\\\n\t\r\x08\x0c\x00\x7fé')))
+    graph.add((EGDO.s, EGDO.p, Literal("a", datatype=XSD.string)))
+    graph.add((EGDO.s, EGDO.p, Literal("1", datatype=XSD.integer)))
+    graph.add((EGDO.s, EGDO.p, Literal("a", lang="EN-gb")))
+    graph.add((URIRef("urn:example:é"), EGDO.p, BNode()))
+    assert canonical_nquads(graph) == (
+        '<http://example.org/s> <http://example.org/p> "1"'
+        "^^<http://www.w3.org/2001/XMLSchema#integer> .\n"
+        '<http://example.org/s> <http://example.org/p> "a \\"b\\"\\\\\\n\\t\\r\\b\\f'
+        '\\u0000\\u007Fé" .\n'
+        '<http://example.org/s> <http://example.org/p> "a" .\n'
+        '<http://example.org/s> <http://example.org/p> "a"@en-gb .\n'
+        "<urn:example:é> <http://example.org/p> _:c14n0 .\n"
+    )
+
+
+def test_max_calls():
+    graph = Graph()
+    cycle = [BNode() for _ in range(8)]
+    for i, bnode in enumerate(cycle):
+        graph.add((bnode, EGDO.next, cycle[i - 1]))
+        graph.add((cycle[i - 1], EGDO.next, bnode))
+    with pytest.raises(RuntimeError):
+        canonical_nquads(graph, max_calls=10)
+
+
+def test_serializer():
+    dataset = Dataset().parse(data=SHARED_HASHES, format="nquads")
+    dataset.add((BNode(), EGDO.p, EGDO.o, BNode()))
+    data = dataset.serialize(format="canonical-nquads", encoding="utf-8")
+    assert data == canonical_nquads(dataset).encode("utf-8")
+    assert data.endswith(b"\n")
+    graph = Graph().parse(data=SHARED_HASHES, format="nt")
+    assert graph.serialize(format="canonical-nquads") == SHARED_HASHES_CANONICAL
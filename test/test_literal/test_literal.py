@@ -120,6 +120,7 @@ def test_cant_pass_invalid_lang(
 
 
 # Untyped decorator makes function untyped
+@pytest.mark.parametrize("normalize", [True, False])  # type: ignore[misc, unused-ignore]
 @pytest.mark.parametrize(  # type: ignore[misc, unused-ignore]
     "lexical, datatype, is_ill_typed",
     [
@@ -163,11 +164,12 @@ def test_ill_typed_literals(
     lexical: Union[bytes, str],
     datatype: URIRef | None,
     is_ill_typed: bool | None,
+    normalize: bool,
 ) -> None:
     """
-    ill_typed has the correct value.
+    ill_typed has the correct value, also when it is only checked when needed.
     """
-    lit = Literal(lexical, datatype=datatype)
+    lit = Literal(lexical, datatype=datatype, normalize=normalize)
     assert lit.ill_typed is is_ill_typed
     if is_ill_typed is False:
         # If the literal is not ill typed it should have a value associated with it.
@@ -685,6 +687,36 @@ def test_numeric_literals(
     assert result == expected, repr(result)
 
 
+@pytest.mark.parametrize(
+    "lexical, lang, datatype",
+    [
+        ("abc", None, None),
+        ("abc", "en", None),
+        ("abc", None, XSD.string),
+        ("01", None, XSD.integer),
+        ("x", None, XSD.integer),
+        ("2006-01-01", None, XSD.date),
+        ("abc", None, EGDC.unknown),
+    ],
+)
+def test_uncast_literal(
+    lexical: str, lang: str | None, datatype: URIRef | None
+) -> None:
+    """
+    A literal cast only when needed has the value, and compares and hashes
+    like one cast when made.
+    """
+    lit = Literal(lexical, lang=lang, datatype=datatype, normalize=False)
+    expected = Literal(lexical, lang=lang, datatype=datatype)
+    assert hash(lit) == hash(lit) == hash(Literal(lit))
+    assert lit.value == expected.value
+    assert lit.ill_typed is expected.ill_typed
+    assert lit.eq(expected)
+    assert (lit == expected) is (str(lit) == str(expected))
+    if lexical == str(expected):
+        assert hash(lit) == hash(expected)
+
+
 def test_cant_pass_lang_and_datatype() -> None:
     with pytest.raises(TypeError):
         Literal("foo", lang="en", datatype=URIRef("http://example.com/"))
@@ -3,11 +3,15 @@ some more specific Literal tests are in test_literal.py
 """
 
 import base64
+import gc
 import random
 
+import pytest
+
+import rdflib
 from rdflib.graph import Graph, QuotedGraph
 from rdflib.namespace import XSD
-from rdflib.term import BNode, Literal, URIRef, _is_valid_unicode
+from rdflib.term import BNode, Literal, URIRef, _interned, _is_valid_unicode, bind
 
 
 def uformat(s):
@@ -282,3 +286,52 @@ class TestValidityFunctions:
         )
         for val, expected in testcase_list:
             assert _is_valid_unicode(val) == expected
+
+
+class TestInterning:
+    @pytest.fixture(autouse=True)
+    def intern_terms(self, monkeypatch):
+        monkeypatch.setattr(rdflib, "INTERN_TERMS", True)
+
+    def test_uriref(self, monkeypatch):
+        a = URIRef("http://example.com/a")
+        assert URIRef("http://example.com/a") is a
+        assert URIRef(a) is a
+        assert URIRef("a", base="http://example.com/") is a
+        monkeypatch.setattr(rdflib, "INTERN_TERMS", False)
+        assert URIRef("http://example.com/a") is not a
+
+    def test_literal(self):
+        one = Literal("1", datatype=XSD.integer)
+        assert Literal("1", datatype=XSD.integer) is one
+        assert Literal("1", datatype=str(XSD.integer)) is one
+        assert Literal("1", datatype=XSD.integer, normalize=False) is not one
+        assert Literal("1") is not Literal("1")
+        assert Literal(1) is not one
+
+    def test_released(self):
+        URIRef("http://example.com/released")
+        gc.collect()
+        assert "http://example.com/released" not in _interned
+
+    def test_bind(self):
+        datatype = URIRef("urn:example:dt")
+        lit = Literal("a", datatype=datatype, normalize=True)
+        try:
+            bind(datatype, str, lambda s: s.upper())
+            assert Literal("a", datatype=datatype, normalize=True) is not lit
+        finally:
+            rdflib.term._reset_bindings()
+
+    def test_parsed(self):
+        g = Graph().parse(
+            data="""
+            <urn:example:s> <urn:example:p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .
+            <urn:example:o> <urn:example:p> <urn:example:s> .
+            <urn:example:s> <urn:example:p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .
+            """,
+            format="nt",
+        )
+        assert len({id(p) for s, p, o in g}) == 1
+        s = next(s for s, p, o in g if isinstance(o, Literal))
+        assert g.value(URIRef("urn:example:o"), URIRef("urn:example:p")) is s
@@ -183,6 +183,49 @@ def test_cover_subjectobjectliteral():
     # self.assertRaises(ntriples.ParseError, p.literal)
 
 
+class ListSink:
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '<http://example.org/s> <http://example.org/p> "o" .',
+        '<http://example.org/s>\t<http://example.org/p>\t"o"@en-GB.',
+        "  _:a.b <http://example.org/p> _:c.  # comment",
+        '_:a <http://example.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .',
+        '<http://example.org/s> <http://example.org/p> "a \\"b\\" \\u00E9\\n" .',
+        "<http://example.org/\\u00E9> <http://example.org/p> <http://example.org/o> .",
+        "<http://example.org/s> <http://example.org/p> <a>b:c> .",
+        '<http://example.org/s> <http://example.org/p> "o"',
+        "# comment",
+        "",
+    ],
+)
+def test_fast_path_same_as_eat(monkeypatch: pytest.MonkeyPatch, line: str):
+    """Whole statement matching gives the same terms, or the same error,
+    as the term by term parse"""
+
+    def parse():
+        sink = ListSink()
+        try:
+            ntriples.W3CNTriplesParser(sink, bnode_context=bnode_context).parsestring(
+                line + "\r\n" + line
+            )
+        except ntriples.ParseError as e:
+            return str(e)
+        return sink.triples
+
+    bnode_context: dict = {}
+    fast = parse()
+    monkeypatch.setattr(ntriples, "r_triple", re.compile("(?!)"))
+    assert parse() == fast
+
+
 # Test BNode context
 
 
@@ -1,6 +1,14 @@
 import os
+import re
+from concurrent.futures import Future
+from pathlib import Path
 
-from rdflib import Dataset, Literal, URIRef
+import pytest
+
+import rdflib.plugins.parsers.nquads
+import rdflib.plugins.parsers.ntriples
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.exceptions import ParserError
 from rdflib.namespace import FOAF
 from test.data import TEST_DATA_DIR
 
@@ -150,3 +158,120 @@ class TestBnodeContext:
             bnode_context=bnode_ctx,
         )
         assert set(h.contexts()) == set(g.contexts())
+
+
+def test_fast_path_same_as_eat(monkeypatch: pytest.MonkeyPatch):
+    data = """
+    <http://example.org/s> <http://example.org/p> "o"@en <http://example.org/g> .
+    _:s<http://example.org/p>_:o _:g.
+    _:s <http://example.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .
+    <http://example.org/s> <http://example.org/p> "\\u00E9" _:g . # comment
+    """
+    bnode_ctx: dict[str, BNode] = {}
+    fast = Dataset()
+    fast.parse(data=data, format="nquads", bnode_context=bnode_ctx)
+    assert len(set(fast.quads())) == 4
+    monkeypatch.setattr(rdflib.plugins.parsers.nquads, "r_quad", re.compile("(?!)"))
+    slow = Dataset()
+    slow.parse(data=data, format="nquads", bnode_context=bnode_ctx)
+    assert set(fast.quads()) == set(slow.quads())
+
+
+class TestParallelParse:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(rdflib.plugins.parsers.ntriples, "chunksiz", 1024)
+
+    def test_same_as_serial(self):
+        path = TEST_DATA_DIR / "nquads.rdflib/example.nquads"
+        bnode_ctx: dict[str, BNode] = {}
+        expected = Dataset()
+        expected.parse(path, format="nquads", bnode_context=bnode_ctx)
+        g = Dataset()
+        g.parse(path, format="nquads", workers=2, bnode_context=bnode_ctx)
+        assert len(g.store) == 449
+        assert set(g.quads()) == set(expected.quads())
+        assert set(g.store.contexts()) == set(expected.store.contexts())
+
+    def test_bnode_context(self, tmp_path: Path):
+        path = tmp_path / "bnodes.nq"
+        path.write_text(
+            "".join(
+                f"_:b{i % 7} <http://example.org/p> _:b{i % 5} _:g{i % 3} .\n"
+                for i in range(500)
+            )
+        )
+        bnode_ctx = {"b0": BNode("zero")}
+        g = Dataset()
+        g.parse(path, format="nquads", workers=3, bnode_context=bnode_ctx)
+        nodes = {s for s, _, _, _ in g.quads()} | {o for _, _, o, _ in g.quads()}
+        assert nodes == {bnode_ctx[f"b{i}"] for i in range(7)}
+        assert bnode_ctx["b0"] == BNode("zero")
+        assert {c for _, _, _, c in g.quads()} == {bnode_ctx[f"g{i}"] for i in range(3)}
+
+        # the labels map to the same blank nodes in a serial parse
+        h = Dataset()
+        h.parse(path, format="nquads", bnode_context=bnode_ctx)
+        assert set(h.quads()) == set(g.quads())
+
+    def test_ntriples(self, tmp_path: Path):
+        path = tmp_path / "data.nt"
+        path.write_text(
+            "".join(f'_:b{i % 10} <http://example.org/p> "{i}" .\n' for i in range(500))
+        )
+        g = Graph()
+        g.parse(path, format="nt", workers=2)
+        assert len(g) == 500
+        assert len(set(g.subjects())) == 10
+
+    def test_chunks_in_flight(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        ntriples = rdflib.plugins.parsers.ntriples
+        line = '<http://example.org/s> <http://example.org/p> "{:04}" .\n'
+        path = tmp_path / "data.nt"
+        path.write_text("".join(line.format(i) for i in range(1000)))
+        size = len(line.format(0))
+        submitted = []
+
+        class SerialExecutor:
+            def __init__(self, max_workers: int):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def submit(self, fn, *args):
+                submitted.append(args[2:4])
+                future: Future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        monkeypatch.setattr(ntriples, "ProcessPoolExecutor", SerialExecutor)
+        with open(path, "rb") as f:
+            chunks = ntriples._parse_parallel(
+                ntriples.W3CNTriplesParser, f, 2, {}, False
+            )
+            assert chunks is not None
+            in_flight = []
+            for i, quads in enumerate(chunks):
+                in_flight.append(len(submitted) - i)
+                assert quads[0][2] == Literal(f"{submitted[i][0] // size:04}")
+        # chunks of about chunksiz bytes, at most two per worker in flight
+        assert [end - start for start, end in submitted[:-1]] == [
+            1024 + size - 1024 % size
+        ] * (len(submitted) - 1)
+        assert submitted[-1][1] == size * 1000
+        assert max(in_flight) == 4
+
+    def test_invalid_line(self, tmp_path: Path):
+        path = tmp_path / "data.nt"
+        lines = [
+            f'<http://example.org/s{i}> <http://example.org/p> "1" .\n'
+            for i in range(500)
+        ]
+        lines[400] = "<http://example.org/s> garbage .\n"
+        path.write_text("".join(lines))
+        with pytest.raises(ParserError, match="garbage"):
+            Graph().parse(path, format="nt", workers=2)
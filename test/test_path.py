@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from typing import Union
 
 import pytest
@@ -17,6 +18,7 @@ from rdflib.paths import (
     SequencePath,
     ZeroOrMore,
     ZeroOrOne,
+    cache_closures,
 )
 
 g = Graph()
@@ -142,3 +144,93 @@ def test_hash(lhs: Path, rhs: Path) -> None:
 def test_dict_key(insert_path: Path, check_path: Path) -> None:
     d = {insert_path: "foo"}
     assert d[check_path] == "foo"
+
+
+EG = "http://example.org/"
+
+
+def _reached(edges: set[tuple[URIRef, URIRef]], start: URIRef) -> set[URIRef]:
+    reached: set[URIRef] = set()
+    todo = [start]
+    while todo:
+        node = todo.pop()
+        for s, o in edges:
+            if s == node and o not in reached:
+                reached.add(o)
+                todo.append(o)
+    return reached
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("cached", [False, True])
+def test_mulpath_closure(seed: int, cached: bool) -> None:
+    rnd = random.Random(seed)
+    p = URIRef(f"{EG}p")
+    nodes = [URIRef(f"{EG}n{i}") for i in range(12)]
+    edges = {(rnd.choice(nodes), rnd.choice(nodes)) for _ in range(15)}
+    graph = Graph()
+    for s, o in edges:
+        graph.add((s, p, o))
+    if cached:
+        cache_closures(graph)
+
+    everything = {(s, o) for s in nodes for o in _reached(edges, s)}
+    terms = set(graph.all_nodes())
+    for _ in range(2):
+        assert set(graph.subject_objects(p * OneOrMore)) == everything
+        assert set(graph.subject_objects(p * ZeroOrMore)) == everything | {
+            (n, n) for n in terms
+        }
+        for n in nodes:
+            assert set(graph.objects(n, p * OneOrMore)) == _reached(edges, n)
+            assert set(graph.subjects(p * OneOrMore, n)) == {
+                s for s, o in everything if o == n
+            }
+            assert list(graph.objects(n, p * ZeroOrMore)).count(n) == 1
+            for o in nodes:
+                assert ((n, p * OneOrMore, o) in graph) == ((n, o) in everything)
+    cache_closures(graph, False)
+
+
+def test_mulpath_deep_chain() -> None:
+    p = URIRef(f"{EG}p")
+    nodes = [URIRef(f"{EG}n{i}") for i in range(1500)]
+    graph = Graph()
+    for s, o in zip(nodes, nodes[1:]):
+        graph.add((s, p, o))
+    assert list(graph.objects(nodes[0], p * OneOrMore)) == nodes[1:]
+    assert len(list(graph.subjects(p * OneOrMore, nodes[-1]))) == 1499
+    assert len(list(graph.subject_objects(p * OneOrMore))) == 1499 * 1500 // 2
+
+
+def test_cache_closures_changes() -> None:
+    p = URIRef(f"{EG}p")
+    a, b, c = (URIRef(f"{EG}{n}") for n in "abc")
+    graph = Graph()
+    graph.add((a, p, b))
+    cache_closures(graph)
+    assert set(graph.objects(a, p * OneOrMore)) == {b}
+    graph.add((b, p, c))
+    assert set(graph.objects(a, p * OneOrMore)) == {b, c}
+    assert set(graph.subject_objects(p * OneOrMore)) == {(a, b), (a, c), (b, c)}
+    graph.remove((a, p, b))
+    assert set(graph.objects(a, p * OneOrMore)) == set()
+    assert set(graph.subject_objects(p * OneOrMore)) == {(b, c)}
+    cache_closures(graph, False)
+
+
+def test_cache_closures_rollback(tmp_path) -> None:
+    p = URIRef(f"{EG}p")
+    a, b, c = (URIRef(f"{EG}{n}") for n in "abc")
+    graph = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    graph.open(str(tmp_path / "store.sqlite"), create=True)
+    graph.add((a, p, b))
+    graph.commit()
+    cache_closures(graph)
+    graph.add((b, p, c))
+    assert set(graph.objects(a, p * OneOrMore)) == {b, c}
+    graph.rollback()
+    assert len(graph) == 1
+    assert set(graph.objects(a, p * OneOrMore)) == {b}
+    cache_closures(graph, False)
+    graph.close()
@@ -0,0 +1,79 @@
+import pytest
+
+import rdflib.plugins.sparql
+from rdflib import XSD, BNode, Graph, Literal, URIRef
+from rdflib.plugins.sparql.aggregates import CompactAggregator
+from rdflib.plugins.sparql.evaluate import _evalCompactAggregate, evalPart
+from rdflib.plugins.sparql.sparql import QueryContext
+
+
+@pytest.fixture(scope="module")
+def graph():
+    g = Graph()
+    p, q = URIRef("urn:ex:p"), URIRef("urn:ex:q")
+    for i in range(120):
+        s = URIRef(f"urn:ex:s{i % 23}")
+        g.add((s, p, Literal(i % 9)))
+        g.add((s, p, Literal(i / 4, datatype=XSD.double)))
+        if i % 4:
+            g.add((s, q, Literal(f"{i % 5}", datatype=XSD.decimal)))
+        g.add((s, q, BNode(f"b{i % 3}")))
+    return g
+
+
+QUERIES = [
+    "SELECT (COUNT(*) AS ?c) { ?s ?p ?o }",
+    "SELECT (COUNT(*) AS ?c) (SUM(?o) AS ?sum) { ?s <urn:ex:nothing> ?o }",
+    "SELECT ?s (COUNT(?o) AS ?c) (MIN(?o) AS ?min) (MAX(?o) AS ?max) "
+    "{ ?s ?p ?o } GROUP BY ?s",
+    "SELECT ?s (SUM(?o) AS ?sum) (AVG(?o) AS ?avg) { ?s <urn:ex:p> ?o } GROUP BY ?s",
+    "SELECT ?s ?p (AVG(?o) AS ?avg) (SAMPLE(?o) AS ?x) { ?s ?p ?o } GROUP BY ?s ?p",
+    "SELECT ?k (COUNT(?x) AS ?c) "
+    "{ ?s <urn:ex:p> ?o OPTIONAL { ?s <urn:ex:q> ?x FILTER(isLiteral(?x)) } } "
+    "GROUP BY (STR(?o) AS ?k)",
+    "SELECT ?s (MAX(?o) AS ?max) { ?s ?p ?o } GROUP BY ?s HAVING (COUNT(?o) > 10)",
+]
+
+
+def _results(graph, query):
+    return sorted(
+        tuple(sorted(r.items())) for r in graph.query(query).bindings  # type: ignore[union-attr]
+    )
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize("size", [None, 1, 5])
+def test_compact_aggregate(graph, query, size, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(CompactAggregator, "supports", classmethod(lambda cls, a: False))
+        expected = _results(graph, query)
+
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_MAX_ROWS_IN_MEMORY", size)
+    assert _results(graph, query) == expected
+
+
+def test_compact_aggregate_supports():
+    q = rdflib.plugins.sparql.prepareQuery(
+        "SELECT (COUNT(DISTINCT ?o) AS ?c) (MAX(DISTINCT ?o) AS ?m) { ?s ?p ?o }"
+    )
+    aggregates = q.algebra.p.p.p.p.A
+    assert not CompactAggregator.supports(aggregates)
+    assert CompactAggregator.supports(aggregates[1:])
+
+
+@pytest.mark.parametrize("size", [0, 1])
+def test_compact_aggregate_one_group_in_memory(graph, size):
+    q = rdflib.plugins.sparql.prepareQuery(
+        "SELECT ?o (COUNT(*) AS ?n) { VALUES ?o { 1 2 3 } } GROUP BY ?o"
+    )
+    agg = q.algebra.p.p.p.p
+    ctx = QueryContext(graph)
+    rows = _evalCompactAggregate(
+        ctx,
+        CompactAggregator(agg.A),
+        agg.p.expr,
+        evalPart(ctx, agg.p),
+        size,
+    )
+    counts = sorted((row[agg.A[1].res], row[agg.A[0].res]) for row in rows)
+    assert counts == [(Literal(i), Literal(1)) for i in (1, 2, 3)]
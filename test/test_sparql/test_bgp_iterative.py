@@ -0,0 +1,61 @@
+import pytest
+
+import rdflib.plugins.sparql
+from rdflib import Dataset, Literal, URIRef, Variable
+
+DATA = """
+@prefix : <urn:ex:> .
+:a :knows :b , :c , :a .
+:b :knows :c ; :name "b" .
+:c :knows :a ; :name "c" .
+:a :name "a" .
+"""
+
+QUERIES = [
+    "SELECT * { }",
+    "SELECT * { ?x :knows ?y }",
+    "SELECT * { ?x :knows ?x }",
+    "SELECT * { ?x ?p ?x }",
+    "SELECT * { ?x :knows ?y . ?y :knows ?z . ?z :knows ?x }",
+    "SELECT * { ?x :knows ?y . ?y :name ?n }",
+    "SELECT * { ?x :knows ?y OPTIONAL { ?y :knows ?z . ?z :name ?n } }",
+    "SELECT * { ?x :knows ?y FILTER EXISTS { ?y :knows ?x } }",
+    "SELECT * { _:b :knows ?y . ?y :knows _:b }",
+    "SELECT * { GRAPH ?g { ?x :knows ?y . ?y :knows ?z } }",
+    "SELECT * { VALUES ?x { :a :b } ?x :knows ?y . ?y :name ?n }",
+    "SELECT * { ?x :knows :nothing . ?y :knows ?x }",
+]
+
+
+@pytest.fixture(scope="module")
+def ds():
+    ds = Dataset()
+    ds.graph(URIRef("urn:ex:g")).parse(data=DATA, format="turtle")
+    ds.default_union = True
+    return ds
+
+
+def _solutions(ds, query, iterative, **kwargs):
+    res = ds.query("PREFIX : <urn:ex:> " + query, iterativeBGP=iterative, **kwargs)
+    return sorted(
+        tuple(sorted(b.items())) for b in res.bindings  # type: ignore[union-attr]
+    )
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_iterative_bgp(ds, query):
+    assert _solutions(ds, query, True) == _solutions(ds, query, False)
+
+
+def test_iterative_bgp_init_bindings(ds):
+    query = "SELECT * { ?x :knows ?y . ?y :knows ?z }"
+    init = {Variable("x"): URIRef("urn:ex:a")}
+    expected = _solutions(ds, query, False, initBindings=init)
+    assert expected
+    assert _solutions(ds, query, True, initBindings=init) == expected
+
+
+def test_iterative_bgp_default(ds, monkeypatch):
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_ITERATIVE_BGP", True)
+    res = ds.query("PREFIX : <urn:ex:> SELECT ?n { :a :knows ?y . ?y :name ?n }")
+    assert sorted(r[0] for r in res) == [Literal("a"), Literal("b"), Literal("c")]
@@ -0,0 +1,37 @@
+from rdflib import RDF, Graph, Namespace, Variable
+from rdflib.plugins.sparql.algebra import reorderTriples
+
+EX = Namespace("http://example.org/")
+
+s, t, x = Variable("s"), Variable("t"), Variable("x")
+
+
+def _statistics(predicate=None):
+    return {
+        None: (10010, 10000, 1010),
+        RDF.type: (10000, 10000, 1000),
+        EX.rare: (10, 10, 10),
+    }.get(predicate, (0, 0, 0))
+
+
+def test_reorder_by_cardinality():
+    bgp = [(s, RDF.type, t), (s, EX.rare, x)]
+    assert reorderTriples(bgp, _statistics) == [(s, EX.rare, x), (s, RDF.type, t)]
+
+
+def test_reorder_with_known_vars():
+    bgp = [(s, EX.rare, x), (t, RDF.type, EX.Thing)]
+    # ?t bound: 10000 / 10000 / 1000 triples expected for the rdf:type pattern
+    assert reorderTriples(bgp, _statistics, {t}) == [
+        (t, RDF.type, EX.Thing),
+        (s, EX.rare, x),
+    ]
+
+
+def test_query_with_statistics():
+    g = Graph()
+    for i in range(50):
+        g.add((EX["s%d" % i], RDF.type, EX.Thing))
+    g.add((EX.s1, EX.rare, EX.x))
+    res = g.query("SELECT ?s ?x { ?s a ?t . ?s ex:rare ?x }", initNs={"ex": EX})
+    assert list(res) == [(EX.s1, EX.x)]
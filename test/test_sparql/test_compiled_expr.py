@@ -0,0 +1,83 @@
+import pytest
+
+from rdflib import XSD, BNode, Literal, URIRef, Variable
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.evalutils import _compileEbv, _compileExpr, _ebv
+from rdflib.plugins.sparql.parserutils import Expr
+from rdflib.plugins.sparql.sparql import FrozenBindings, QueryContext, SPARQLError
+
+x, y, s = Variable("x"), Variable("y"), Variable("s")
+
+ROWS = [
+    {},
+    {x: Literal(5)},
+    {x: Literal(11), y: Literal(2.5)},
+    {x: Literal("abc"), y: Literal(0)},
+    {x: Literal("ABd", lang="en"), s: Literal("ab")},
+    {x: URIRef("urn:ex:ab"), y: BNode("b")},
+    {x: Literal("2001-10-26T21:32:52", datatype=XSD.dateTime), y: Literal("x")},
+    {x: Literal(True), y: Literal(False), s: Literal("^A", datatype=XSD.string)},
+]
+
+EXPRESSIONS = [
+    "?x > 10",
+    "?x > 10 && regex(?x, '^ab')",
+    "?x > 10 || regex(str(?x), '^ab', 'i')",
+    "regex(?x, ?s)",
+    "regex(?x, '[')",
+    "!bound(?y) || ?y = 0",
+    "?x + ?y * 2 - 1",
+    "?x / ?y",
+    "-?x",
+    "?x IN (1, 5, 'abc', ?y)",
+    "?x NOT IN (1, ?y)",
+    "?x != ?y",
+    "sameTerm(?x, ?x)",
+    "isIRI(?x) || isBlank(?y) || isLiteral(?x) && isNumeric(?y)",
+    "strlen(?x) >= 3",
+    "concat(str(?x), ?s, 'c')",
+    "ucase(lcase(?x))",
+    "contains(?x, 'b') && strstarts(?x, 'a') || strends(?x, 'd')",
+    "strbefore(?x, 'b')",
+    "substr(?x, 2, 1)",
+    "replace(?x, 'b', 'c')",
+    "lang(?x) = 'en' && langMatches(lang(?x), '*')",
+    "datatype(?x)",
+    "year(?x)",
+    "abs(?y) + ceil(?y) + floor(?y) + round(?y)",
+    "md5(str(?x))",
+    "if(?x > 5, 'big', 'small')",
+    "coalesce(?y, ?x, 1)",
+    "STRDT(str(?x), xsd:string)",
+    "xsd:integer(?x) + 1",
+]
+
+
+def _value(f, row):
+    # errors are not compared, and neither are exceptions
+    try:
+        v = f(row)
+    except Exception as e:
+        return type(e)
+    return SPARQLError if isinstance(v, SPARQLError) else v
+
+
+def _expression(text):
+    q = prepareQuery(
+        "SELECT ?r { BIND(%s AS ?r) }" % text,
+        initNs={"xsd": str(XSD)},
+    )
+    return q.algebra.p.p.expr
+
+
+@pytest.mark.parametrize("text", EXPRESSIONS)
+def test_compiled_expression(text):
+    expr = _expression(text)
+    assert isinstance(expr, Expr)
+    compiled = _compileExpr(expr)
+    ebv = _compileEbv(expr)
+    ctx = QueryContext(initBindings={})
+    for row in ROWS:
+        row = FrozenBindings(ctx, row)
+        assert _value(compiled, row) == _value(expr.eval, row)
+        assert _value(ebv, row) == _value(lambda row: _ebv(expr, row), row)
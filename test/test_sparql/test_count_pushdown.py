@@ -0,0 +1,58 @@
+import pytest
+
+import rdflib.plugins.sparql.evaluate
+from rdflib import RDF, Graph, Literal, URIRef
+
+EX = "urn:ex:"
+
+
+@pytest.fixture(scope="module")
+def graph():
+    g = Graph()
+    for i in range(20):
+        s = URIRef(f"{EX}s{i}")
+        g.add((s, RDF.type, URIRef(f"{EX}Person" if i % 3 else f"{EX}Robot")))
+        g.add((s, URIRef(f"{EX}knows"), URIRef(f"{EX}s{(i * 7) % 20}")))
+        g.add((s, URIRef(f"{EX}age"), Literal(i % 4)))
+    return g
+
+
+# the queries the store counts the matches of, and whether they are pushed
+# down to it
+QUERIES = [
+    ("SELECT (COUNT(*) AS ?n) { ?s a <urn:ex:Person> }", True),
+    ("SELECT (COUNT(?s) AS ?n) (COUNT(*) AS ?m) { ?s ?p ?o }", True),
+    ("SELECT (COUNT(?o) AS ?n) { <urn:ex:s1> ?p ?o }", True),
+    ("SELECT (COUNT(*) AS ?n) { ?s <urn:ex:nothing> ?o }", True),
+    ("SELECT (COUNT(?x) AS ?n) { ?s <urn:ex:age> ?o }", False),
+    ("SELECT (COUNT(*) AS ?n) { ?s <urn:ex:knows> ?s }", False),
+    ("SELECT (COUNT(DISTINCT ?o) AS ?n) { ?s <urn:ex:age> ?o }", False),
+    ("SELECT ?o (COUNT(*) AS ?n) { ?s <urn:ex:age> ?o } GROUP BY ?o", False),
+    ("SELECT (COUNT(*) AS ?n) { ?s a ?o . ?s <urn:ex:age> 1 }", False),
+]
+
+
+def _results(graph, query, **kwargs):
+    return sorted(tuple(r) for r in graph.query(query, **kwargs))
+
+
+@pytest.mark.parametrize("query, pushed", QUERIES)
+def test_count(graph, query, pushed, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(rdflib.plugins.sparql.evaluate, "_countPattern", lambda *a: None)
+        expected = _results(graph, query)
+
+    if pushed:
+        # the count comes from the indices of the store
+        def triples(*args, **kwargs):
+            raise AssertionError("the matches are enumerated")
+
+        monkeypatch.setattr(graph.store, "triples", triples)
+    assert _results(graph, query) == expected
+
+
+def test_count_bindings(graph):
+    query = "SELECT (COUNT(*) AS ?n) { ?s a ?o }"
+    assert _results(graph, query, initBindings={"o": URIRef(f"{EX}Robot")}) == [
+        (Literal(7),)
+    ]
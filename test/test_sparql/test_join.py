@@ -0,0 +1,67 @@
+import pytest
+
+from rdflib import Graph, Literal, URIRef, Variable
+from rdflib.plugins.sparql.evalutils import _hashJoin, _join, _mergeJoin, _val
+from rdflib.plugins.sparql.sparql import FrozenDict
+
+x, y, z = Variable("x"), Variable("y"), Variable("z")
+
+A = [
+    FrozenDict({x: Literal(1), y: Literal("a")}),
+    FrozenDict({x: Literal(2), y: Literal("b")}),
+    FrozenDict({y: Literal("c")}),
+    FrozenDict({x: URIRef("urn:x"), y: Literal("d")}),
+]
+
+B = [
+    FrozenDict({x: Literal(1), z: Literal(10)}),
+    FrozenDict({x: Literal(1), z: Literal(11)}),
+    FrozenDict({z: Literal(12)}),
+    FrozenDict({x: URIRef("urn:x"), z: Literal(13)}),
+    FrozenDict({x: Literal(3), z: Literal(14)}),
+]
+
+
+def _sorted(rows):
+    return sorted(rows, key=lambda r: _val(r.get(x, x)))
+
+
+def test_hash_join():
+    expected = set(_join(A, B))
+    assert len(expected) == 11
+    assert set(_hashJoin(A, B, [x])) == expected
+
+
+def test_hash_join_no_shared_vars():
+    assert set(_hashJoin(A, B, [])) == set(_join(A, B))
+
+
+def test_merge_join():
+    assert set(_mergeJoin(_sorted(A), _sorted(B), x)) == set(_join(A, B))
+
+
+@pytest.mark.parametrize("order", ["", "ORDER BY ?x"])
+def test_non_lazy_join(order):
+    # the LIMITs prevent the join from being evaluated lazily
+    query = """
+    SELECT ?x ?y ?z {
+        { SELECT ?x ?y { VALUES (?x ?y) { (1 "a") (2 "b") (UNDEF "c") } } %s LIMIT 10 }
+        { SELECT ?x ?z { VALUES (?x ?z) { (1 10) (1 11) (UNDEF 12) (3 13) } } %s LIMIT 10 }
+    }
+    """ % (
+        order,
+        order,
+    )
+    res = set(tuple(r) for r in Graph().query(query))
+    one, two, three = Literal(1), Literal(2), Literal(3)
+    a, b, c = Literal("a"), Literal("b"), Literal("c")
+    assert res == {
+        (one, a, Literal(10)),
+        (one, a, Literal(11)),
+        (one, a, Literal(12)),
+        (two, b, Literal(12)),
+        (one, c, Literal(10)),
+        (one, c, Literal(11)),
+        (None, c, Literal(12)),
+        (three, c, Literal(13)),
+    }
@@ -0,0 +1,54 @@
+from rdflib import Graph, Literal, Variable
+from rdflib.plugins.sparql.evalutils import _diff, _minus
+from rdflib.plugins.sparql.operators import TrueFilter
+from rdflib.plugins.sparql.sparql import FrozenDict
+
+x, y, z = Variable("x"), Variable("y"), Variable("z")
+
+A = [
+    FrozenDict({x: Literal(1), y: Literal(1)}),
+    FrozenDict({x: Literal(2), y: Literal(2)}),
+    FrozenDict({x: Literal(3)}),
+    FrozenDict({z: Literal(1)}),
+    FrozenDict({}),
+]
+
+B = [
+    FrozenDict({x: Literal(1), z: Literal(5)}),
+    FrozenDict({y: Literal(2)}),
+    FrozenDict({x: Literal(3), y: Literal(3)}),
+]
+
+
+def test_minus():
+    # {z: 1} shares no variables with B, {x: 3} is compatible with {x: 3, y: 3}
+    assert list(_minus(A, B)) == [FrozenDict({z: Literal(1)}), FrozenDict({})]
+
+
+def test_minus_empty():
+    assert list(_minus(A, [])) == A
+
+
+def test_diff():
+    # disjoint solutions are compatible, so only A rows incompatible
+    # with every row of B remain
+    assert _diff(A, B, TrueFilter) == set()
+    assert _diff(A, B[2:], TrueFilter) == {A[0], A[1]}
+
+
+def test_minus_query():
+    g = Graph().parse(
+        data="""
+        @prefix : <urn:ex:> .
+        :a a :Thing . :b a :Thing . :c a :Thing .
+        :b a :Deleted .
+        """,
+        format="turtle",
+    )
+    res = g.query(
+        """
+        PREFIX : <urn:ex:>
+        SELECT ?x { ?x a :Thing MINUS { ?x a :Deleted } MINUS { ?y a :Deleted } }
+        """
+    )
+    assert sorted(str(r[0]) for r in res) == ["urn:ex:a", "urn:ex:c"]
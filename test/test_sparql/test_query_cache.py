@@ -0,0 +1,59 @@
+import pytest
+
+import rdflib.plugins.sparql
+from rdflib import Graph, Literal, URIRef
+from rdflib.plugins.sparql import clearQueryCache, queryCacheInfo
+
+
+@pytest.fixture
+def graph():
+    clearQueryCache()
+    g = Graph()
+    g.add((URIRef("urn:ex:a"), URIRef("urn:ex:p"), Literal(1)))
+    g.add((URIRef("urn:ex:b"), URIRef("urn:ex:p"), Literal(2)))
+    yield g
+    clearQueryCache()
+
+
+def test_query_cache(graph):
+    query = "SELECT ?s { ?s ex:p ?o } ORDER BY ?o"
+    ns = {"ex": "urn:ex:"}
+    for _ in range(3):
+        res = graph.query(query, initNs=ns)
+        assert [r.s for r in res] == [URIRef("urn:ex:a"), URIRef("urn:ex:b")]
+
+    assert queryCacheInfo().hits == 2
+    assert queryCacheInfo().misses == 1
+    assert queryCacheInfo().currsize == 1
+
+    # the namespaces and base are part of the key
+    res = graph.query(query, initNs={"ex": "urn:other:"})
+    assert list(res) == []
+    graph.query("SELECT ?s { ?s <p> ?o }", base="urn:ex:")
+    graph.query("SELECT ?s { ?s <p> ?o }", base="urn:other:")
+    assert queryCacheInfo().misses == 4
+
+
+def test_query_cache_bindings(graph):
+    query = "SELECT ?s { ?s <urn:ex:p> ?o }"
+    for o, s in [(1, "urn:ex:a"), (2, "urn:ex:b")]:
+        res = graph.query(query, initBindings={"o": Literal(o)})
+        assert [r.s for r in res] == [URIRef(s)]
+    assert queryCacheInfo().hits == 1
+
+
+def test_query_cache_size(graph, monkeypatch):
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_QUERY_CACHE_SIZE", 2)
+    for i in [1, 2, 1, 3, 1, 2]:
+        graph.query(f"SELECT * {{ ?s ?p {i} }}")
+
+    # 2 was dropped when 3 was added, as 1 was used more recently
+    info = queryCacheInfo()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 4, 2, 2)
+
+
+def test_query_cache_disabled(graph, monkeypatch):
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_QUERY_CACHE_SIZE", 0)
+    graph.query("ASK { ?s ?p ?o }")
+    graph.query("ASK { ?s ?p ?o }")
+    assert queryCacheInfo() == (0, 2, 0, 0)
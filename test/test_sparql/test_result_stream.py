@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+from io import BytesIO, StringIO
+
+import pytest
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.query import Result
+from rdflib.term import Variable
+
+EG = "http://example.org/"
+
+
+class TrickleIO(BytesIO):
+    """
+    Returns at most one byte per read, like a slow response
+    """
+
+    def read(self, size: int | None = -1) -> bytes:
+        return super().read(1 if size else 0)
+
+    read1 = read
+
+
+def make_select(rows: int = 5) -> Result:
+    g = Graph()
+    for i in range(rows):
+        s = URIRef(f"{EG}s{i}")
+        g.add((s, URIRef(f"{EG}p"), Literal(i + 1)))
+        g.add((s, URIRef(f"{EG}q"), Literal(f"é{i}", lang="fr")))
+        if i % 2:
+            g.add((s, URIRef(f"{EG}r"), BNode(f"b{i}")))
+    return g.query(
+        f"""
+        SELECT ?s ?i ?l ?b WHERE {{
+            ?s <{EG}p> ?i ; <{EG}q> ?l .
+            OPTIONAL {{ ?s <{EG}r> ?b }}
+        }} ORDER BY ?i
+        """
+    )
+
+
+def serialize(result: Result, format: str) -> bytes:
+    if format == "tsv":
+        # there is no TSV result serializer
+        lines = ["\t".join(var.n3() for var in result.vars)]
+        for row in result:
+            lines.append("\t".join("" if t is None else t.n3() for t in row))
+        return "\n".join(lines).encode("utf-8")
+    data = result.serialize(format=format)
+    assert data is not None
+    return data
+
+
+@pytest.mark.parametrize("format", ["json", "xml", "tsv"])
+@pytest.mark.parametrize("source_type", [BytesIO, TrickleIO, StringIO])
+def test_stream_select(format: str, source_type: type) -> None:
+    expected = make_select()
+    data = serialize(expected, format)
+    source = (
+        StringIO(data.decode("utf-8")) if source_type is StringIO else source_type(data)
+    )
+
+    result = Result.parse(source, format=format, stream=True)
+    assert result._genbindings is not None
+    assert result.type == "SELECT"
+    assert result.vars == expected.vars
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize("format", ["json", "xml", "tsv"])
+def test_stream_reads_incrementally(format: str) -> None:
+    data = serialize(make_select(2000), format)
+    if format == "json":
+        # the head first, as endpoints write it, so that the bindings do
+        # not have to be kept until it is read
+        document = json.loads(data)
+        data = json.dumps(
+            {"head": document["head"], "results": document["results"]}
+        ).encode("utf-8")
+    source = BytesIO(data)
+
+    result = Result.parse(source, format=format, stream=True)
+    rows = iter(result)
+    first = next(rows)
+    assert first[Variable("s")] == URIRef(f"{EG}s0")
+    assert source.tell() < len(data)
+    assert len(list(rows)) == 1999
+
+
+def test_stream_xml_reads_text_incrementally() -> None:
+    data = serialize(make_select(2000), "xml").decode("utf-8")
+    source = StringIO(data)
+
+    result = Result.parse(source, format="xml", stream=True)
+    rows = iter(result)
+    first = next(rows)
+    assert first[Variable("l")] == Literal("é0", lang="fr")
+    assert source.tell() < len(data)
+    assert len(list(rows)) == 1999
+
+
+@pytest.mark.parametrize("format", ["json", "xml"])
+@pytest.mark.parametrize("answer", [True, False])
+def test_stream_ask(format: str, answer: bool) -> None:
+    g = Graph()
+    if answer:
+        g.add((URIRef(f"{EG}s"), URIRef(f"{EG}p"), URIRef(f"{EG}o")))
+    data = g.query("ASK { ?s ?p ?o }").serialize(format=format)
+    assert data is not None
+    result = Result.parse(TrickleIO(data), format=format, stream=True)
+    assert result.type == "ASK"
+    assert result.askAnswer is answer
+
+
+def test_stream_json_members_in_any_order() -> None:
+    data = b"""
+    {
+      "results": {
+        "ordered": true,
+        "bindings": [
+          {"x": {"type": "literal", "value": "1",
+                 "datatype": "http://www.w3.org/2001/XMLSchema#integer"}},
+          {"x": {"type": "uri", "value": "http://example.org/a"}},
+          {}
+        ],
+        "distinct": false
+      },
+      "link": ["http://example.org/link"],
+      "head": {"vars": ["x"]}
+    }
+    """
+    result = Result.parse(TrickleIO(data), format="json", stream=True)
+    assert result.vars == [Variable("x")]
+    assert result.bindings == [
+        {Variable("x"): Literal(1, datatype=XSD.integer)},
+        {Variable("x"): URIRef(f"{EG}a")},
+        {},
+    ]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"head": {"vars": ["x"]}}',
+        b'{"head": {"vars": ["x"]}, "results": {"bindings": [{"x": ',
+    ],
+)
+def test_stream_json_invalid(data: bytes) -> None:
+    from rdflib.query import ResultException
+
+    with pytest.raises(ResultException):
+        list(Result.parse(BytesIO(data), format="json", stream=True))
+
+
+@pytest.mark.parametrize("format", ["json", "xml", "csv"])
+def test_serialize_writes_each_binding(format: str) -> None:
+    expected = make_select()
+    data = serialize(expected, format)
+    stream = BytesIO()
+    written = []
+
+    def bindings():
+        for b in expected.bindings:
+            written.append(len(stream.getvalue()))
+            yield b
+
+    result = Result("SELECT")
+    result.vars = expected.vars
+    result.bindings = bindings()
+    result.serialize(stream, format=format)
+    assert stream.getvalue() == data
+    # each binding is written before the next one is produced
+    assert written == sorted(set(written))
+    assert list(result) == list(expected)
+    assert result.serialize(format=format) == data
+
+
+@pytest.mark.parametrize("format", ["json", "xml", "csv"])
+def test_serialize_stream(format: str) -> None:
+    data = serialize(make_select(), format)
+    result = make_select()
+    assert result._genbindings is not None
+    stream = BytesIO()
+    result.serialize(stream, format=format, stream=True)
+    assert stream.getvalue() == data
+    # the bindings written are not kept
+    assert result._genbindings is None
+    assert list(result) == []
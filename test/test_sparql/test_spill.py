@@ -0,0 +1,104 @@
+import tempfile
+
+import pytest
+
+import rdflib.plugins.sparql
+from rdflib import BNode, Graph, Literal, URIRef, Variable
+from rdflib.plugins.sparql import evalutils
+from rdflib.plugins.sparql.evaluate import _spillDistinct
+from rdflib.plugins.sparql.sparql import FrozenDict
+
+
+@pytest.fixture(scope="module")
+def graph():
+    g = Graph()
+    p = URIRef("urn:ex:p")
+    for i in range(200):
+        s = URIRef(f"urn:ex:s{i % 37}")
+        g.add((s, p, Literal(i % 11)))
+        g.add((s, p, Literal(f"{i % 13}", lang="en")))
+        g.add((BNode(f"b{i % 5}"), p, Literal(i % 3)))
+    return g
+
+
+QUERIES = [
+    "SELECT ?s ?o { ?s ?p ?o } ORDER BY ?o DESC(?s)",
+    "SELECT ?o { ?s ?p ?o } ORDER BY STR(?o)",
+    "SELECT DISTINCT ?o { ?s ?p ?o }",
+    "SELECT DISTINCT ?s { ?s ?p ?o } ORDER BY ?o",
+    "SELECT DISTINCT ?o { ?s ?p ?o } ORDER BY DESC(?s)",
+    "SELECT DISTINCT ?s ?x { ?s ?p ?o OPTIONAL { ?s ?p ?x FILTER(?x = 3) } }",
+]
+
+
+@pytest.mark.parametrize("size", [2, 50, 10000])
+@pytest.mark.parametrize("query", QUERIES)
+def test_spill(graph, query, size, monkeypatch):
+    expected = list(graph.query(query))
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_MAX_ROWS_IN_MEMORY", size)
+    assert list(graph.query(query)) == expected
+
+
+def test_spill_language_case(monkeypatch):
+    query = 'SELECT DISTINCT ?o { VALUES ?o { "a"@en "b"@en "c"@en "a"@EN } }'
+    expected = list(Graph().query(query))
+    assert len(expected) == 3
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_MAX_ROWS_IN_MEMORY", 1)
+    assert list(Graph().query(query)) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT ?o { VALUES ?o { 1 2 3 4 5 } } ORDER BY ?o",
+        "SELECT DISTINCT ?o { VALUES ?o { 1 2 3 4 5 } }",
+    ],
+)
+def test_spill_no_rows_in_memory(query, monkeypatch):
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_MAX_ROWS_IN_MEMORY", 0)
+    with pytest.raises(ValueError):
+        list(Graph().query(query))
+
+
+def test_no_rows_in_memory_unused(monkeypatch):
+    monkeypatch.setattr(rdflib.plugins.sparql, "SPARQL_MAX_ROWS_IN_MEMORY", 0)
+    assert len(Graph().query("SELECT ?o { VALUES ?o { 1 2 3 } }")) == 3
+
+
+def test_spill_distinct_streams():
+    def solutions():
+        for i in range(100):
+            read.append(i)
+            yield FrozenDict({Variable("o"): Literal(i % 10)})
+
+    read = []
+    distinct = _spillDistinct(set(), solutions(), 3)
+    for i in range(10):
+        assert next(distinct)[Variable("o")] == Literal(i)
+        # each solution is given as soon as it is read
+        assert read[-1] == i
+    assert list(distinct) == []
+    assert len(read) == 100
+
+
+def test_external_sort_open_files(monkeypatch):
+    open_files = []
+    most_open = 0
+
+    temporary_file_ = tempfile.TemporaryFile
+
+    def temporary_file():
+        nonlocal most_open
+        f = temporary_file_()
+        open_files.append(f)
+        most_open = max(most_open, sum(not f.closed for f in open_files))
+        return f
+
+    monkeypatch.setattr(evalutils, "_MERGE_FAN_IN", 3)
+    monkeypatch.setattr(evalutils.tempfile, "TemporaryFile", temporary_file)
+    rows = [(i * 7919 % 500, i) for i in range(500)]
+    result = list(evalutils._externalSort(rows, lambda x: x[0] // 10, 2))
+    assert result == sorted(rows, key=lambda x: x[0] // 10)
+    # 250 runs, merged three at a time
+    assert len(open_files) > 250
+    assert most_open <= 20
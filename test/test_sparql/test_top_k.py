@@ -0,0 +1,50 @@
+import pytest
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.plugins.sparql import prepareQuery
+
+
+@pytest.fixture(scope="module")
+def graph():
+    g = Graph()
+    for i in range(50):
+        s = URIRef(f"urn:ex:s{i}")
+        g.add((s, URIRef("urn:ex:a"), Literal(i % 7)))
+        if i % 5:
+            g.add((s, URIRef("urn:ex:b"), Literal(f"v{i % 3}")))
+    return g
+
+
+@pytest.mark.parametrize(
+    "orderby",
+    [
+        "?a",
+        "DESC(?a)",
+        "?a DESC(?b)",
+        "DESC(?b) ?a ?s",
+        "?b",
+    ],
+)
+@pytest.mark.parametrize(
+    "limit", ["LIMIT 0", "LIMIT 5", "LIMIT 5 OFFSET 7", "LIMIT 100"]
+)
+def test_top_k(graph, orderby, limit):
+    query = (
+        "SELECT ?s ?a ?b { ?s <urn:ex:a> ?a OPTIONAL { ?s <urn:ex:b> ?b } } ORDER BY "
+        + orderby
+    )
+    full = list(graph.query(query))
+    length = int(limit.split()[1])
+    offset = int(limit.split()[3]) if "OFFSET" in limit else 0
+
+    assert list(graph.query(f"{query} {limit}")) == full[offset : offset + length]
+
+
+def test_top_k_algebra():
+    q = prepareQuery("SELECT ?s { ?s ?p ?o } ORDER BY ?o LIMIT 3 OFFSET 2")
+    assert q.algebra.p.p.p.name == "OrderBy"
+    assert q.algebra.p.p.p.limit == 5
+
+    # DISTINCT may need more than the first rows
+    q = prepareQuery("SELECT DISTINCT ?s { ?s ?p ?o } ORDER BY ?o LIMIT 3")
+    assert q.algebra.p.p.p.p.limit is None
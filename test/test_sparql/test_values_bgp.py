@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+import rdflib.plugins.sparql.evaluate
+from rdflib import Graph, Literal, URIRef
+
+
+@pytest.fixture(scope="module")
+def graph():
+    rnd = random.Random(0)
+    terms = [URIRef(f"urn:ex:t{i}") for i in range(8)]
+    g = Graph()
+    for _ in range(200):
+        g.add(
+            (
+                rnd.choice(terms),
+                rnd.choice(terms[:3]),
+                rnd.choice([*terms, Literal(1), Literal(2)]),
+            )
+        )
+    return g
+
+
+QUERIES = [
+    "SELECT * { VALUES ?s { <urn:ex:t1> <urn:ex:t2> <urn:ex:x> } ?s ?p ?o . ?o ?q ?r }",
+    "SELECT * { ?s ?p ?o . ?o ?q ?r VALUES ?s { <urn:ex:t1> <urn:ex:t2> } }",
+    "SELECT * { ?s ?p ?o } "
+    "VALUES (?s ?o) { (<urn:ex:t1> UNDEF) (<urn:ex:t2> <urn:ex:t3>) (<urn:ex:t2> <urn:ex:t3>) }",
+    "SELECT * { ?s ?p ?o } VALUES (?s ?o) { (UNDEF <urn:ex:t1>) (<urn:ex:t2> <urn:ex:t3>) }",
+    "SELECT * { VALUES ?o { 1 2 <urn:ex:t0> } ?s <urn:ex:t1> ?o }",
+    "SELECT * { VALUES ?p { <urn:ex:t1> <urn:ex:t2> } ?s ?p ?s }",
+    "SELECT * { VALUES ?p { <urn:ex:t1> } ?s ?p ?x . ?x ?p ?x }",
+    "SELECT * { VALUES ?x { <urn:ex:t1> } ?s <urn:ex:t0> ?o }",
+    "SELECT * { VALUES ?s { <urn:ex:t1> <urn:ex:t3> } ?s <urn:ex:t0>/<urn:ex:t1> ?o }",
+]
+
+
+def _results(graph, query):
+    return sorted(tuple(sorted(r.asdict().items())) for r in graph.query(query))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_values_bgp(graph, query, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(rdflib.plugins.sparql.evaluate, "_evalValuesBGP", lambda *a: None)
+        expected = _results(graph, query)
+
+    assert _results(graph, query) == expected
+
+
+def test_values_bgp_choices(graph, monkeypatch):
+    """the values are looked up in the store at once"""
+    calls = []
+    triples_choices = graph.store.triples_choices
+
+    def spy(triple, context=None):
+        calls.append(triple)
+        return triples_choices(triple, context)
+
+    monkeypatch.setattr(graph.store, "triples_choices", spy)
+    query = "SELECT * { ?s ?p ?o VALUES ?s { <urn:ex:t1> <urn:ex:t2> } }"
+    assert len(graph.query(query)) == len(
+        list(
+            graph.triples_choices(
+                ([URIRef("urn:ex:t1"), URIRef("urn:ex:t2")], None, None)
+            )
+        )
+    )
+    assert calls[0] == ([URIRef("urn:ex:t1"), URIRef("urn:ex:t2")], None, None)
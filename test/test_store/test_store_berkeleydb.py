@@ -170,3 +170,13 @@ def test_open_shut(get_graph: tuple[str, ConjunctiveGraph]):
     assert (
         len(g) == 3
     ), "After close and reopen, we should still have the 3 originally added triples"
+
+
+def test_predicate_statistics(get_graph: tuple[str, ConjunctiveGraph]):
+    path, g = get_graph
+    d, e = URIRef("https://example.org/d"), URIRef("https://example.org/e")
+    assert g.store.predicate_statistics(e) == (1, 1, 1)
+    assert g.store.predicate_statistics() == (3, 2, 3)
+    g.remove((d, None, None))
+    assert g.store.predicate_statistics(e) == (0, 0, 0)
+    assert g.store.predicate_statistics() == (1, 1, 1)
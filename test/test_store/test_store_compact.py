@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import rdflib.plugins.stores.compact
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.graph import QuotedGraph
+from rdflib.plugins.stores.compact import CompactMemory
+from rdflib.plugins.stores.memory import Memory
+
+EG = "http://example.org/"
+
+
+@pytest.fixture(params=[8, 100_000], ids=["merged", "buffered"])
+def buffer_size(request, monkeypatch: pytest.MonkeyPatch) -> int:
+    monkeypatch.setattr(rdflib.plugins.stores.compact, "_BUFFER_SIZE", request.param)
+    return request.param
+
+
+def test_registered():
+    assert isinstance(Graph("Compact").store, CompactMemory)
+
+
+def _triples(store, pattern, context):
+    return sorted(
+        (triple, sorted(str(c.identifier) for c in contexts))
+        for triple, contexts in store.triples(pattern, context)
+    )
+
+
+def _contexts(contexts):
+    return sorted(str(c.identifier) for c in contexts)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_same_as_memory(buffer_size: int, seed: int):
+    """
+    Random adds and removes in several contexts, with quoted statements,
+    give the same triples, contexts and lengths as the Memory store.
+    """
+    rnd = random.Random(seed)
+    terms = [URIRef(f"{EG}t{i}") for i in range(5)] + [
+        Literal(1),
+        Literal("1"),
+        BNode("b"),
+    ]
+    stores = Memory(), CompactMemory()
+    graphs = [
+        {i: Graph(store=store, identifier=URIRef(f"{EG}g{i}")) for i in range(3)}
+        for store in stores
+    ]
+
+    def pattern():
+        return tuple(rnd.choice(terms + [None, None]) for _ in range(3))
+
+    for _ in range(1000):
+        i = rnd.choice([None, 0, 1, 2])
+        r = rnd.random()
+        if r < 0.55:
+            triple = tuple(rnd.choice(terms) for _ in range(3))
+            quoted = rnd.random() < 0.15
+            for store, g in zip(stores, graphs):
+                store.add(triple, g.get(i), quoted=quoted)
+        elif r < 0.7:
+            p = pattern()
+            for store, g in zip(stores, graphs):
+                store.remove(p, g.get(i))
+
+        p = pattern()
+        triple = tuple(rnd.choice(terms) for _ in range(3))
+        memory, compact = (
+            (
+                _triples(store, p, g.get(i)),
+                len(store) if i is None else store.__len__(g[i]),
+                _contexts(store.contexts(triple)),
+                _contexts(store.contexts()),
+            )
+            for store, g in zip(stores, graphs)
+        )
+        assert memory == compact
+
+
+def test_dataset(buffer_size: int):
+    ds = Dataset(store="Compact")
+    g1 = ds.graph(URIRef(f"{EG}g1"))
+    g2 = ds.graph(URIRef(f"{EG}g2"))
+    for i in range(100):
+        g1.add((URIRef(f"{EG}s{i}"), URIRef(f"{EG}p"), Literal(i)))
+        if i % 2:
+            g2.add((URIRef(f"{EG}s{i}"), URIRef(f"{EG}p"), Literal(i)))
+
+    assert len(g1) == 100
+    assert len(g2) == 50
+    assert len(list(ds.store.triples((None, URIRef(f"{EG}p"), None)))) == 100
+    assert set(
+        ds.store.contexts((URIRef(f"{EG}s1"), URIRef(f"{EG}p"), Literal(1)))
+    ) == {
+        g1,
+        g2,
+    }
+
+    g1.remove((None, None, Literal(1)))
+    assert len(g1) == 99
+    assert set(
+        ds.store.contexts((URIRef(f"{EG}s1"), URIRef(f"{EG}p"), Literal(1)))
+    ) == {g2}
+
+    ds.remove_graph(g2)
+    assert len(g2) == 0
+    assert len(list(ds.quads((None, None, None, None)))) == 99
+
+
+def test_quoted():
+    g = Graph(store="Compact")
+    formula = QuotedGraph(g.store, URIRef(f"{EG}f"))
+    triple = (URIRef(f"{EG}a"), URIRef(f"{EG}b"), URIRef(f"{EG}c"))
+    formula.add(triple)
+    assert len(formula) == 1
+    assert len(g) == 0
+    assert list(g.store.triples(triple, None)) == []
+    assert list(g.store.contexts(triple)) == []
+
+
+def test_remove_while_iterating(buffer_size: int):
+    g = Graph(store="Compact")
+    for i in range(100):
+        g.add((URIRef(f"{EG}s{i}"), URIRef(f"{EG}p"), Literal(i)))
+    for triple in g.triples((None, URIRef(f"{EG}p"), None)):
+        g.remove(triple)
+        g.add((triple[0], URIRef(f"{EG}q"), triple[2]))
+    assert len(g) == 100
+    assert set(g.predicates()) == {URIRef(f"{EG}q")}
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import random
+import threading
+
+import pytest
+
+from rdflib import Dataset, Graph, Literal, URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.stores.concurrent import ConcurrentStore, ReadWriteLock
+from rdflib.plugins.stores.memory import Memory
+from test.utils.namespace import EGDO
+
+
+def test_graph():
+    g = Graph("Concurrent")
+    assert isinstance(g.store, ConcurrentStore)
+    assert isinstance(g.store.store, Memory)
+    g.add((EGDO.s, EGDO.p, EGDO.o))
+    g.add((EGDO.s, EGDO.p, Literal(1)))
+    for s, p, o in g:
+        # the store can be written while iterating
+        g.add((o, p, s))
+    assert len(g) == 4
+    assert g.count((EGDO.s, None, None)) == 2
+    assert set(g.query("SELECT ?o { ?s ?p ?o } ORDER BY ?o")) == {
+        (EGDO.o,),
+        (EGDO.s,),
+        (Literal(1),),
+    }
+
+
+def test_dataset():
+    ds = Dataset(ConcurrentStore())
+    g = ds.graph(EGDO.g)
+    g.add((EGDO.s, EGDO.p, EGDO.o))
+    ds.add((EGDO.s, EGDO.p, EGDO.o2))
+    assert set(ds.quads((None, None, None, None))) == {
+        (EGDO.s, EGDO.p, EGDO.o, EGDO.g),
+        (EGDO.s, EGDO.p, EGDO.o2, ds.default_context.identifier),
+    }
+    ds.update("DELETE { GRAPH ?g { ?s ?p ?o } } WHERE { GRAPH ?g { ?s ?p ?o } }")
+    assert set(ds.triples((None, None, None))) == {(EGDO.s, EGDO.p, EGDO.o2)}
+
+
+def test_threads():
+    g = Graph("Concurrent")
+    errors = []
+    # the query parser can't be used by many threads at once
+    count = prepareQuery("SELECT (COUNT(*) AS ?n) { ?s ?p ?o }")
+    subjects = prepareQuery("SELECT DISTINCT ?s { ?s ?p ?o }")
+
+    def write(n: int) -> None:
+        try:
+            for i in range(200):
+                g.add((EGDO[f"s{n}"], EGDO.p, Literal(i)))
+        except Exception as e:
+            errors.append(e)
+
+    def read() -> None:
+        try:
+            for _ in range(20):
+                for (n,) in g.query(count):
+                    assert 0 <= n.toPython() <= 800
+                for (s,) in g.query(subjects):
+                    assert s in {EGDO[f"s{n}"] for n in range(4)}
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(g) == 800
+
+
+def quads(store):
+    return {
+        (t, c.identifier) for t, cs in store.triples((None, None, None)) for c in cs
+    }
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_snapshot(seed: int):
+    rng = random.Random(seed)
+    store = ConcurrentStore()
+    terms = [EGDO[f"t{i}"] for i in range(4)]
+    graphs = [Graph(store, identifier=EGDO[f"g{i}"]) for i in range(3)]
+
+    def change() -> None:
+        for _ in range(30):
+            g = rng.choice(graphs)
+            triple = tuple(rng.choice(terms) for _ in range(3))
+            if rng.random() < 0.6:
+                g.add(triple)
+            else:
+                g.remove(tuple(rng.choice([None, t]) for t in triple))
+
+    change()
+    snapshots = []
+    for _ in range(3):
+        snapshot = store.snapshot()
+        expected = {
+            g.identifier: (set(g), {t: set(g.triples((t, None, None))) for t in terms})
+            for g in graphs
+        }
+        snapshots.append((snapshot, quads(store), expected, len(store)))
+        change()
+    for snapshot, before, expected, length in snapshots:
+        assert quads(snapshot) == before
+        assert len(snapshot) == length
+        for identifier, (triples, by_subject) in expected.items():
+            g = Graph(snapshot, identifier=identifier)
+            assert set(g) == triples
+            assert len(g) == len(triples)
+            for t in terms:
+                assert set(g.triples((t, None, None))) == by_subject[t]
+            for triple in triples:
+                assert identifier in {c.identifier for c in snapshot.contexts(triple)}
+        snapshot.close()
+
+
+def test_snapshot_query():
+    store = ConcurrentStore()
+    ds = Dataset(store)
+    ds.add((EGDO.s, EGDO.p, Literal(1), EGDO.g))
+    with store.snapshot() as snapshot:
+        ds.add((EGDO.s, EGDO.p, Literal(2), EGDO.g))
+        ds.remove((None, None, Literal(1), None))
+        query = "SELECT ?o { GRAPH ?g { ?s ?p ?o } }"
+        assert list(Dataset(snapshot).query(query)) == [(Literal(1),)]
+        assert list(ds.query(query)) == [(Literal(2),)]
+        with pytest.raises(TypeError):
+            Graph(snapshot).add((EGDO.s, EGDO.p, EGDO.o))
+    assert set(ds) == {(EGDO.s, EGDO.p, Literal(2), EGDO.g)}
+
+
+def test_snapshot_released():
+    store = ConcurrentStore()
+    g = Graph(store)
+    with store.snapshot() as snapshot:
+        pass
+    g.add((EGDO.s, EGDO.p, EGDO.o))
+    assert snapshot._changed == {}
+
+
+def test_lock_writer_waits_for_readers():
+    lock = ReadWriteLock()
+    events = []
+    lock.acquire_read()
+    writer = threading.Thread(
+        target=lambda: (
+            lock.acquire_write(),
+            events.append("write"),
+            lock.release_write(),
+        )
+    )
+    writer.start()
+    writer.join(0.1)
+    assert events == []
+    # a writer is waiting, so new readers wait for it
+    reader = threading.Thread(
+        target=lambda: (lock.acquire_read(), events.append("read"), lock.release_read())
+    )
+    reader.start()
+    reader.join(0.1)
+    assert events == []
+    lock.release_read()
+    writer.join()
+    reader.join()
+    assert events == ["write", "read"]
+
+
+def test_lock_reentrant():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    with lock.write():
+        pass
+
+
+def test_wrapped_store():
+    memory = Memory()
+    store = ConcurrentStore(memory)
+    assert store.context_aware and store.formula_aware and store.graph_aware
+    g = Graph(store, identifier=URIRef("urn:example:g"))
+    g.add((EGDO.s, EGDO.p, EGDO.o))
+    assert len(memory) == 1
+    g.bind("eg", EGDO)
+    assert memory.namespace("eg") == URIRef(str(EGDO))
@@ -46,3 +46,223 @@ def test_sparql_bindings_creating_new_graph():
     # Ensure it doesn't raise RuntimeError: Set changed size during iteration
     results = dataset.query(sparql_query)
     assert len(results) == 1
+
+
+def test_predicate_statistics():
+    g = rdflib.Graph("Memory")
+    ex = rdflib.Namespace("http://example.org/")
+    assert g.store.predicate_statistics() == (0, 0, 0)
+    g.add((ex.a, ex.p, ex.x))
+    g.add((ex.a, ex.p, ex.y))
+    g.add((ex.b, ex.p, ex.x))
+    g.add((ex.b, ex.q, ex.z))
+    assert g.store.predicate_statistics(ex.p) == (3, 2, 2)
+    assert g.store.predicate_statistics(ex.q) == (1, 1, 1)
+    assert g.store.predicate_statistics(ex.r) == (0, 0, 0)
+    assert g.store.predicate_statistics() == (4, 2, 3)
+
+    g.remove((ex.a, ex.p, None))
+    assert g.store.predicate_statistics(ex.p) == (1, 1, 1)
+    assert g.store.predicate_statistics() == (2, 1, 2)
+    g.remove((None, ex.q, None))
+    assert g.store.predicate_statistics(ex.q) == (0, 0, 0)
+    assert g.store.predicate_statistics() == (1, 1, 1)
+
+
+def _bulk_data(ex):
+    return [
+        (ex[f"s{i // 3}"], ex[f"p{i % 2}"], rdflib.Literal(i % 7)) for i in range(60)
+    ]
+
+
+def test_bulk_load():
+    ex = rdflib.Namespace("http://example.org/")
+    expected = rdflib.Graph("Memory")
+    for triple in _bulk_data(ex):
+        expected.add(triple)
+
+    g = rdflib.Graph("Memory")
+    with g.bulk_load():
+        with g.bulk_load():
+            for triple in _bulk_data(ex)[:30]:
+                g.add(triple)
+        # lookups during the load see the pending triples
+        assert set(g.triples((None, ex.p0, None))) == set(
+            expected.triples((None, ex.p0, None))
+        ) & set(_bulk_data(ex)[:30])
+        g += _bulk_data(ex)[30:]
+        g.add(_bulk_data(ex)[0])
+
+    for pattern in [
+        (None, None, None),
+        (None, ex.p1, None),
+        (None, None, rdflib.Literal(3)),
+    ]:
+        assert set(g.triples(pattern)) == set(expected.triples(pattern))
+    assert g.store.predicate_statistics() == expected.store.predicate_statistics()
+    assert g.store.predicate_statistics(ex.p0) == expected.store.predicate_statistics(
+        ex.p0
+    )
+
+    g.remove((None, None, rdflib.Literal(3)))
+    expected.remove((None, None, rdflib.Literal(3)))
+    assert set(g) == set(expected)
+
+
+def test_addn_contexts():
+    ex = rdflib.Namespace("http://example.org/")
+    ds = rdflib.Dataset("Memory")
+    g1 = ds.graph(ex.g1)
+    g2 = ds.graph(ex.g2)
+    triple = (ex.a, ex.p, ex.b)
+    ds.store.addN([(*triple, g1), (*triple, g2), (ex.a, ex.p, ex.c, g1)])
+    assert len(g1) == 2
+    assert len(g2) == 1
+    assert set(ds.store.contexts(triple)) == {g1, g2}
+    assert list(ds.store.triples((None, None, ex.c), g2)) == []
+    assert {t for t, _ in ds.store.triples((None, ex.p, None), g1)} == {
+        triple,
+        (ex.a, ex.p, ex.c),
+    }
+
+
+def test_addn_dispatches_events():
+    from rdflib.store import TripleAddedEvent
+
+    ex = rdflib.Namespace("http://example.org/")
+    g = rdflib.Graph("Memory")
+    events = []
+    g.store.dispatcher.subscribe(TripleAddedEvent, events.append)
+    g += [(ex.a, ex.p, ex.b), (ex.a, ex.p, ex.c)]
+    assert [event.triple for event in events] == [
+        (ex.a, ex.p, ex.b),
+        (ex.a, ex.p, ex.c),
+    ]
+
+
+def test_parse_indexes():
+    g = rdflib.Graph("Memory")
+    g.parse(
+        data="""
+        <http://example.org/a> <http://example.org/p> <http://example.org/b> .
+        <http://example.org/c> <http://example.org/p> <http://example.org/b> .
+        """,
+        format="nt",
+    )
+    ex = rdflib.Namespace("http://example.org/")
+    assert set(g.subjects(ex.p, ex.b)) == {ex.a, ex.c}
+    assert set(g.triples((None, None, ex.b))) == {
+        (ex.a, ex.p, ex.b),
+        (ex.c, ex.p, ex.b),
+    }
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_count(seed):
+    import random
+
+    from rdflib.graph import QuotedGraph
+
+    rnd = random.Random(seed)
+    ex = rdflib.Namespace("http://example.org/")
+    terms = [ex[f"t{i}"] for i in range(4)] + [rdflib.Literal(1)]
+    store = rdflib.plugins.stores.memory.Memory()
+    graphs = [rdflib.Graph(store, identifier=ex[f"g{i}"]) for i in range(2)]
+    formula = QuotedGraph(store, ex.f)
+    contexts = [None, *graphs, formula]
+
+    def triple():
+        return tuple(rnd.choice(terms) for _ in range(3))
+
+    for step in range(60):
+        # only one context at first, so that the counts come from the indices
+        g = rnd.choice(contexts[1:]) if step > 30 else graphs[0]
+        if rnd.random() < 0.8:
+            store.add(triple(), g, quoted=g is formula)
+        else:
+            store.remove(triple(), g)
+        for _ in range(5):
+            pattern = tuple(rnd.choice([*terms, None, None]) for _ in range(3))
+            for context in contexts:
+                assert store.count(pattern, context) == len(
+                    list(store.triples(pattern, context))
+                )
+
+
+def test_graph_count():
+    ex = rdflib.Namespace("http://example.org/")
+    ds = rdflib.Dataset("Memory")
+    g1 = ds.graph(ex.g1)
+    g2 = ds.graph(ex.g2)
+    g1.add((ex.a, ex.p, ex.b))
+    g1.add((ex.b, ex.p, ex.c))
+    g2.add((ex.a, ex.p, ex.b))
+    ds.add((ex.a, ex.q, ex.b))
+
+    assert g1.count() == 2
+    assert g1.count((ex.a, None, None)) == 1
+    assert g1.count((ex.a, ex.p / ex.p, None)) == 1
+    assert ds.count() == 1
+    assert ds.count((None, None, None, ex.g1)) == 2
+    ds.default_union = True
+    assert ds.count() == 3
+    assert ds.count((ex.a, None, None)) == 2
+
+
+@pytest.mark.parametrize("name", ["SimpleMemory", "Memory"])
+@pytest.mark.parametrize("seed", range(2))
+def test_triples_choices(name, seed):
+    import random
+
+    from rdflib.graph import QuotedGraph
+    from rdflib.store import Store
+
+    rnd = random.Random(seed)
+    ex = rdflib.Namespace("http://example.org/")
+    terms = [ex[f"t{i}"] for i in range(5)] + [rdflib.Literal(1)]
+    store = rdflib.plugin.get(name, Store)()
+    graphs = [rdflib.Graph(store, identifier=ex[f"g{i}"]) for i in range(2)]
+    formula = QuotedGraph(store, ex.f)
+
+    def results(triples):
+        return sorted((t, sorted(str(c) for c in cs)) for t, cs in triples)
+
+    for step in range(100):
+        g = rnd.choice([*graphs, formula]) if step > 50 else graphs[0]
+        store.add(tuple(rnd.choice(terms) for _ in range(3)), g, quoted=g is formula)
+        pattern = [rnd.choice([*terms, None]) for _ in range(3)]
+        pattern[rnd.randrange(3)] = rnd.sample([*terms, ex.x], rnd.randrange(4))
+        for context in [None, *graphs, formula]:
+            assert results(store.triples_choices(tuple(pattern), context)) == results(
+                Store.triples_choices(store, tuple(pattern), context)
+            )
+
+
+@pytest.mark.parametrize("flush", ["lookup", "remove"])
+def test_addn_flushed_while_reading(flush):
+    ex = rdflib.Namespace("http://example.org/")
+    g = rdflib.Graph("Memory")
+    g.add((ex.a, ex.p, ex.b))
+    # the same subject and predicate objects, whose lookup addN shares
+    c, q = ex.c, ex.q
+
+    def quads():
+        yield (c, q, ex.b, g)
+        if flush == "lookup":
+            # looking up by object indexes the pending triples
+            assert len(list(g.triples((None, None, ex.b)))) == 2
+        else:
+            g.remove((ex.c, ex.q, ex.b))
+        yield (c, q, ex.d, g)
+        yield (ex.e, ex.q, ex.b, g)
+
+    with g.bulk_load():
+        g.addN(quads())
+    expected = {(ex.a, ex.p, ex.b), (ex.c, ex.q, ex.d), (ex.e, ex.q, ex.b)}
+    if flush == "lookup":
+        expected.add((ex.c, ex.q, ex.b))
+    assert set(g) == expected
+    assert set(g.triples((None, ex.q, None))) == expected - {(ex.a, ex.p, ex.b)}
+    assert set(g.triples((None, None, ex.d))) == {(ex.c, ex.q, ex.d)}
+    assert set(g.triples((ex.c, None, None))) == {t for t in expected if t[0] == ex.c}
+    assert g.store.predicate_statistics() == (len(expected), 3, 2)
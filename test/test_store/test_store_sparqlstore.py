@@ -4,6 +4,7 @@ import logging
 import re
 import socket
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO
 from threading import Thread
 from typing import Callable, ClassVar
 from unittest.mock import patch
@@ -525,3 +526,34 @@ class TestSPARQLMock:
 
         for _, uri in graph.namespaces():
             assert query.count(f"<{uri}>") == 1
+
+
+class ClosableResponse(BytesIO):
+    def __init__(self, body: bytes, content_type: str):
+        super().__init__(body)
+        self.headers = {"Content-Type": content_type}
+
+
+@pytest.mark.parametrize(
+    "query, body",
+    [
+        (
+            "SELECT ?x WHERE { ?x ?p ?o }",
+            b'{"head": {"vars": ["x"]}, "results": {"bindings": ['
+            b'{"x": {"type": "uri", "value": "http://example.org/a"}},'
+            b'{"x": {"type": "uri", "value": "http://example.org/b"}}]}}',
+        ),
+        ("ASK { ?x ?p ?o }", b'{"head": {}, "boolean": true}'),
+    ],
+)
+def test_streamed_response_closed(query: str, body: bytes) -> None:
+    response = ClosableResponse(body, "application/sparql-results+json")
+    connector = SPARQLConnector(query_endpoint="http://example.org/sparql")
+    with patch("rdflib.plugins.stores.sparqlconnector.urlopen", return_value=response):
+        result = connector.query(query)
+    if result.type == "SELECT":
+        rows = iter(result)
+        assert next(rows) == (URIRef("http://example.org/a"),)
+        assert not response.closed
+        assert len(list(rows)) == 1
+    assert response.closed
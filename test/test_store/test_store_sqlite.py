@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+import rdflib.plugins.stores.sqlite
+from rdflib import BNode, Dataset, Graph, Literal, URIRef, Variable
+from rdflib.graph import QuotedGraph
+from rdflib.namespace import XSD
+from rdflib.plugins.stores.memory import Memory
+from rdflib.plugins.stores.sqlite import SQLite
+from rdflib.store import NO_STORE, VALID_STORE
+
+EG = "http://example.org/"
+
+
+@pytest.fixture(params=[3, 1000], ids=["paged", "unpaged"])
+def batch_size(request, monkeypatch: pytest.MonkeyPatch) -> int:
+    monkeypatch.setattr(rdflib.plugins.stores.sqlite, "_BATCH_SIZE", request.param)
+    return request.param
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    return str(tmp_path / "store.sqlite")
+
+
+def test_registered():
+    assert isinstance(Graph("SQLite").store, SQLite)
+
+
+def test_open_missing(path: str):
+    assert SQLite().open(path) == NO_STORE
+    store = SQLite()
+    assert store.open(path, create=True) == VALID_STORE
+    store.close()
+
+
+def test_open_directory(tmp_path: Path):
+    g = Graph("SQLite")
+    g.open(str(tmp_path), create=True)
+    g.add((URIRef(f"{EG}a"), URIRef(f"{EG}b"), URIRef(f"{EG}c")))
+    g.close(commit_pending_transaction=True)
+    assert (tmp_path / "rdflib.sqlite").exists()
+    g.destroy(str(tmp_path))
+    assert not (tmp_path / "rdflib.sqlite").exists()
+
+
+def test_terms_round_trip(path: str):
+    terms = [
+        URIRef(f"{EG}a"),
+        BNode("b"),
+        Literal("x"),
+        Literal("x", lang="en"),
+        Literal("1", datatype=XSD.integer),
+        Literal("a\x1fb\nc"),
+        Literal(""),
+        Variable("v"),
+    ]
+    ds = Dataset("SQLite")
+    ds.open(path, create=True)
+    g = ds.graph(URIRef(f"{EG}g"))
+    for i, term in enumerate(terms):
+        g.add((URIRef(f"{EG}s{i}"), URIRef(f"{EG}p"), term))
+    ds.commit()
+    ds.close()
+
+    ds = Dataset("SQLite")
+    ds.open(path)
+    objects = list(ds.graph(URIRef(f"{EG}g")).objects())
+    assert sorted(objects) == sorted(terms)
+    assert [type(o) for o in sorted(objects)] == [type(t) for t in sorted(terms)]
+    ds.close()
+
+
+def test_language_case(path: str):
+    s, p = URIRef(f"{EG}s"), URIRef(f"{EG}p")
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    g.open(path, create=True)
+    g.add((s, p, Literal("a", lang="en")))
+    g.close(commit_pending_transaction=True)
+
+    # the term IDs are read from the database again
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    g.open(path)
+    assert (s, p, Literal("a", lang="EN")) in g
+    g.add((s, p, Literal("a", lang="EN")))
+    assert len(g) == 1
+    g.close()
+
+
+def test_commit_and_rollback(path: str):
+    s, p = URIRef(f"{EG}s"), URIRef(f"{EG}p")
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    g.open(path, create=True)
+    g.add((s, p, Literal(1)))
+    g.commit()
+    g.add((s, p, Literal(2)))
+    g.remove((s, p, Literal(1)))
+    assert set(g.objects()) == {Literal(2)}
+    g.rollback()
+    assert set(g.objects()) == {Literal(1)}
+    g.add((s, p, Literal(3)))
+    # not committed
+    g.close()
+
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    g.open(path)
+    assert set(g.objects()) == {Literal(1)}
+    g.add((s, p, Literal(3)))
+    g.close(commit_pending_transaction=True)
+
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g"))
+    g.open(path)
+    assert set(g.objects()) == {Literal(1), Literal(3)}
+    g.close()
+
+
+def test_shared_connection(path: str):
+    g1 = Graph("SQLite", identifier=URIRef(f"{EG}g1"))
+    g2 = Graph("SQLite", identifier=URIRef(f"{EG}g2"))
+    g1.open(path, create=True)
+    g2.open(path)
+    g1.add((URIRef(f"{EG}a"), URIRef(f"{EG}b"), Literal(1)))
+    g2.add((URIRef(f"{EG}a"), URIRef(f"{EG}b"), Literal(2)))
+    assert len(g1) == len(g2) == 1
+    assert len(g1.store) == 2
+    g1.close(commit_pending_transaction=True)
+    assert len(g2) == 1
+    g2.close()
+
+    g = Graph("SQLite", identifier=URIRef(f"{EG}g2"))
+    g.open(path)
+    assert len(g) == 1
+    g.close()
+
+
+def test_addn_and_len(batch_size: int, path: str):
+    ds = Dataset("SQLite")
+    ds.open(path, create=True)
+    g1 = ds.graph(URIRef(f"{EG}g1"))
+    g2 = ds.graph(URIRef(f"{EG}g2"))
+    p = URIRef(f"{EG}p")
+    ds.addN(
+        (URIRef(f"{EG}s{i}"), p, Literal(i), g)
+        for i in range(10)
+        for g in ((g1, g2) if i % 2 else (g1,))
+    )
+    assert len(g1) == 10
+    assert len(g2) == 5
+    assert len(ds.store) == 10
+    assert ds.store.predicate_statistics(p) == (10, 10, 10)
+    triples = list(ds.store.triples((None, p, None), None))
+    assert len(triples) == 10
+    for (s, _, o), contexts in triples:
+        assert set(contexts) == ({g1, g2} if int(o) % 2 else {g1})
+    ds.close()
+
+
+def test_triples_choices(batch_size: int, path: str):
+    g = Graph("SQLite")
+    g.open(path, create=True)
+    p, q = URIRef(f"{EG}p"), URIRef(f"{EG}q")
+    for i in range(10):
+        g.add((URIRef(f"{EG}s{i}"), p if i % 2 else q, Literal(i)))
+    assert len(list(g.triples_choices((None, [p, q], None)))) == 10
+    assert {
+        o for _, _, o in g.triples_choices(([URIRef(f"{EG}s1"), BNode()], None, None))
+    } == {Literal(1)}
+    assert list(g.triples_choices((None, [URIRef(f"{EG}x")], None))) == []
+    g.close()
+
+
+def test_quoted(path: str):
+    g = Graph("SQLite")
+    g.open(path, create=True)
+    formula = QuotedGraph(g.store, URIRef(f"{EG}f"))
+    triple = (URIRef(f"{EG}a"), URIRef(f"{EG}b"), URIRef(f"{EG}c"))
+    formula.add(triple)
+    assert len(formula) == 1
+    assert len(g) == 0
+    assert list(g.store.triples(triple, None)) == []
+    assert list(g.store.contexts(triple)) == []
+    assert formula in set(g.store.contexts())
+    g.close()
+
+
+def test_no_context():
+    store = SQLite()
+    store.open(":memory:")
+    g = Graph(store=store, identifier=URIRef(f"{EG}g"))
+    triple = (URIRef(f"{EG}a"), URIRef(f"{EG}b"), URIRef(f"{EG}c"))
+    store.add(triple, None)
+    store.add(triple, g)
+    assert len(store) == 1
+    assert [(t, list(cs)) for t, cs in store.triples(triple, None)] == [(triple, [g])]
+    store.remove(triple, g)
+    assert len(store) == 1
+    assert list(store.contexts(triple)) == []
+    store.remove(triple, None)
+    assert len(store) == 0
+    store.close()
+
+
+def test_namespaces(path: str):
+    store = SQLite()
+    store.open(path, create=True)
+    store.bind("eg", URIRef(EG))
+    store.bind("ex", URIRef(EG), override=False)
+    assert store.prefix(URIRef(EG)) == "eg"
+    store.bind("ex", URIRef(EG))
+    assert store.namespace("ex") == URIRef(EG)
+    assert store.namespace("eg") is None
+    assert list(store.namespaces()) == [("ex", URIRef(EG))]
+    store.close()
+
+
+def _triples(store, pattern, context):
+    return sorted(
+        (triple, sorted(str(c.identifier) for c in contexts))
+        for triple, contexts in store.triples(pattern, context)
+    )
+
+
+def _contexts(contexts):
+    return sorted(str(c.identifier) for c in contexts)
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_same_as_memory(batch_size: int, seed: int):
+    """
+    Random adds and removes in several contexts, one of them quoted, give the same triples, counts, contexts and lengths as the Memory store.
+    """
+    rnd = random.Random(seed)
+    terms = [URIRef(f"{EG}t{i}") for i in range(5)] + [
+        Literal(1),
+        Literal("1"),
+        BNode("b"),
+    ]
+    sqlite = SQLite()
+    sqlite.open(":memory:")
+    stores = Memory(), sqlite
+    graphs = [
+        {i: Graph(store=store, identifier=URIRef(f"{EG}g{i}")) for i in range(3)}
+        for store in stores
+    ]
+
+    def pattern():
+        return tuple(rnd.choice(terms + [None, None]) for _ in range(3))
+
+    for _ in range(500):
+        i = rnd.choice([None, 0, 1, 2])
+        r = rnd.random()
+        if r < 0.55:
+            # the Memory store keeps no default graph for statements added
+            # without a context to remove them from, and the statements of
+            # the last context are quoted
+            i = rnd.choice([0, 1, 2])
+            triple = tuple(rnd.choice(terms) for _ in range(3))
+            for store, g in zip(stores, graphs):
+                store.add(triple, g[i], quoted=i == 2)
+        elif r < 0.7:
+            p = pattern()
+            for store, g in zip(stores, graphs):
+                store.remove(p, g.get(i))
+
+        p = pattern()
+        triple = tuple(rnd.choice(terms) for _ in range(3))
+        memory, sql = (
+            (
+                _triples(store, p, g.get(i)),
+                store.count(p, g.get(i)),
+                len(store) if i is None else store.__len__(g[i]),
+                _contexts(store.contexts(triple)),
+            )
+            for store, g in zip(stores, graphs)
+        )
+        assert memory == sql
+    sqlite.close()
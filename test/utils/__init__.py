@@ -387,6 +387,7 @@ class GraphHelper:
                 continue
             if object.datatype in datatypes:
                 object._datatype = None
+                object._hash = None
 
     @classmethod
     def non_default_graph_names(